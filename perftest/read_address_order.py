@@ -0,0 +1,60 @@
+'''
+Benchmark of reading all records of a file in catalog (alphabetical) order compared to
+reading them in the order of their file addresses, with a cold page cache for each run.
+
+The records are written in random order so catalog order jumps around the file. The page
+cache is dropped for the file with posix_fadvise, so this runs on Linux without root.
+
+On a local SSD the two are the same within noise (500 records, 182 MB: 1.06s/1.20s and 1.33s/1.13s
+catalog/address order in two runs), as reads there cost about the same wherever they are in the
+file. Address order is for storage where seeks are what cost,
+e.g. spinning disks or network file systems, which is why it is opt-in.
+'''
+import datetime
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pyhecdss
+from pyhecdss import pyhecdss as module
+
+
+def write_large_file(fname, nrecords=1000, nyears=5):
+    index = pd.date_range('01JAN2000', periods=nyears * 365 * 24, freq='h')
+    values = np.random.default_rng(0).normal(size=(len(index)))
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        for i in np.random.default_rng(1).permutation(nrecords):
+            d.write_rts('/STUDY/LOC%05d/FLOW//1HOUR/BENCH/' % i, pd.DataFrame(values + i, index=index),
+                        'CFS', 'INST-VAL')
+
+
+def drop_page_cache(fname):
+    fd = os.open(fname, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def read_all(fname, requests, batch):
+    drop_page_cache(fname)
+    s = datetime.datetime.now()
+    with pyhecdss.DSSFile(fname) as d:
+        n = sum(len(r.data) for r in module._read_in_address_order(d, requests, batch))
+    return datetime.datetime.now() - s, n
+
+
+if __name__ == '__main__':
+    fname = 'large_address_order.dss'
+    nrecords = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    if not os.path.exists(fname):
+        write_large_file(fname, nrecords)
+    print('file size: %d MB' % (os.path.getsize(fname) // 2**20))
+    with pyhecdss.DSSFile(fname) as d:
+        requests = [(p, None, None) for p in d.get_pathnames()]
+    # a batch of 1 reads in the order requested
+    elapsed, n = read_all(fname, requests, 1)
+    print('catalog order: %d records, %d values in' % (len(requests), n), elapsed)
+    elapsed, n = read_all(fname, requests, module._ADDRESS_ORDER_BATCH)
+    print('address order: %d records, %d values in' % (len(requests), n), elapsed)
@@ -0,0 +1,64 @@
+'''
+Benchmark of reading a condensed catalog (.dsd) of 100k lines
+compared to the line by line parser it replaced
+'''
+import datetime
+import numpy as np
+import pandas as pd
+import pyhecdss
+
+HEADER = '''
+     HECDSS Condensed Catalog of Record Pathnames in File large.dss
+
+     Catalog Created on Oct 19, 2026 at 18:50    File Created on Aug 27, 2019
+     Number of Records: 100000                   DSS Version 6-WE,  File 6-VE
+     Sort Order: ABCFED
+
+ Tag      A Part        B Part        C Part    F Part          E Part   D Part
+
+'''
+
+
+def write_large_dsd(fname, nlines=100000):
+    with open(fname, 'w') as fh:
+        fh.write(HEADER)
+        for i in range(nlines):
+            a = 'STUDY%d' % (i // 10000) if i % 10000 == 0 else '- - -'
+            b = 'RSAC%06d' % (i // 10) if i % 10 == 0 else '- - -'
+            c = ['EC', 'STAGE', 'FLOW', 'VEL', 'TEMP'][i % 5]
+            fh.write(' T%-7d %-13s %-13s %-9s %-15s %-8s 01JAN1990 - 01DEC2019\n' %
+                     (i, a, b, c, 'DSM2-HIST', '15MIN'))
+
+
+def read_catalog_dsd_loop(fdname):
+    with open(fdname, "r") as fd:
+        lines = fd.readlines()
+    columns = ["Tag", "A Part", "B Part", "C Part", "F Part", "E Part", "D Part"]
+    colline = lines[7]
+    column_indices = [colline.find(c) for c in columns]
+    a = np.empty([len(columns), len(lines) - 9], dtype="U132")
+    for ilx, line in enumerate(lines[9:]):
+        isx = column_indices[0]
+        for cix, iex in enumerate(column_indices[1:]):
+            s = line[isx:iex].strip()
+            if s.startswith("-"):
+                s = a[cix, ilx - 1]
+            a[cix, ilx] = s
+            isx = iex
+        a[len(columns) - 1, ilx] = line[isx:].strip()
+    return pd.DataFrame(a.transpose(), columns=list("TABCFED"))
+
+
+if __name__ == '__main__':
+    fname = 'large.dsd'
+    write_large_dsd(fname)
+    s = datetime.datetime.now()
+    df1 = read_catalog_dsd_loop(fname)
+    print('line by line parse in :', datetime.datetime.now() - s,
+          ' memory: %d bytes' % df1.memory_usage(deep=True).sum())
+    s = datetime.datetime.now()
+    df2 = pyhecdss.DSSFile._read_catalog_dsd(fname)
+    print('vectorized parse in :', datetime.datetime.now() - s,
+          ' memory: %d bytes' % df2.memory_usage(deep=True).sum())
+    # the catalog also has the parsed D_START and D_END dates
+    pd.testing.assert_frame_equal(df1, df2[list("TABCFED")].astype(str), check_dtype=False)
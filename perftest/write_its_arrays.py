@@ -0,0 +1,64 @@
+'''
+Benchmark of writing a large irregular time series (event log) with write_its_arrays compared to the
+pandas conversion of the times it replaced, i.e. (df.index - base).total_seconds() / 60, both for the
+conversion alone and for the whole write
+'''
+import datetime
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pyhecdss
+from pyhecdss import pyheclib
+from pyhecdss import pyhecdss as module
+
+
+def event_log(n):
+    steps = np.random.default_rng(0).integers(1, 30, n)
+    times = np.datetime64('2000-01-01T00:00') + np.cumsum(steps).astype('timedelta64[m]')
+    return times, np.random.default_rng(1).normal(size=n)
+
+
+def timed(write):
+    s = datetime.datetime.now()
+    result = write()
+    return datetime.datetime.now() - s, result
+
+
+def pandas_minutes(index, startDateStr):
+    # the conversion write_its used before write_its_arrays
+    itimes = index - module._parse_date(startDateStr)
+    itimes = itimes.total_seconds() / 60
+    return itimes.values.astype('i')
+
+
+def write_its_pandas(d, pathname, df, cunits, ctype):
+    # write_its before write_its_arrays, for a pathname with the time window as D part
+    startDateStr = pathname.split('/')[4].split('-')[0].strip()
+    juls = module._julian_day(module._parse_date(startDateStr))
+    itimes = pandas_minutes(df.index, startDateStr)
+    values = df.iloc[:, 0].values
+    return pyheclib.hec_zsitsxd(d.ifltab, pathname, itimes, values, juls, cunits, ctype, 1)
+
+
+if __name__ == '__main__':
+    fname = 'write_its_arrays.dss'
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    times, values = event_log(n)
+    df = pd.DataFrame(values, index=pd.DatetimeIndex(times))
+    startDateStr, endDateStr = module._its_base_window(times[0], times[-1])
+    juls = module._julian_day(module._parse_date(startDateStr))
+    t_pandas, pandas_itimes = timed(lambda: pandas_minutes(df.index, startDateStr))
+    t_arrays, arrays_itimes = timed(lambda: module._datetime64_to_julian_minutes(times, juls))
+    assert np.array_equal(pandas_itimes, arrays_itimes)
+    print('%d times converted: pandas %s, arrays %s' % (n, t_pandas, t_arrays))
+    window = startDateStr + ' - ' + endDateStr
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        t_pandas, _ = timed(lambda: write_its_pandas(d, '/BENCH/EVENTS/FLOW/%s/IR-YEAR/PANDAS/' % window, df,
+                                                     'CFS', 'INST-VAL'))
+        t_arrays, _ = timed(lambda: d.write_its_arrays('/BENCH/EVENTS/FLOW/%s/IR-YEAR/ARRAYS/' % window, times,
+                                                       values, 'CFS', 'INST-VAL'))
+    print('%d values written: pandas %s, write_its_arrays %s' % (n, t_pandas, t_arrays))
+    for ext in ('.dss', '.dsc', '.dsd'):
+        if os.path.exists('write_its_arrays' + ext):
+            os.remove('write_its_arrays' + ext)
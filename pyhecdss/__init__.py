@@ -8,14 +8,19 @@ __version__ = _version.get_versions()["version"]
 from .pyhecdss import (
     DATE_FMT_STR,
     DSSData,
+    DSSPath,
     DSSFile,
     get_matching_ts,
     get_start_end_dates,
     get_ts,
     get_version,
+    match_catalog,
     monthrange,
     set_message_level,
     set_program_name,
 )
+from .collection import DSSCollection
+from .importer import import_columnar
+from .index import DSSIndex
 
 set_message_level(0)
@@ -0,0 +1,148 @@
+"""
+A virtual catalog over many DSS files, e.g. a directory of scenario runs
+
+    >>> with DSSCollection('runs/*.dss') as c:
+    ...     for filename, (df, units, ptype) in c.get_matching_ts('//RSAC075/EC////'):
+    ...         ...
+"""
+import glob
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from .pyhecdss import (
+    DSSFile,
+    _concat_catalogs,
+    _part_values,
+    _read_ts,
+    get_start_end_dates,
+    match_catalog,
+)
+
+
+def _read_file_catalog(filename):
+    """
+    reads the catalog of a single file, run in a worker process
+    """
+    with DSSFile(filename) as dssh:
+        return dssh.read_catalog()
+
+
+class DSSCollection:
+    """
+    Collection of DSS files with a merged catalog. The catalogs of the files are built in parallel
+    worker processes and merged into one data frame with an additional "FILE" column.
+
+    Reads are routed to a handle for the file containing the record. Handles are opened on first
+    use and kept open until the collection is closed.
+
+    The catalog worker processes are spawned, which re-imports the __main__ module, so scripts
+    building catalogs with more than one worker need an if __name__ == "__main__": guard.
+    """
+
+    def __init__(self, files, max_workers=None):
+        """
+        Args:
+            files (str or list): a glob pattern or a list of DSS filenames
+            max_workers (int, optional): number of processes to build catalogs with.
+                Defaults to the number of processors. If 1 catalogs are built in this process.
+        """
+        if isinstance(files, str):
+            files = sorted(glob.glob(files))
+        self.files = list(files)
+        self.max_workers = max_workers
+        self._handles = {}
+        self._catalog = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        closes all open file handles
+        """
+        for dssh in self._handles.values():
+            dssh.close()
+        self._handles.clear()
+
+    def get_handle(self, filename):
+        """
+        returns the open DSSFile for filename, opening it on first use
+        """
+        dssh = self._handles.get(filename)
+        if dssh is None:
+            dssh = self._handles[filename] = DSSFile(filename)
+        return dssh
+
+    def read_catalog(self, refresh=False):
+        """
+        Reads the catalog of every file and returns them merged with a "FILE" column.
+        The merged catalog is kept and reused unless refresh is True
+        """
+        if self._catalog is not None and not refresh:
+            return self._catalog
+        if self.max_workers == 1 or len(self.files) <= 1:
+            catalogs = [_read_file_catalog(f) for f in self.files]
+        else:
+            # heclib keeps catalog state in process globals, so a forked child sees a catalog the
+            # parent has generated as in use and can't generate its own. Handles survive a fork
+            # (see DSSFile._is_inherited) but catalogs need fresh processes
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                catalogs = list(executor.map(_read_file_catalog, self.files))
+        frames = []
+        for filename, dfcat in zip(self.files, catalogs):
+            if dfcat is None:
+                continue
+            frames.append(dfcat.assign(FILE=filename))
+        if len(frames) == 0:
+            self._catalog = pd.DataFrame(columns=list("TABCFED") + ["FILE"])
+        else:
+            catalog = _concat_catalogs(frames)
+            catalog["FILE"] = catalog["FILE"].astype("category")
+            self._catalog = catalog
+        return self._catalog
+
+    def get_pathnames(self, catalog_dataframe=None):
+        """
+        converts a merged catalog data frame into a list of (filename, pathname)
+
+        If catalog_dataframe is None then reads the catalog to populate it
+        """
+        if catalog_dataframe is None:
+            catalog_dataframe = self.read_catalog()
+        parts = [_part_values(catalog_dataframe[c]) for c in "ABCDEF"]
+        pathnames = ["/" + "/".join(p) + "/" for p in zip(*parts)]
+        return list(zip(_part_values(catalog_dataframe["FILE"]), pathnames))
+
+    def find(self, pathname):
+        """
+        returns the rows of the merged catalog matching pathname. Each part of pathname /A/B/C/D/E/F/
+        is either blank to match all or a regular expression, as for get_matching_ts
+        """
+        return match_catalog(self.read_catalog(), pathname)
+
+    def get_matching_ts(self, pathname):
+        """
+        Reads all records in all files matching pathname. A non blank D part is used as the time window
+
+        Returns:
+            a generator of (filename, DSSData) tuples
+        """
+        pathname = pathname.upper()
+        plist = self.get_pathnames(self.find(pathname))
+        twstr = str.strip(pathname.split("/")[4])
+        startDateStr = endDateStr = None
+        if len(twstr) > 0:
+            try:
+                startDateStr, endDateStr = get_start_end_dates(twstr)
+            except:
+                startDateStr, endDateStr = None, None
+        if len(plist) == 0:
+            raise Exception(f"No pathname found in {len(self.files)} files for {pathname}")
+        for filename, p in plist:
+            yield filename, _read_ts(self.get_handle(filename), p, startDateStr, endDateStr)
@@ -0,0 +1,130 @@
+"""
+Dask integration for reading many records from many DSS files in parallel
+
+DSSFile handles are not passed between processes. Instead each worker opens its own handle
+for a file the first time it needs it and reuses it for later tasks.
+
+    >>> ddf = read_catalog_as_dask(glob.glob('*.dss'), '///EC////')
+    >>> ddf.compute(scheduler='processes')
+"""
+import atexit
+import glob
+import os
+import threading
+import pandas as pd
+import dask
+import dask.dataframe as dd
+from .pyhecdss import DSSFile, _read_in_order, get_start_end_dates
+
+# per process cache of open handles keyed by (process id, filename)
+_handles = {}
+# heclib is not thread safe so all reads within a process are serialized
+_lock = threading.Lock()
+
+
+def _get_handle(filename):
+    """
+    returns an open DSSFile for this process, opening it on first use
+    """
+    key = (os.getpid(), os.path.abspath(filename))
+    dssh = _handles.get(key)
+    if dssh is None:
+        dssh = _handles[key] = DSSFile(filename)
+    return dssh
+
+
+@atexit.register
+def _close_handles():
+    pid = os.getpid()
+    for (hpid, _), dssh in list(_handles.items()):
+        if hpid == pid:
+            dssh.close()
+    _handles.clear()
+
+
+def _empty_frame():
+    return pd.DataFrame(
+        {
+            "pathname": pd.Series([], dtype=str),
+            "time": pd.Series([], dtype="datetime64[ns]"),
+            "value": pd.Series([], dtype="d"),
+            "units": pd.Series([], dtype=str),
+            "period_type": pd.Series([], dtype=str),
+        }
+    )
+
+
+def _read_partition(
+    filename, pathnames, startDateStr=None, endDateStr=None, address_order=False
+):
+    """
+    reads pathnames from filename into a long format data frame of
+    pathname, time, value, units and period_type
+    """
+    frames = [_empty_frame()]
+    with _lock:
+        dssh = _get_handle(filename)
+        requests = [(p, startDateStr, endDateStr) for p in pathnames]
+        for p, (df, units, ptype) in zip(
+            pathnames, _read_in_order(dssh, requests, address_order)
+        ):
+            index = df.index
+            if isinstance(index, pd.PeriodIndex):
+                index = index.to_timestamp()
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "pathname": p,
+                        "time": index.values.astype("datetime64[ns]"),
+                        "value": df.iloc[:, 0].values,
+                        "units": units,
+                        "period_type": ptype,
+                    }
+                )
+            )
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_catalog_as_dask(
+    files, pattern="///////", records_per_partition=50, address_order=False
+):
+    """
+    Reads the records matching pattern from all the files as a dask DataFrame
+
+    Args:
+        files (str or list): a glob pattern or a list of DSS filenames
+        pattern (str, optional): pathname /A/B/C/D/E/F/ where each part is a regular expression or blank
+            to match all, as for get_matching_ts. A D part is used as the time window. Defaults to all records.
+        records_per_partition (int, optional): maximum number of records in a partition. Defaults to 50.
+        address_order (bool, optional): read the records of a partition in the order of their file addresses.
+            Defaults to False.
+
+    Returns:
+        dask.dataframe.DataFrame: long format frame with columns pathname, time, value, units and period_type.
+        There is one partition per group of records with the same E part in a file.
+    """
+    if isinstance(files, str):
+        files = sorted(glob.glob(files))
+    twstr = pattern.split("/")[4].strip()
+    startDateStr = endDateStr = None
+    if len(twstr) > 0:
+        startDateStr, endDateStr = get_start_end_dates(twstr)
+    parts = []
+    for filename in files:
+        with DSSFile(filename) as dssh:
+            dfcat = dssh.read_catalog(pattern)
+            for epart, dfg in dfcat.groupby("E", sort=True):
+                plist = dssh.get_pathnames(dfg)
+                for i in range(0, len(plist), records_per_partition):
+                    parts.append(
+                        dask.delayed(_read_partition)(
+                            filename,
+                            plist[i : i + records_per_partition],
+                            startDateStr,
+                            endDateStr,
+                            address_order,
+                        )
+                    )
+    if len(parts) == 0:
+        return dd.from_pandas(_empty_frame(), npartitions=1)
+    return dd.from_delayed(parts, meta=_empty_frame())
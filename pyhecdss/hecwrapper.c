@@ -1,3 +1,4 @@
+#include <string.h>
 #include "hecwrapper.h"
 // julian days since 31DEC1899 2400
 void hec_datjul(char *cdate,  slen_t _cdate_len, int *jul, int *ierr){
@@ -118,3 +119,63 @@ void hec_zritsxd(int *ifltab,
     inflag, istat, _cpath_len, _cunits_len, _ctype_len);
 
 }
+
+// information block of the record last checked by zcheck (common block ZDSSIZ)
+//
+// heclib 6 has no exported routine returning the file address of a record (zgetad converts an address
+// to a record and word, zrinfo and ztsinfo return the record's size, type and times but not its
+// address), so the address is read from this block. Its layout is internal to heclib 6 and not
+// declared in heclib.h. It was worked out by writing records with known pathname lengths, file
+// positions and numbers of values, then reading the words back:
+//   zdssiz_[3]                   pathname length in characters
+//   zdssiz_[4 .. 4 + nppwrd - 1] pathname, 4 characters a word
+//   zdssiz_[4 + nppwrd]          file address (words) of the data
+// The pathname is compared with the one asked for so that a different layout gives -1 (reads then
+// stay in catalog order) rather than wrong addresses. tests/test_address_order.py checks the addresses
+extern int zdssiz_[];
+
+// return the file address (words) of the data of the record, -1 if it does not exist or is not known
+int hec_zdataddress(int *ifltab, char *cpath, slen_t _cpath_len){
+  int npath = _cpath_len;
+  int nhead = 0;
+  int ndata = 0;
+  int lfound = 0;
+  int nppwrd;
+  zcheck_(ifltab, cpath, &npath, &nhead, &ndata, &lfound, _cpath_len);
+  if (!lfound || zdssiz_[3] != npath || memcmp(&zdssiz_[4], cpath, npath) != 0){
+    return -1;
+  }
+  // the information block has 4 words, the pathname (4 characters a word) and then the data address
+  nppwrd = (npath - 1) / 4 + 1;
+  return zdssiz_[4 + nppwrd];
+}
+
+// return the number of values in the record, -1 if it does not exist
+int hec_znvals(int *ifltab, char *cpath, slen_t _cpath_len){
+  int lfound = 0;
+  int idtype, ldoub, lqual, iprecis, ivers, ndata, nspace, icompres, lpass;
+  char cdtype[4], crtag[8], clwdate[9], clwtime[8], cpname[8];
+  zrinfo_(ifltab, cpath, &lfound, &idtype, cdtype, &ldoub, &lqual, &iprecis, crtag, clwdate, clwtime,
+    cpname, &ivers, &ndata, &nspace, &icompres, &lpass, _cpath_len, sizeof(cdtype), sizeof(crtag),
+    sizeof(clwdate), sizeof(clwtime), sizeof(cpname));
+  return lfound ? ndata : -1;
+}
+
+// set lfound to 1 (0) for each record that exists (does not), cpaths is the pathnames separated by newlines
+void hec_zcheckn(int *ifltab, char *cpaths, slen_t _cpaths_len, int *lfound, int nfound){
+  int i = 0;
+  int npath, nhead, ndata;
+  slen_t start = 0, end;
+  for (end = 0; end <= _cpaths_len && i < nfound; end++){
+    if (end < _cpaths_len && cpaths[end] != '\n'){
+      continue;
+    }
+    npath = end - start;
+    lfound[i] = 0;
+    if (npath > 0){
+      zcheck_(ifltab, cpaths + start, &npath, &nhead, &ndata, &lfound[i], npath);
+    }
+    i++;
+    start = end + 1;
+  }
+}
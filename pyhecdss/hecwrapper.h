@@ -59,5 +59,11 @@ void hec_zritsxd(int *ifltab,
    char *ctype,
    int *inflag,
    int *istat);
+// file address (words) of the data of a record, -1 if the record does not exist
+int hec_zdataddress(int *ifltab, char *cpath, slen_t _cpath_len);
+// number of values in a record (block), -1 if the record does not exist
+int hec_znvals(int *ifltab, char *cpath, slen_t _cpath_len);
+// check which records exist, cpaths is the pathnames separated by newlines
+void hec_zcheckn(int *ifltab, char *cpaths, slen_t _cpaths_len, int *lfound, int nfound);
 
 #endif
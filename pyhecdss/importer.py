@@ -0,0 +1,235 @@
+"""
+Bulk import of columnar files (CSV, Parquet, NPZ) into a DSS file.
+
+Two layouts are understood:
+
+    wide: a time column followed by one column per pathname
+    long: three columns of pathname, time and value
+
+Files are read in chunks so that large inputs never have to be in memory as a whole.
+Each chunk is written with the regular (write_rts) or irregular (write_its) write path
+depending on the E part of the pathname or, if that is blank, the frequency inferred
+from the first values seen for that pathname.
+"""
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+from .pyhecdss import DSSFile
+
+# minimum number of values needed to infer a regular frequency
+_MIN_VALUES_TO_INFER = 3
+
+
+def _read_csv_chunks(filename, chunksize):
+    for chunk in pd.read_csv(filename, chunksize=chunksize):
+        yield chunk
+
+
+def _read_parquet_chunks(filename, chunksize):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading parquet files requires pyarrow to be installed")
+    pf = pq.ParquetFile(filename)
+    for batch in pf.iter_batches(batch_size=chunksize):
+        yield batch.to_pandas()
+
+
+def _npy_member(npz, name):
+    """
+    (open stream positioned at the data, dtype, length) of the 1-d array name.npy in the open npz zip
+    """
+    stream = npz.open(name)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject or len(shape) != 1:
+        raise ValueError("%s in npz file should be a 1-d array without objects" % name)
+    return stream, dtype, shape[0]
+
+
+def _read_npz_chunks(filename, chunksize):
+    # the arrays (zip members) are read a chunk at a time from the (decompressed) member streams, as
+    # np.load reads an npz member whole and can't memory map it
+    with zipfile.ZipFile(filename) as npz:
+        members = {
+            name[: -len(".npy")]: _npy_member(npz, name)
+            for name in npz.namelist()
+            if name.endswith(".npy")
+        }
+        n = min((length for _, _, length in members.values()), default=0)
+        for i in range(0, n, chunksize):
+            m = min(chunksize, n - i)
+            yield pd.DataFrame(
+                {
+                    k: np.frombuffer(stream.read(m * dtype.itemsize), dtype=dtype)
+                    for k, (stream, dtype, _) in members.items()
+                }
+            )
+
+
+_CHUNK_READERS = {
+    ".csv": _read_csv_chunks,
+    ".parquet": _read_parquet_chunks,
+    ".pq": _read_parquet_chunks,
+    ".npz": _read_npz_chunks,
+}
+
+
+def _series_from_chunk(chunk, layout, time_column, pathname_column, value_column):
+    """
+    yields (pathname, pandas.Series) for each pathname found in the chunk
+    """
+    if layout == "wide":
+        tcol = time_column if time_column is not None else chunk.columns[0]
+        index = pd.DatetimeIndex(pd.to_datetime(chunk[tcol]))
+        for c in chunk.columns:
+            if c == tcol:
+                continue
+            yield str(c), pd.Series(chunk[c].values.astype("d"), index=index)
+    elif layout == "long":
+        tcol = time_column if time_column is not None else "time"
+        for pathname, g in chunk.groupby(pathname_column, sort=False):
+            index = pd.DatetimeIndex(pd.to_datetime(g[tcol]))
+            yield str(pathname), pd.Series(g[value_column].values.astype("d"), index=index)
+    else:
+        raise ValueError("layout should be one of 'wide' or 'long' not: " + layout)
+
+
+def _classify(pathname, series):
+    """
+    returns the pandas offset for regular time series, None for irregular
+    and False if undecided (not enough values yet)
+    """
+    epart = pathname.upper().split("/")[5]
+    if epart.startswith("IR-"):
+        return None
+    if epart:
+        return DSSFile.get_freq_from_epart(epart)
+    if len(series) < _MIN_VALUES_TO_INFER:
+        return False
+    freq = pd.infer_freq(series.index)
+    if freq is not None:
+        return pd.tseries.frequencies.to_offset(freq)
+    # a regular series with missing values is spaced at multiples of its most common step
+    step = _common_step(series.index.values.astype("datetime64[ns]").astype(np.int64))
+    if step is not None:
+        step = pd.Timedelta(int(step), "ns")
+        if step % pd.Timedelta(days=1) == pd.Timedelta(0):
+            return pd.offsets.Day(step.days)
+        return pd.tseries.frequencies.to_offset(step)
+    # or for monthly (yearly) values at the start of months
+    months = series.index.values.astype("datetime64[M]")
+    if np.all(months == series.index.values):
+        step = _common_step(months.astype(np.int64))
+        if step is not None:
+            return pd.offsets.YearBegin(step // 12) if step % 12 == 0 else pd.offsets.MonthBegin(step)
+    return None
+
+
+def _common_step(values):
+    """
+    the most common difference between the increasing values if all differences are multiples of it,
+    otherwise None
+    """
+    diffs = np.diff(values)
+    steps, counts = np.unique(diffs, return_counts=True)
+    step = steps[counts.argmax()]
+    if step <= 0 or np.any(diffs % step):
+        return None
+    return step
+
+
+def _write_piece(dssh, pathname, series, freq, cunits, ctype, interval):
+    if freq is None:
+        series = series.dropna()
+        if len(series) == 0:
+            return pathname
+        epart = pathname.upper().split("/")[5]
+        dssh.write_its(pathname, series, cunits, ctype, interval=epart or interval)
+        parts = pathname.upper().split("/")
+        parts[5] = epart or interval
+    else:
+        index = pd.date_range(series.index[0], series.index[-1], freq=freq)
+        series = series.reindex(index).fillna(DSSFile.MISSING_VALUE)
+        dssh.write_rts(pathname, series, cunits, ctype)
+        parts = pathname.upper().split("/")
+        parts[5] = DSSFile.get_epart_from_freq(index.freq)
+    parts[4] = ""
+    return "/".join(parts)
+
+
+def import_columnar(
+    dssfilename,
+    filename,
+    layout="wide",
+    time_column=None,
+    pathname_column="pathname",
+    value_column="value",
+    cunits="",
+    ctype="INST-VAL",
+    interval="IR-YEAR",
+    chunksize=100000,
+):
+    """
+    Imports a CSV, Parquet or NPZ file of time series into a DSS file, chunk by chunk
+
+    Args:
+        dssfilename (str): path to DSS file, created if it doesn't exist
+        filename (str): path to a .csv, .parquet (or .pq) or .npz file
+        layout (str, optional): 'wide' with one column per pathname or 'long' with pathname, time and value columns. Defaults to "wide".
+        time_column (str, optional): name of time column. Defaults to first column for 'wide' and 'time' for 'long'
+        pathname_column (str, optional): name of pathname column for 'long' layout. Defaults to "pathname".
+        value_column (str, optional): name of value column for 'long' layout. Defaults to "value".
+        cunits (str, optional): units to store with the data. Defaults to "".
+        ctype (str, optional): period type to store with the data. Defaults to "INST-VAL".
+        interval (str, optional): block size used for irregular data when the E part is blank. Defaults to "IR-YEAR".
+        chunksize (int, optional): number of rows to read at a time. Defaults to 100000.
+
+    Returns:
+        list: pathnames (with blank D part) written to the DSS file
+
+    Notes:
+        Rows for the same pathname are expected to be sorted by time so that successive chunks do
+        not overlap. A blank E part is inferred with get_epart_from_freq for regular data and
+        for irregular data the interval argument is used.
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in _CHUNK_READERS:
+        raise ValueError(
+            "Unknown file type: %s. Expected one of %s" % (ext, list(_CHUNK_READERS))
+        )
+    freqs = {}
+    pending = {}
+    written = set()
+    with DSSFile(dssfilename, create_new=True) as dssh:
+        for chunk in _CHUNK_READERS[ext](filename, chunksize):
+            for pathname, series in _series_from_chunk(
+                chunk, layout, time_column, pathname_column, value_column
+            ):
+                if pathname in pending:
+                    series = pd.concat([pending.pop(pathname), series])
+                series = series[~series.index.duplicated(keep="last")].sort_index()
+                if pathname not in freqs:
+                    freq = _classify(pathname, series)
+                    if freq is False:
+                        pending[pathname] = series
+                        continue
+                    freqs[pathname] = freq
+                written.add(
+                    _write_piece(
+                        dssh, pathname, series, freqs[pathname], cunits, ctype, interval
+                    )
+                )
+        # whatever is left was too short to infer a frequency
+        for pathname, series in pending.items():
+            freq = _classify(pathname, series)
+            if freq is False:
+                freq = None
+            written.add(
+                _write_piece(dssh, pathname, series, freq, cunits, ctype, interval)
+            )
+    return sorted(written)
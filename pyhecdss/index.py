@@ -0,0 +1,198 @@
+"""
+A persistent (SQLite) index of pathnames across many DSS files
+
+The index has one row per catalog record (file, A-F parts, D range, E part and record type) and
+is refreshed incrementally: only files whose size or modification time changed are cataloged again.
+
+    >>> with DSSIndex('archive.sqlite') as index:
+    ...     index.update(glob.glob('archive/**/*.dss', recursive=True))
+    ...     index.find('/*/RSAC075/EC/*/')
+"""
+import os
+import re
+import sqlite3
+import functools
+import numpy as np
+import pandas as pd
+from .pyhecdss import DSSFile
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    FILE TEXT PRIMARY KEY,
+    SIZE INTEGER,
+    MTIME INTEGER
+);
+CREATE TABLE IF NOT EXISTS records (
+    FILE TEXT,
+    T TEXT,
+    A TEXT,
+    B TEXT,
+    C TEXT,
+    F TEXT,
+    E TEXT,
+    D TEXT,
+    D_START TEXT,
+    D_END TEXT,
+    TYPE TEXT
+);
+CREATE INDEX IF NOT EXISTS records_file ON records (FILE);
+CREATE INDEX IF NOT EXISTS records_b ON records (B);
+CREATE INDEX IF NOT EXISTS records_c ON records (C);
+"""
+
+_COLUMNS = ["T", "A", "B", "C", "F", "E", "D", "FILE", "D_START", "D_END", "TYPE"]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern):
+    return re.compile(pattern)
+
+
+def _regexp(pattern, value):
+    return value is not None and _compile(pattern).match(value) is not None
+
+
+def _where_clause(pathname):
+    """
+    builds a where clause and its parameters for the A, B, C, E and F parts of pathname
+
+    Blank or "*" parts match all. Parts without regular expression characters are matched as prefixes
+    with GLOB (which can use the table indices) and the rest with REGEXP, i.e. the same matching
+    as get_matching_ts
+    """
+    pp = pathname.upper().split("/")
+    clauses, params = [], []
+    for p, n in zip(pp[1:4] + pp[5:7], ["A", "B", "C", "E", "F"]):
+        if p in ("", "*", ".*"):
+            continue
+        if re.escape(p) == p:
+            clauses.append("%s GLOB ?" % n)
+            params.append(p + "*")
+        else:
+            clauses.append("%s REGEXP ?" % n)
+            params.append(p)
+    return clauses, params
+
+
+class DSSIndex:
+    """
+    SQLite backed index of the catalogs of many DSS files
+    """
+
+    def __init__(self, dbfile):
+        """
+        Args:
+            dbfile (str): path to SQLite database file, created if it doesn't exist
+        """
+        self.dbfile = dbfile
+        self.conn = sqlite3.connect(dbfile)
+        self.conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _is_current(self, filename, stat):
+        row = self.conn.execute(
+            "SELECT SIZE, MTIME FROM files WHERE FILE = ?", (filename,)
+        ).fetchone()
+        return row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns
+
+    def _remove(self, filename):
+        self.conn.execute("DELETE FROM records WHERE FILE = ?", (filename,))
+        self.conn.execute("DELETE FROM files WHERE FILE = ?", (filename,))
+
+    def _add(self, filename, stat):
+        with DSSFile(filename) as dssh:
+            dfcat = dssh.read_catalog()
+        if dfcat is not None and len(dfcat) > 0:
+            # the time window as parsed by the catalog, stored as ISO dates so that they sort as text
+            dstart = np.datetime_as_string(dfcat["D_START"].values, unit="D")
+            dend = np.datetime_as_string(dfcat["D_END"].values, unit="D")
+            dfcat = dfcat[list("TABCFED")].astype(str)
+            rtype = dfcat["E"].str.startswith("IR-").map({True: "ITS", False: "RTS"})
+            rows = zip(
+                [filename] * len(dfcat),
+                *[dfcat[c] for c in "TABCFED"],
+                dstart.tolist(),
+                dend.tolist(),
+                rtype,
+            )
+            self.conn.executemany(
+                "INSERT INTO records VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows
+            )
+        self.conn.execute(
+            "INSERT INTO files VALUES (?,?,?)",
+            (filename, stat.st_size, stat.st_mtime_ns),
+        )
+
+    def update(self, files):
+        """
+        Adds or refreshes the index for files. Only files that are new or whose size or
+        modification time changed are cataloged. Files that no longer exist are removed.
+
+        Returns:
+            list: files that were (re)cataloged
+        """
+        refreshed = []
+        with self.conn:
+            for filename in files:
+                filename = os.path.abspath(filename)
+                if not os.path.exists(filename):
+                    self._remove(filename)
+                    continue
+                stat = os.stat(filename)
+                if self._is_current(filename, stat):
+                    continue
+                self._remove(filename)
+                self._add(filename, stat)
+                refreshed.append(filename)
+        return refreshed
+
+    def files(self):
+        """
+        returns the list of files in the index
+        """
+        return [r[0] for r in self.conn.execute("SELECT FILE FROM files ORDER BY FILE")]
+
+    def find(self, pathname="///////", files=None):
+        """
+        Finds the records matching pathname in the index
+
+        Args:
+            pathname (str): /A/B/C/D/E/F/ where each part is blank or "*" to match all, or a regular expression
+                as for get_matching_ts. The D part is ignored
+            files (list, optional): restrict to these files. Defaults to all files in the index.
+
+        Returns:
+            DataFrame: catalog rows (columns T, A, B, C, F, E, D) with the FILE column, the D_START and D_END
+            dates of the time window and the record TYPE (RTS or ITS)
+        """
+        clauses, params = _where_clause(pathname)
+        if files is not None:
+            files = [os.path.abspath(f) for f in files]
+            clauses.append("FILE IN (%s)" % ",".join("?" * len(files)))
+            params.extend(files)
+        sql = "SELECT %s FROM records" % ",".join(_COLUMNS)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY rowid"
+        rows = self.conn.execute(sql, params).fetchall()
+        df = pd.DataFrame(rows, columns=_COLUMNS)
+        for c in ("D_START", "D_END"):
+            df[c] = np.asarray(df[c].values, dtype="datetime64[ns]")
+        return df
+
+    def find_files(self, pathname):
+        """
+        returns the list of files containing records matching pathname
+        """
+        return sorted(self.find(pathname)["FILE"].unique())
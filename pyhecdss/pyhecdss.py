@@ -1,4 +1,6 @@
 import collections
+import contextlib
+import functools
 from . import pyheclib
 import pandas as pd
 import numpy as np
@@ -7,14 +9,285 @@ import re
 import time
 import warnings
 import logging
+import multiprocessing
+import queue
 from datetime import datetime, timedelta
 from calendar import monthrange
 from dateutil.parser import parse
+from pandas.api.types import union_categoricals
 
 # some static functions
 
 DATE_FMT_STR = "%d%b%Y"
 _USE_CONDENSED = False
+# strings of catalog parts shared by the catalogs of all files read in this process. The table is
+# never emptied so only the A, B, C, E and F parts, which repeat across files, are kept in it
+_CATALOG_STRINGS = {}
+_SHARED_PARTS = "ABCFE"
+# process that last cataloged with heclib. heclib keeps the catalog file locked for the life of that
+# process, so processes forked from it can't catalog ("Catalog file Currently in use")
+_CATALOGED_PID = None
+
+
+def _categorical_from_codes(codes, categories, shared=True):
+    """
+    categorical with categories taken from the shared string table (if shared) so that the
+    catalogs of many files refer to the same string objects
+    """
+    if shared:
+        categories = [_CATALOG_STRINGS.setdefault(c, c) for c in categories]
+    categories = pd.Index(categories, dtype=object)
+    return pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories))
+
+
+def _categorical(values, shared=True):
+    """
+    categorical of values (strings) using the shared string table if shared
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    return _categorical_from_codes(codes, uniques, shared)
+
+
+def _part_values(col):
+    """
+    values of a catalog column as a numpy object array, built from the codes for categoricals
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return np.asarray(col.cat.categories, dtype=object)[col.cat.codes.values]
+    return np.asarray(col, dtype=object)
+
+
+def _remove_files(*names):
+    """
+    removes those of the files that exist
+    """
+    for name in names:
+        if os.path.exists(name):
+            os.remove(name)
+
+
+@contextlib.contextmanager
+def _lock_file(lockname, timeout=600, poll=0.05):
+    """
+    exclusive lock held by creating the file lockname, for use across processes.
+
+    Waits while another process holds it. A lock file older than timeout seconds is assumed to
+    be left behind by a process that died and is removed
+    """
+    while True:
+        try:
+            fd = os.open(lockname, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(lockname).st_mtime > timeout:
+                    logging.warning("Removing stale lock file: %s", lockname)
+                    os.remove(lockname)
+                    continue
+            except OSError:  # released in the meantime
+                continue
+            time.sleep(poll)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lockname)
+        except OSError:
+            pass
+
+
+# DSS dates, i.e. ddMMMyyyy with an optional HHMM time, and julian days (days since 31DEC1899)
+_MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+_MONTH_NUMBERS = {m: i + 1 for i, m in enumerate(_MONTHS)}
+_JULIAN_BASE = datetime(1899, 12, 31)
+_DSS_DATE_PATTERN = re.compile(
+    r"\s*(\d{1,2})([A-Za-z]{3})(\d{4})(?:[\s:]+(\d{2}):?(\d{2}))?\s*"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(datestr):
+    """
+    datetime for a DSS date string ddMMMyyyy with an optional time HHMM (or HH:MM) where 2400 is
+    the end of the day. Other formats are parsed with dateutil
+    """
+    m = _DSS_DATE_PATTERN.fullmatch(datestr)
+    month = _MONTH_NUMBERS.get(m.group(2).upper()) if m else None
+    if month is None:
+        return parse(datestr)
+    date = datetime(int(m.group(3)), month, int(m.group(1)))
+    if m.group(4) is not None:
+        date = date + timedelta(hours=int(m.group(4)), minutes=int(m.group(5)))
+    return date
+
+
+def _format_date(date):
+    """
+    DSS date string ddMMMyyyy, e.g. 01JAN1990, for a datetime or Timestamp
+    """
+    return "%02d%s%04d" % (date.day, _MONTHS[date.month - 1], date.year)
+
+
+def _format_time(date):
+    """
+    DSS time string HHMM for a datetime or Timestamp
+    """
+    return "%02d%02d" % (date.hour, date.minute)
+
+
+def _parse_dates(values):
+    """
+    datetime64[ns] array for an array of DSS date strings ddMMMyyyy, e.g. the dates of D parts
+    """
+    values = np.char.upper(np.char.strip(np.asarray(values, dtype="U")))
+    if len(values) == 0:
+        return np.empty(0, dtype="datetime64[ns]")
+    if np.any(np.char.str_len(values) != 9):
+        return np.array([_parse_date(v) for v in values], dtype="datetime64[ns]")
+    chars = values.astype("S9").view("S1").reshape(len(values), 9)
+    days = chars[:, 0:2].copy().view("S2").ravel().astype(int)
+    months = chars[:, 2:5].copy().view("S3").ravel()
+    years = chars[:, 5:9].copy().view("S4").ravel().astype(int)
+    lookup = np.array([_MONTH_NUMBERS[m.decode()] for m in np.unique(months)])
+    months = lookup[np.searchsorted(np.unique(months), months)]
+    dates = (years - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (months - 1)
+    return (dates.astype("datetime64[D]") + (days - 1)).astype("datetime64[ns]")
+
+
+def _format_dates(values):
+    """
+    object array of DSS date strings ddMMMyyyy for an array of datetime64
+    """
+    values = np.asarray(values, dtype="datetime64[D]")
+    months = values.astype("datetime64[M]")
+    years = values.astype("datetime64[Y]").astype(int) + 1970
+    names = np.array(_MONTHS, dtype=object)[months.astype(int) % 12]
+    days = (values - months).astype(int) + 1
+    return np.array(
+        ["%02d%s%04d" % dmy for dmy in zip(days.tolist(), names, years.tolist())],
+        dtype=object,
+    )
+
+
+def _julian_day(date):
+    """
+    julian day (days since 31DEC1899) of the date
+    """
+    return (datetime(date.year, date.month, date.day) - _JULIAN_BASE).days
+
+
+def _julian_minutes_to_datetime64(julian_day, minutes):
+    """
+    datetime64[ns] array for minutes since the start of julian_day
+    """
+    base = np.datetime64(_JULIAN_BASE, "m") + np.timedelta64(int(julian_day) * 1440, "m")
+    return (base + np.asarray(minutes).astype("timedelta64[m]")).astype("datetime64[ns]")
+
+
+def _datetime64_to_julian_minutes(values, julian_day):
+    """
+    int32 array of minutes since the start of julian_day for an array of datetime64. Raises
+    ValueError for missing times (NaT) or times too far from julian_day to store in an int32
+    """
+    base = np.datetime64(_JULIAN_BASE, "m") + np.timedelta64(int(julian_day) * 1440, "m")
+    # int64 minutes since 1970, a view if values are already in minutes
+    minutes = np.asarray(values).astype("datetime64[m]", copy=False).view(np.int64)
+    itimes = np.empty(len(minutes), "i")
+    if len(minutes) == 0:
+        return itimes
+    lo, hi = minutes.min(), minutes.max()
+    if lo == np.iinfo(np.int64).min:
+        raise ValueError("Missing (NaT) times can not be written")
+    base = base.astype(np.int64)
+    info = np.iinfo(np.int32)
+    if lo - base < info.min or hi - base > info.max:
+        raise ValueError(
+            "Times %s to %s are too far from the base date %s to store in minutes"
+            % (
+                minutes[minutes.argmin()].view("datetime64[m]"),
+                minutes[minutes.argmax()].view("datetime64[m]"),
+                _format_date(_JULIAN_BASE + timedelta(days=int(julian_day))),
+            )
+        )
+    np.subtract(minutes, base, out=itimes, casting="unsafe")
+    return itimes
+
+
+@functools.lru_cache(maxsize=1024)
+def _its_window(startDateStr, endDateStr, epart):
+    """
+    (start julian day, end julian day, block D parts) of an irregular time series read with E part
+    epart from startDateStr to endDateStr, rounded out to whole days. Records read with the same time
+    window share the conversions
+    """
+    sdate = _parse_date(startDateStr)
+    edate = _parse_date(endDateStr)
+    juls = _julian_day(sdate)  # round down
+    jule = _julian_day(edate)
+    if edate != datetime(edate.year, edate.month, edate.day):
+        jule = jule + 1  # round up
+    block = DSSFile._block_start(_JULIAN_BASE + timedelta(days=juls), epart)
+    last = DSSFile._block_start(_JULIAN_BASE + timedelta(days=jule), epart)
+    blocks = [block]
+    while block < last:
+        # blocks start after 2400 of the day before their start date
+        block = DSSFile._next_block_start(block + timedelta(minutes=1), epart)
+        blocks.append(block)
+    return juls, jule, tuple(_format_date(b) for b in blocks)
+
+
+def _its_base_window(first, last):
+    """
+    D part time window (start, end) for irregular time series from datetime64 first to last, from the
+    start of the year of first (or the year before if first is at its start) to the start of the year
+    after last (or last itself if it is at a year start)
+    """
+    start = np.datetime64(first, "Y")
+    if np.datetime64(first, "m") == start:
+        start = start - np.timedelta64(1, "Y")
+    end = np.datetime64(last, "Y")
+    if np.datetime64(last, "m") != end:
+        end = end + np.timedelta64(1, "Y")
+    return (
+        _format_date(start.astype("datetime64[D]").astype(datetime)),
+        _format_date(end.astype("datetime64[D]").astype(datetime)),
+    )
+
+
+def _concat_catalogs(frames):
+    """
+    concatenates catalog data frames keeping the categorical parts categorical
+    (a plain concat of different categories would give strings)
+    """
+    catalog = pd.concat(frames, ignore_index=True)
+    for c in frames[0].columns:
+        if isinstance(frames[0][c].dtype, pd.CategoricalDtype):
+            u = union_categoricals([f[c] for f in frames])
+            catalog[c] = _categorical_from_codes(u.codes, u.categories, c in _SHARED_PARTS)
+    return catalog
+
+
+def _part_equals(col, value):
+    """
+    boolean array of values in catalog column equal to value
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        code = col.cat.categories.get_indexer([value])[0]
+        return col.cat.codes.values == code if code >= 0 else np.zeros(len(col), bool)
+    return np.asarray(col, dtype=object) == value
+
+
+def _match_part(col, pattern):
+    """
+    boolean array of values in catalog column matching the regular expression pattern.
+    For categoricals only the categories are matched and the result is looked up by code
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        matches = np.asarray(col.cat.categories.str.match(pattern), dtype=bool)
+        return matches[col.cat.codes.values]
+    return np.asarray(col.str.match(pattern), dtype=bool)
 
 
 def set_message_level(level):
@@ -53,13 +326,10 @@ def get_start_end_dates(twstr, sep="-"):
         twstr (str): timewindow as string of the form that can be parsed by pd.to_datetime [https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.to_datetime.html]
     """
     s, e = [pd.to_datetime(str.strip(d)) for d in str.split(twstr, sep)]
-    return (
-        s.floor("D").strftime("%d%b%Y").upper(),
-        e.ceil("D").strftime("%d%b%Y").upper(),
-    )
+    return _format_date(s), _format_date(e.ceil("D"))
 
 
-def get_ts(filename, *paths):
+def get_ts(filename, *paths, prefetch=0, address_order=False):
     """
     Gets regular time series matching the pathname(s) from the filename.
     Opens and reads pathname(s) from filename and then closes it (slightly inefficient)
@@ -71,6 +341,13 @@ def get_ts(filename, *paths):
     pathname(s): one or more strings of the form /A/B/C/D/E/F that is parsed to match all parts except D
     which if not blank is used to determine the time window to retrieve
     D should be specified in the format of ddMMMYYYY HHmm - ddMMMYYYY HHmm
+    prefetch: number of time series to read ahead in a child process while the caller works on the
+    current one. Defaults to 0, i.e. each is read when asked for. Where fork is not available (e.g. Windows)
+    the child is spawned, which re-imports the __main__ module, so scripts need an
+    if __name__ == "__main__": guard
+    address_order: read batches of time series in the order of their file addresses, so a large file is
+    read front to back. Each batch is read before the first of it is returned, so this holds more in
+    memory and takes longer to return the first. Defaults to False, i.e. read in catalog order
 
     Returns
     -------
@@ -92,9 +369,10 @@ def get_ts(filename, *paths):
     """
     with DSSFile(filename) as dssh:
         dfcat = dssh.read_catalog()
+        requests = []
         for pathname in paths:
             if pathname:
-                pathname = pathname.upper()
+                pathname = str(pathname).upper()
             pp = pathname.split("/")
             cond = True
             for p, n in zip(pp[1:4] + pp[5:7], ["A", "B", "C", "E", "F"]):
@@ -108,14 +386,13 @@ def get_ts(filename, *paths):
                     startDateStr, endDateStr = get_start_end_dates(twstr)
                 except:
                     startDateStr, endDateStr = None, None
-            for p in plist:
-                if p.split("/")[5].startswith("IR-"):
-                    yield dssh.read_its(p, startDateStr, endDateStr)
-                else:
-                    yield dssh.read_rts(p, startDateStr, endDateStr)
+            requests += [(p, startDateStr, endDateStr) for p in plist]
+        yield from _read_requests(dssh, requests, prefetch, address_order)
 
 
-def get_matching_ts(filename, pathname=None, path_parts=None):
+def get_matching_ts(
+    filename, pathname=None, path_parts=None, index=None, prefetch=0, address_order=False
+):
     """Opens the DSS file and reads matching pathname or path parts
 
     Args:
@@ -128,18 +405,32 @@ def get_matching_ts(filename, pathname=None, path_parts=None):
 
     *One of pathname or pathparts must be specified*
 
+    :param index: optional DSSIndex to look up matching pathnames in, instead of reading the catalog.
+     The index is refreshed for filename if the file changed and the file is only opened if there is a match
+
+    :param prefetch: number of time series to read ahead in a child process while the caller works on the
+     current one. Defaults to 0, i.e. each is read when asked for. See get_ts for the __main__ guard needed
+     where fork is not available
+
+    :param address_order: read batches of time series in the order of their file addresses, see get_ts.
+     Defaults to False
+
     :returns: an generator of named tuples of DSSData ( data as dataframe, units as string, type as string one of INST-VAL, PER-VAL)
     """
+    if pathname:
+        pathname = str(pathname).upper()
+    pp = pathname.split("/")
+    if index is not None:
+        index.update([filename])
+        dfcat = index.find(pathname, files=[filename])
+        if len(dfcat) == 0:
+            raise Exception(
+                f"No pathname found in {filename} for {pathname} or {path_parts}"
+            )
     with DSSFile(filename) as dssh:
-        dfcat = dssh.read_catalog()
-        if pathname:
-            pathname = pathname.upper()
-        pp = pathname.split("/")
-        cond = dfcat["A"].str.match(".*")
-        for p, n in zip(pp[1:4] + pp[5:7], ["A", "B", "C", "E", "F"]):
-            if len(p) > 0:
-                cond = cond & (dfcat[n].str.match(p))
-        plist = dssh.get_pathnames(dfcat[cond])
+        if index is None:
+            dfcat = dssh.read_catalog(pathname)
+        plist = dssh.get_pathnames(dfcat)
         twstr = str.strip(pp[4])
         startDateStr = endDateStr = None
         if len(twstr) > 0:
@@ -151,11 +442,515 @@ def get_matching_ts(filename, pathname=None, path_parts=None):
             raise Exception(
                 f"No pathname found in {filename} for {pathname} or {path_parts}"
             )
-        for p in plist:
-            if p.split("/")[5].startswith("IR-"):
-                yield dssh.read_its(p, startDateStr, endDateStr)
-            else:
-                yield dssh.read_rts(p, startDateStr, endDateStr)
+        yield from _read_requests(
+            dssh, [(p, startDateStr, endDateStr) for p in plist], prefetch, address_order
+        )
+
+
+def _read_requests(dssh, requests, prefetch=0, address_order=False):
+    """
+    reads the (pathname, startDateStr, endDateStr) requests from the open dssh in order, reading up to
+    prefetch of them ahead in a child process if prefetch > 0 and in batches in the order of their
+    file addresses if address_order
+    """
+    if prefetch > 0:
+        yield from _prefetched(dssh.fname, requests, prefetch, address_order)
+    else:
+        yield from _read_in_order(dssh, requests, address_order)
+
+
+def _read_in_order(dssh, requests, address_order=False):
+    """
+    reads the requests from the open dssh one at a time as asked for, or through
+    _read_in_address_order if address_order
+    """
+    if address_order:
+        yield from _read_in_address_order(dssh, requests)
+    else:
+        for request in requests:
+            yield _read_ts(dssh, *request)
+
+
+# number of time series read at a time in the order of their file addresses
+_ADDRESS_ORDER_BATCH = 256
+# most values kept in the scratch buffers of a DSSFile between irregular reads (12 bytes each)
+_ITS_BUFFER_LENGTH = 1 << 20
+
+
+def _read_in_address_order(dssh, requests, batch=_ADDRESS_ORDER_BATCH):
+    """
+    reads the (pathname, startDateStr, endDateStr) requests from the open dssh and yields them in order.
+    Each batch of requests is read in the order of the file addresses of the records, so a large file
+    is read front to back rather than in catalog (alphabetical) order, holding at most a batch of
+    time series
+    """
+    requests = list(requests)
+    for i in range(0, len(requests), batch):
+        chunk = requests[i : i + batch]
+        addresses = dssh._data_addresses([p for p, _, _ in chunk])
+        results = [None] * len(chunk)
+        for j in np.argsort(addresses, kind="stable"):
+            results[j] = _read_ts(dssh, *chunk[j])
+        for j in range(len(chunk)):
+            result, results[j] = results[j], None
+            yield result
+
+
+def _prefetch_worker(filename, requests, results, address_order=False):
+    """
+    reads the requests from filename into the results queue, run in a child process
+    """
+    try:
+        with DSSFile(filename) as dssh:
+            for result in _read_in_order(dssh, requests, address_order):
+                results.put((True, result))
+    except Exception as ex:
+        results.put((False, ex))
+
+
+def _reader_context():
+    """
+    multiprocessing context for child processes that only read records. DSSFile handles inherited
+    through a fork reopen the file in the child (see DSSFile._is_inherited), so fork is used where
+    available as unlike spawn it does not re-import the __main__ module. Generating catalogs is
+    different, see DSSCollection.read_catalog
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def _prefetched(filename, requests, prefetch, address_order=False):
+    """
+    generator of the time series for the (pathname, startDateStr, endDateStr) requests read from
+    filename in a child process. The child reads ahead until prefetch time series are waiting, so
+    reading overlaps with whatever the caller does with the current one.
+
+    heclib's fortran i/o state is per process, so a separate process rather than a thread does the
+    reading. Closing the generator early stops the child
+    """
+    ctx = _reader_context()
+    results = ctx.Queue(maxsize=prefetch)
+    worker = ctx.Process(
+        target=_prefetch_worker,
+        args=(filename, list(requests), results, address_order),
+        daemon=True,
+    )
+    worker.start()
+    try:
+        for _ in requests:
+            while True:
+                try:
+                    ok, result = results.get(timeout=1)
+                    break
+                except queue.Empty:
+                    # the child may have died without reporting, e.g. a crash in heclib
+                    if not worker.is_alive() and results.empty():
+                        raise Exception(
+                            "Reading %s stopped with exit code %s"
+                            % (filename, worker.exitcode)
+                        )
+            if not ok:
+                raise result
+            yield result
+    finally:
+        if worker.is_alive():
+            worker.terminate()
+        worker.join()
+        results.close()
+
+
+def _read_ts(dssh, pathname, startDateStr=None, endDateStr=None):
+    """
+    reads pathname as irregular or regular time series depending on its E part
+    """
+    if DSSPath.of(pathname).is_irregular:
+        return dssh.read_its(pathname, startDateStr, endDateStr)
+    else:
+        return dssh.read_rts(pathname, startDateStr, endDateStr)
+
+
+def _catalog_instructions(pathname):
+    """
+    heclib selective catalog instructions, e.g. "B=RSAC@, C=EC@", for the A, B, C, E and F parts of
+    pathname that are matched as prefixes by match_catalog, i.e. plain names optionally followed
+    by ".*". "@" is heclib's wildcard. Parts with other regular expressions are not included
+    so the selected records are a superset of those matching pathname
+    """
+    pp = str(pathname).upper().split("/")
+    instr = []
+    for p, n in zip(pp[1:4] + pp[5:7], ["A", "B", "C", "E", "F"]):
+        if p.endswith(".*"):
+            p = p[:-2]
+        if re.fullmatch(r"[\w\-]+", p):
+            instr.append("%s=%s@" % (n, p))
+    return ", ".join(instr)
+
+
+def match_catalog(dfcat, pathname):
+    """
+    Filters a catalog data frame by the A, B, C, E and F parts of pathname
+
+    Args:
+        dfcat (DataFrame): catalog as returned by DSSFile.read_catalog
+        pathname (str or DSSPath): a pathname /A/B/C/D/E/F/ where each part is either blank implying match
+            all or a regular expression to be matched. The D part is ignored
+
+    Returns:
+        DataFrame: rows of dfcat that match
+    """
+    pp = str(pathname).upper().split("/")
+    cond = np.ones(len(dfcat), dtype=bool)
+    for p, n in zip(pp[1:4] + pp[5:7], ["A", "B", "C", "E", "F"]):
+        if len(p) > 0:
+            cond = cond & _match_part(dfcat[n], p)
+    return dfcat[cond]
+
+
+@functools.lru_cache(maxsize=256)
+def _epart_freq(epart):
+    """
+    (pandas offset, pandas frequency string) for a regular E part, e.g. (<15 * Minutes>, "15min")
+    """
+    nfreq, interval = DSSFile.get_number_and_frequency_from_epart(epart)
+    freqstr = "%d%s" % (nfreq, DSSFile.NAME_FREQ_MAP[interval])
+    return DSSFile.get_freq_from_epart(epart), freqstr
+
+
+class DSSPath:
+    """
+    An immutable, parsed (upper case) pathname /A/B/C/D/E/F/
+
+    Pathnames are interned, i.e. DSSPath.of returns the same object for the same pathname from
+    a bounded (least recently used) table, so the parts and the frequency of the E part are only
+    worked out once. DSSPath can be used wherever DSSFile takes a pathname.
+
+        >>> p = DSSPath.of('/SAMPLE/SIN/WAVE/01JAN1990/15MIN/SAMPLE1/')
+        >>> p.bpart, p.epart, p.freqstr
+        ('SIN', '15MIN', '15min')
+    """
+
+    __slots__ = ("pathname", "parts")
+
+    def __init__(self, pathname):
+        pathname = str(pathname).upper()
+        parts = tuple(pathname.split("/"))
+        if len(parts) < 8:
+            raise ValueError("Not a pathname of the form /A/B/C/D/E/F/: " + pathname)
+        object.__setattr__(self, "pathname", pathname)
+        object.__setattr__(self, "parts", parts)
+
+    @staticmethod
+    def of(pathname):
+        """
+        returns the interned DSSPath for pathname (a string or DSSPath)
+        """
+        if isinstance(pathname, DSSPath):
+            return pathname
+        return _intern_path(pathname)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DSSPath is immutable")
+
+    def __str__(self):
+        return self.pathname
+
+    def __repr__(self):
+        return "DSSPath(%r)" % self.pathname
+
+    def __eq__(self, other):
+        if isinstance(other, DSSPath):
+            return self.pathname == other.pathname
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pathname)
+
+    def __reduce__(self):
+        return (DSSPath.of, (self.pathname,))
+
+    @property
+    def apart(self):
+        return self.parts[1]
+
+    @property
+    def bpart(self):
+        return self.parts[2]
+
+    @property
+    def cpart(self):
+        return self.parts[3]
+
+    @property
+    def dpart(self):
+        return self.parts[4]
+
+    @property
+    def epart(self):
+        return self.parts[5]
+
+    @property
+    def fpart(self):
+        return self.parts[6]
+
+    @property
+    def is_irregular(self):
+        return self.parts[5].startswith("IR-")
+
+    @property
+    def freq(self):
+        """
+        pandas offset of the E part (regular time series only)
+        """
+        return _epart_freq(self.parts[5])[0]
+
+    @property
+    def freqstr(self):
+        """
+        pandas frequency string of the E part, e.g. "15min" (regular time series only)
+        """
+        return _epart_freq(self.parts[5])[1]
+
+    def with_parts(self, **parts):
+        """
+        returns the DSSPath with some parts replaced, e.g. path.with_parts(dpart="", epart="1DAY")
+        """
+        p = list(self.parts)
+        for name, value in parts.items():
+            p["_abcdef".index(name[0])] = value
+        return DSSPath.of("/".join(p))
+
+
+@functools.lru_cache(maxsize=16384)
+def _intern_path(pathname):
+    return DSSPath(pathname)
+
+
+# time indexes kept by _time_index, least recently used first, and the total number of their values.
+# The cache is bounded by the number of values (8 bytes each) rather than of indexes as a record
+# can span anything from a few to millions of values
+_TIME_INDEXES = collections.OrderedDict()
+_TIME_INDEXES_LENGTH = 0
+_TIME_INDEX_CACHE_LENGTH = 1 << 21
+
+
+def _time_index(start, epart, iofset, length, period):
+    """
+    time index of a regular time series read from start (datetime) with length values of E part epart
+    and offset iofset (minutes) as a PeriodIndex (period is True) or DatetimeIndex.
+
+    The index values are immutable so records of the same shape, e.g. a batch of records with the same
+    E part and time window, share them. The index object itself is not, e.g. its name can be set, so
+    callers should take a view of it. Indexes longer than the whole cache are not kept
+    """
+    global _TIME_INDEXES_LENGTH
+    key = (start, epart, iofset, length, period)
+    index = _TIME_INDEXES.get(key)
+    if index is not None:
+        _TIME_INDEXES.move_to_end(key)
+        return index
+    index = _new_time_index(start, epart, iofset, length, period)
+    if length <= _TIME_INDEX_CACHE_LENGTH:
+        _TIME_INDEXES[key] = index
+        _TIME_INDEXES_LENGTH += length
+        while _TIME_INDEXES_LENGTH > _TIME_INDEX_CACHE_LENGTH:
+            _, old = _TIME_INDEXES.popitem(last=False)
+            _TIME_INDEXES_LENGTH -= len(old)
+    return index
+
+
+def _new_time_index(start, epart, iofset, length, period):
+    """
+    time index for _time_index
+    """
+    freqoffset, freqstr = _epart_freq(epart)
+    if period:  # for period values, shift back 1
+        # - pd.tseries.frequencies.to_offset(freqoffset)
+        sp = pd.Period(start, freq=freqstr)
+        return pd.period_range(sp, periods=length, freq=freqstr).shift(-1)
+    if iofset != 0:
+        # offsets are always from the end of the period, e.g. for day, rewind by a day and then add offset
+        start = start - freqoffset + timedelta(minutes=iofset)
+    return pd.date_range(start, periods=length, freq=freqoffset)
+
+
+# period types of the values aggregated by DSSFile.read_rts_aggregated
+_AGGREGATE_PERIOD_TYPES = {
+    "mean": "PER-AVER",
+    "sum": "PER-CUM",
+    "min": "PER-MIN",
+    "max": "PER-MAX",
+}
+
+
+def _time_grid(start, end, freqoffset):
+    """
+    datetime64[ns] array of the regular times from start to end (inclusive) at freqoffset
+    """
+    if isinstance(freqoffset, pd.offsets.Tick):
+        step = np.timedelta64(freqoffset.nanos, "ns")
+        n = (pd.Timestamp(end) - pd.Timestamp(start)).value // freqoffset.nanos + 1
+        return np.datetime64(pd.Timestamp(start), "ns") + np.arange(n) * step
+    return pd.date_range(start, end, freq=freqoffset).values
+
+
+def _time_bins(times, epart):
+    """
+    integer codes of the intervals of E part epart containing the datetime64[ns] times and a function
+    converting codes to the start times of the intervals. epart is 1DAY, 1MON, 1YEAR or a number of
+    minutes or hours that divides a day
+    """
+    n, interval = DSSFile.get_number_and_frequency_from_epart(epart)
+    minutes = n * {"MIN": 1, "HOUR": 60, "DAY": 1440}.get(interval, 0)
+    if minutes > 0 and 1440 % minutes == 0:
+        step = minutes * 60 * 1000000000
+        return times.view(np.int64) // step, lambda c: (c * step).view("datetime64[ns]")
+    elif n == 1 and interval in ("MON", "YEAR"):
+        unit = "datetime64[M]" if interval == "MON" else "datetime64[Y]"
+        return (
+            times.astype(unit).astype(np.int64),
+            lambda c: c.astype(unit).astype("datetime64[ns]"),
+        )
+    raise ValueError(
+        "Can only aggregate to 1DAY, 1MON, 1YEAR or minutes or hours that divide a day, not "
+        + epart
+    )
+
+
+def _series_times(grid, freqoffset, period, iofset):
+    """
+    times of the index read_rts returns for values at the regular (datetime64[ns]) times grid, i.e.
+    the start of the period for period values and the time with offset iofset (minutes) otherwise
+    """
+    if not period and iofset == 0:
+        return grid
+    times = (pd.DatetimeIndex(grid) - freqoffset).values
+    if not period:
+        times = times + np.timedelta64(iofset, "m")
+    return times
+
+
+def _reduce_bins(codes, values):
+    """
+    reduces values with nans for missing to one value for each run of equal (sorted) codes,
+    returns (codes, counts, totals, mins, maxs)
+    """
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1))
+    valid = ~np.isnan(values)
+    return (
+        codes[starts],
+        np.add.reduceat(valid.astype(np.int64), starts),
+        np.add.reduceat(np.where(valid, values, 0.0), starts),
+        np.fmin.reduceat(values, starts),
+        np.fmax.reduceat(values, starts),
+    )
+
+
+def _preview_buckets(blocks, start, end, nbuckets):
+    """
+    splits the time window start to end (datetime64[ns]) into nbuckets of equal length and yields
+    (bucket, times, values) for the values in each bucket, in order. blocks is an iterable of (grid, times,
+    values) with the regular times grid used for bucketing, the times of the values and the values
+    with nan for missing. A bucket spanning more than one block is yielded in a piece from each block
+    """
+    start = np.datetime64(start, "ns").astype(np.int64)
+    span = max(np.datetime64(end, "ns").astype(np.int64) - start, 1)
+    for grid, times, values in blocks:
+        valid = ~np.isnan(values)
+        codes = (grid[valid].astype(np.int64) - start) / span * nbuckets
+        codes = np.clip(codes.astype(np.int64), 0, nbuckets - 1)
+        if len(codes) == 0:
+            continue
+        times, values = times[valid], values[valid]
+        starts = np.flatnonzero(np.diff(codes)) + 1
+        yield from zip(
+            codes[np.concatenate(([0], starts))],
+            np.split(times, starts),
+            np.split(values, starts),
+        )
+
+
+def _whole_buckets(pieces):
+    """
+    (times, values) of each bucket from the pieces yielded by _preview_buckets, only holding the
+    pieces of the bucket being put together
+    """
+    bucket, times, values = None, [], []
+    for code, t, v in pieces:
+        if len(times) > 0 and code != bucket:
+            yield np.concatenate(times), np.concatenate(values)
+            times, values = [], []
+        bucket = code
+        times.append(t)
+        values.append(v)
+    if len(times) > 0:
+        yield np.concatenate(times), np.concatenate(values)
+
+
+def _minmax_points(pieces):
+    """
+    (times, values) of the minimum and maximum of each bucket, kept as running minimum and
+    maximum over the pieces of the bucket
+    """
+    times, values = [], []
+
+    def add(tmin, vmin, tmax, vmax):
+        if tmin == tmax:
+            times.append(tmin)
+            values.append(vmin)
+        else:
+            first, last = ((tmin, vmin), (tmax, vmax)) if tmin < tmax else ((tmax, vmax), (tmin, vmin))
+            times.extend((first[0], last[0]))
+            values.extend((first[1], last[1]))
+
+    bucket = current = None
+    for code, t, v in pieces:
+        i, j = np.argmin(v), np.argmax(v)
+        if current is not None and code == bucket:
+            # the first of equal values, as np.argmin and np.argmax of the whole bucket
+            if v[i] < current[1]:
+                current[0:2] = t[i], v[i]
+            if v[j] > current[3]:
+                current[2:4] = t[j], v[j]
+            continue
+        if current is not None:
+            add(*current)
+        bucket, current = code, [t[i], v[i], t[j], v[j]]
+    if current is not None:
+        add(*current)
+    return np.array(times, dtype="datetime64[ns]"), np.array(values, dtype="d")
+
+
+def _lttb_points(pieces):
+    """
+    (times, values) selected by largest triangle three buckets, i.e. the first value and then the value
+    of each bucket making the largest triangle with the value selected before it and the average of
+    the next bucket, ending with the last value. Only the current and the next bucket are kept
+    """
+    buckets = _whole_buckets(pieces)
+    current = next(buckets, None)
+    if current is None:
+        return np.array([], dtype="datetime64[ns]"), np.array([])
+    origin = current[0][0]
+    times, values = [current[0][0]], [current[1][0]]
+    ax, ay = 0.0, current[1][0]
+    for following in buckets:
+        cx = np.mean((following[0] - origin) / np.timedelta64(1, "s"))
+        cy = np.mean(following[1])
+        x = (current[0] - origin) / np.timedelta64(1, "s")
+        y = current[1]
+        i = np.argmax(np.abs((ax - cx) * (y - ay) - (ax - x) * (cy - ay)))
+        times.append(current[0][i])
+        values.append(y[i])
+        ax, ay = x[i], y[i]
+        current = following
+    if len(times) > 1 or len(current[0]) > 1:
+        times.append(current[0][-1])
+        values.append(current[1][-1])
+    return np.array(times, dtype="datetime64[ns]"), np.array(values)
+
+
+_PREVIEW_METHODS = {"minmax": _minmax_points, "lttb": _lttb_points}
 
 
 DSSData = collections.namedtuple(
@@ -173,6 +968,13 @@ class DSSFile:
         dfcat=dh.read_catalog()
     ```
 
+    A DSSFile can be pickled (e.g. passed to multiprocessing pools) and is reopened lazily
+    in the receiving process. A handle inherited through a fork is also reopened on first use.
+
+    The catalog read by read_catalog is kept in memory and patched by write_rts and write_its,
+    so reading the catalog after a write doesn't run the catalog again. The catalog files
+    (.dsc, .dsd) are brought up to date when the file is closed.
+
     Raises:
         FileNotFoundError: If the path to the file is not found. Usually silently creats an empty file if missing
 
@@ -222,8 +1024,32 @@ class DSSFile:
         self.ifltab = pyheclib.intArray(600)
         self.istat = 0
         self.fname = fname
+        self._pid = None
+        self._catalog = None  # live catalog, see read_catalog
+        self._catalog_stat = None  # (size, mtime) of the file the live catalog is valid for
+        self._catalog_dirty = False  # live catalog has writes not in the catalog files
+        self._selected = {}  # selective catalogs by heclib instructions, see _read_matching_catalog
+        self._selected_stat = None  # (size, mtime) of the file the selective catalogs are valid for
+        self._its_itimes = self._its_dvalues = None  # scratch buffers for irregular reads
         self.open()
 
+    # pickle as filename and open state, the file is reopened lazily in the receiving process
+    def __getstate__(self):
+        return {"fname": self.fname, "isopen": self.isopen}
+
+    def __setstate__(self, state):
+        self.fname = state["fname"]
+        self.ifltab = pyheclib.intArray(600)
+        self.istat = 0
+        self.isopen = state["isopen"]
+        self._pid = None  # not opened in this process
+        self._catalog = None
+        self._catalog_stat = None
+        self._catalog_dirty = False
+        self._selected = {}
+        self._selected_stat = None
+        self._its_itimes = self._its_dvalues = None
+
     # defining __enter__ and __exit__ for use with "with" statements
     def __enter__(self):
         return self
@@ -244,21 +1070,56 @@ class DSSFile:
                 % (fname, dname)
             )
 
+    def _is_inherited(self):
+        """
+        True if the file was opened in another process, i.e. this handle was inherited
+        through a fork or unpickled, and so the ifltab state is not valid here
+        """
+        return self.isopen and self._pid != os.getpid()
+
+    def _discard_inherited(self):
+        """
+        drops the inherited ifltab without closing it as that would write to the
+        file on behalf of the other process. The live catalog is dropped too so that
+        pending catalog writes of the other process are not written from this one
+        """
+        self.ifltab = pyheclib.intArray(600)
+        self.isopen = False
+        self._catalog = None
+        self._catalog_stat = None
+        self._catalog_dirty = False
+
+    def _reopen_if_inherited(self):
+        """
+        reopens the file in this process if it was opened in another process
+        """
+        if self._is_inherited():
+            self.open()
+
     def open(self):
         """
         Open DSS file
         """
+        if self._is_inherited():
+            self._discard_inherited()
         if self.isopen:
             return
         self.istat = pyheclib.hec_zopen(self.ifltab, self.fname)
         self.isopen = True
+        self._pid = os.getpid()
 
     def close(self):
         """
         Close DSS File
         """
         # FIXME: remove all created arrays and pointers
+        if self._is_inherited():
+            self._discard_inherited()
         if self.isopen:
+            if self._catalog_dirty:
+                self.catalog()  # write the catalog files for the patched live catalog
+                self._catalog_dirty = False
+                self._catalog_stat = self._stat()
             pyheclib.zclose_(self.ifltab)
             self.isopen = False
 
@@ -272,30 +1133,83 @@ class DSSFile:
             self.close()
         return pyheclib.hec_zfver(self.fname)
 
-    def catalog(self):
+    def _catalog_lock_name(self):
+        return self.fname[: self.fname.rfind(".")] + ".lock"
+
+    def catalog(self, sort=True):
         """
         Catalog DSS Files
+
+        The catalog files (.dsc, .dsd) are written to temporary files and renamed into place,
+        while holding a lock file, so other processes never read a partially written catalog
+
+        Args:
+            sort (bool, optional): sort the pathnames. An unsorted catalog is quicker to make for
+                large files but has no condensed catalog (.dsd). Defaults to True.
+        """
+        with _lock_file(self._catalog_lock_name()):
+            return self._write_catalog(sort=sort)
+
+    def _write_catalog(self, sort=True, cinstr="", base=None):
         """
+        writes the catalog files base.dsc and base.dsd (defaults to the name of this file), to be
+        called with the catalog lock held. cinstr are heclib's selective catalog instructions
+        """
+        self._reopen_if_inherited()
+        if base is None:
+            base = self.fname[: self.fname.rfind(".")]
+        fcname = base + ".dsc"
+        fdname = base + ".dsd"
+        # unique per process and keeping the extensions heclib expects for sorting the catalog
+        tmpbase = "%s.%d.tmp" % (base, os.getpid())
+        fctmp = tmpbase + ".dsc"
+        fdtmp = tmpbase + ".dsd"
+        try:
+            nfile, nrecs, condensed = self._zcat(fctmp, fdtmp, sort, cinstr)
+            # heclib writes at least a header, even if no records are selected, unless it failed, e.g.
+            # "Catalog file Currently in use", which it only prints. An empty file has no records to catalog
+            if nfile > 0 and (not os.path.exists(fctmp) or os.path.getsize(fctmp) == 0):
+                raise Exception("Cataloging %s failed, see the messages from heclib above" % self.fname)
+            if not condensed and os.path.exists(fdtmp):  # e.g. unsorted, keep the previous one
+                os.remove(fdtmp)
+            for tmpname, name in ((fctmp, fcname), (fdtmp, fdname)):
+                if os.path.exists(tmpname):
+                    os.replace(tmpname, name)
+        finally:
+            # whatever is left was not renamed into place. .dsk is heclib's scratch file for sorting
+            _remove_files(fctmp, fdtmp, tmpbase + ".dsk")
+        return nrecs
+
+    def _zcat(self, fctmp, fdtmp, sort, cinstr):
+        """
+        runs heclib's zcat writing the catalog to fctmp and the condensed catalog to fdtmp.
+        returns the number of records in the file, the number cataloged and if the condensed catalog was written
+        """
+        global _CATALOGED_PID
+        if _CATALOGED_PID not in (None, os.getpid()):
+            raise Exception(
+                "Cataloging %s is not possible in a process forked from one that has cataloged (pid %d): "
+                "heclib's catalog lock is not inherited. Read the catalog before forking or use the spawn "
+                "start method" % (self.fname, _CATALOGED_PID)
+            )
         opened_already = self.isopen
         try:
             if not opened_already:
                 self.open()
             icunit = pyheclib.new_intp()  # unit (fortran) for catalog
             pyheclib.intp_assign(icunit, 12)
-            fcname = self.fname[: self.fname.rfind(".")] + ".dsc"
-            pyheclib.fortranopen_(icunit, fcname, len(fcname))
+            pyheclib.fortranopen_(icunit, fctmp, len(fctmp))
             icdunit = pyheclib.new_intp()  # unit (fortran) for condensed catalog
-            fdname = self.fname[: self.fname.rfind(".")] + ".dsd"
             pyheclib.intp_assign(icdunit, 13)
-            pyheclib.fortranopen_(icdunit, fdname, len(fdname))
+            pyheclib.fortranopen_(icdunit, fdtmp, len(fdtmp))
             inunit = pyheclib.new_intp()
             # new catalog, if non-zero no cataloging
             pyheclib.intp_assign(inunit, 0)
-            cinstr = ""  # catalog instructions : None = ""
+            # catalog instructions : None = "", or selection such as "B=RSAC@, C=EC@"
             labrev = pyheclib.new_intp()
             pyheclib.intp_assign(labrev, 0)  # 0 is unabbreviated.
             ldsort = pyheclib.new_intp()
-            pyheclib.intp_assign(ldsort, 1)  # 1 is sorted
+            pyheclib.intp_assign(ldsort, 1 if sort else 0)  # 1 is sorted
             lcdcat = pyheclib.new_intp()  # output if condensed created
             nrecs = pyheclib.new_intp()  # number of records cataloged
             pyheclib.zcat_(
@@ -310,10 +1224,10 @@ class DSSFile:
                 nrecs,
                 len(cinstr),
             )
-            return pyheclib.intp_value(nrecs)
-        except:
-            # warnings.warn("Exception occurred while catalogging")
-            pass
+            _CATALOGED_PID = os.getpid()
+            nrecs = pyheclib.intp_value(nrecs)
+            condensed = pyheclib.intp_value(lcdcat) != 0
+            nfile = self._number_of_records()
         finally:
             pyheclib.fortranflush_(icunit)
             pyheclib.fortranclose_(icunit)
@@ -323,38 +1237,58 @@ class DSSFile:
             pyheclib.fortranclose_(inunit)
             if not opened_already:
                 self.close()
+        return nfile, nrecs, condensed
+
+    def _number_of_records(self):
+        """
+        number of records in the open file
+        """
+        nrec = pyheclib.new_intp()
+        pyheclib.hec_zinqir(self.ifltab, "NREC", " " * 8, nrec)
+        return pyheclib.intp_value(nrec)
 
     @staticmethod
     def _read_catalog_dsd(fdname):
         """
         read condensed catalog from fname into a data frame
+
+        The fixed width columns are sliced out of all lines at once and the ditto marks ("-")
+        are forward filled in bulk. The parts are returned as categoricals
         """
-        with open(fdname, "r") as fd:
-            lines = fd.readlines()
-        columns = ["Tag", "A Part", "B Part", "C Part", "F Part", "E Part", "D Part"]
+        with open(fdname, "rb") as fd:
+            lines = fd.read().splitlines()
+        columns = [b"Tag", b"A Part", b"B Part", b"C Part", b"F Part", b"E Part", b"D Part"]
         if len(lines) < 9:
-            logging.warn("catalog is empty! for filename: ", fdname)
+            logging.warning("catalog is empty! for filename: %s", fdname)
             return None
         colline = lines[7]
-        column_indices = []
-        for c in columns:
-            column_indices.append(colline.find(c))
-        a = np.empty([len(columns), len(lines) - 9], dtype="U132")
-        ilx = 0
-        for line in lines[9:]:
-            cix = 0
-            isx = column_indices[0]
-            for iex in column_indices[1:]:
-                s = line[isx:iex].strip()
-                if s.startswith("-"):
-                    s = a[cix, ilx - 1]
-                a[cix, ilx] = s
-                cix = cix + 1
-                isx = iex
-            s = line[isx:].strip()
-            a[cix, ilx] = s
-            ilx = ilx + 1
-        df = pd.DataFrame(a.transpose(), columns=list("TABCFED"))
+        column_indices = [colline.find(c) for c in columns]
+        rows = np.array([line for line in lines[9:] if line.strip()], dtype=bytes)
+        width = max(rows.dtype.itemsize, column_indices[-1] + 1)
+        # view as a 2D array of characters so columns are just slices
+        chars = rows.astype("S%d" % width).view("S1").reshape(len(rows), width)
+        row_index = np.arange(len(rows))
+        data = {}
+        for name, isx, iex in zip(
+            "TABCFED", column_indices, column_indices[1:] + [width]
+        ):
+            col = np.ascontiguousarray(chars[:, isx:iex]).view("S%d" % (iex - isx))
+            col = np.char.strip(col.ravel())
+            # ditto marks refer to the previous row, i.e. forward fill from last non ditto row
+            ditto = np.char.startswith(col, b"-")
+            col = col[np.maximum.accumulate(np.where(ditto, 0, row_index))]
+            categories, codes = np.unique(col, return_inverse=True)
+            data[name] = _categorical_from_codes(
+                codes.ravel(), [c.decode() for c in categories], name in _SHARED_PARTS
+            )
+        df = pd.DataFrame(data)
+        # time window as datetime64, parsed once per distinct D part
+        drange = df["D"].cat.categories.str.replace("*", "").str.split("-")
+        dstart = _parse_dates(drange.str[0])
+        dend = _parse_dates(drange.str[-1])
+        codes = df["D"].cat.codes.values
+        df["D_START"] = dstart[codes]
+        df["D_END"] = dend[codes]
         return df
 
     @staticmethod
@@ -362,30 +1296,65 @@ class DSSFile:
         """
         read full catalog from fc name and create condensed catalog on the fly
         returns data frame
+
+        The pathnames are read in a single pass keeping the first and last D part (block date)
+        for each (A, B, C, F, E) key. Each distinct D part is parsed only once.
+        The parts are categoricals and the time window is in the D column as a string
+        (START DATE - END DATE) and as datetime64 in the D_START and D_END columns
         """
-        df = pd.read_fwf(fcname, skiprows=8, colspecs=[(0, 8), (8, 15), (15, 500)])
-        df = df.dropna(how="all", axis=0)  # drop empty lines
-        df[list("ABCDEF")] = (
-            df["Record Pathname"].str.split("/", expand=True).iloc[:, 1:7]
+        dates = {}
+        ranges = {}
+        tagmax = None
+        with open(fcname, "r") as fd:
+            for _ in range(8):  # header lines, which may contain a "/" in the filename
+                next(fd, None)
+            for line in fd:
+                ix = line.find("/")
+                if ix < 0:
+                    continue
+                parts = line[ix:].rstrip().split("/")
+                if len(parts) < 8:
+                    continue
+                # reference number and optional tag, e.g. "23817  T14927"
+                tokens = line[:ix].split()
+                if len(tokens) > 1 and tokens[1][1:].isdigit():
+                    tag = int(tokens[1][1:])
+                    if tagmax is None or tag > tagmax:
+                        tagmax = tag
+                dpart = parts[4]
+                d = dates.get(dpart)
+                if d is None:
+                    d = dates[dpart] = _parse_date(dpart)
+                key = (parts[1], parts[2], parts[3], parts[6], parts[5])
+                r = ranges.get(key)
+                if r is None:
+                    ranges[key] = [d, d]
+                elif d < r[0]:
+                    r[0] = d
+                elif d > r[1]:
+                    r[1] = d
+        keys = sorted(ranges)
+        dfc = pd.DataFrame(
+            {n: _categorical([k[i] for k in keys]) for i, n in enumerate("ABCFE")}
         )
-        dfg = df.groupby(["A", "B", "C", "F", "E"])
-        df.D = pd.to_datetime(df.D, format="%d%b%Y")
-        dfmin, dfmax = dfg.min(), dfg.max()
-        tagmax = "T" + str(
-            dfmax.Tag.astype("str").str[1:].astype("int", errors="ignore").max()
+        dstart = pd.DatetimeIndex([ranges[k][0] for k in keys], dtype="datetime64[ns]")
+        dend = pd.DatetimeIndex([ranges[k][1] for k in keys], dtype="datetime64[ns]")
+        # only the distinct dates are formatted
+        distinct = list(dates.values())
+        dstr = dict(zip(distinct, _format_dates(distinct)))
+        dfc["D"] = _categorical(
+            [dstr[ranges[k][0]] + " - " + dstr[ranges[k][1]] for k in keys], shared=False
         )
-        dfc = (
-            dfmin["D"].dt.strftime("%d%b%Y").str.upper()
-            + " - "
-            + dfmax["D"].dt.strftime("%d%b%Y").str.upper()
-        )
-        dfc = dfc.reset_index()
-        dfc.insert(0, "T", tagmax)
+        dfc["D_START"] = dstart
+        dfc["D_END"] = dend
+        tag = "T" + ("" if tagmax is None else str(tagmax))
+        dfc.insert(0, "T", _categorical([tag] * len(keys), shared=False))
         return dfc
 
-    def _check_condensed_catalog_file_and_recatalog(self, condensed=True):
+    def _check_condensed_catalog_file_and_recatalog(self, condensed=True, sort=True):
         """
         check if cataloging is needed to generate the catalog files (condensed or otherwise)
+        The condensed catalog is only generated by a sorted catalog
 
         returns name of catalog file and if it was regenerated (True) or not (False)
         """
@@ -395,36 +1364,219 @@ class DSSFile:
         else:
             ext = ".dsc"
         fdname = self.fname[: self.fname.rfind(".")] + ext
-        if not os.path.exists(fdname):
-            logging.debug("NO CATALOG FOUND: Generating...")
-            self.catalog()
-            generated = True
-        else:
-            if os.path.exists(self.fname):
-                ftime = pd.to_datetime(time.ctime(os.path.getmtime(self.fname)))
-                fdtime = pd.to_datetime(time.ctime(os.path.getmtime(fdname)))
-                if ftime > fdtime:
-                    logging.debug("CATALOG FILE OLD: Generating...")
-                    self.catalog()
+        if self._is_catalog_file_stale(fdname):
+            with _lock_file(self._catalog_lock_name()):
+                # another process may have generated it while this one waited for the lock
+                if self._is_catalog_file_stale(fdname):
+                    logging.debug("CATALOG FILE MISSING OR OLD: Generating...")
+                    self._write_catalog(sort=sort or condensed)
                     generated = True
-            else:
-                logging.debug("No DSS File found. Using catalog file as is")
         #
         return fdname, generated
 
-    def read_catalog(self):
+    def _is_catalog_file_stale(self, fdname):
+        """
+        True if the catalog file fdname doesn't exist or is older than the DSS file
+        """
+        if not os.path.exists(fdname):
+            return True
+        if not os.path.exists(self.fname):
+            logging.debug("No DSS File found. Using catalog file as is")
+            return False
+        # full resolution times, a write in the same second as the catalog is still newer
+        return os.stat(self.fname).st_mtime_ns > os.stat(fdname).st_mtime_ns
+
+    def _stat(self):
+        """
+        (size, modification time) of the file or None if it doesn't exist
+        """
+        try:
+            stat = os.stat(self.fname)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _is_catalog_current(self):
+        """
+        True if the live catalog is loaded and the file has not changed since
+        """
+        return self._catalog is not None and self._catalog_stat == self._stat()
+
+    def read_catalog(self, pattern=None, sort=True):
         """
         Reads .dsd (condensed catalog) for the given dss file.
         Will run catalog if it doesn't exist or is out of date
+
+        The catalog is kept in memory and reused by later calls while the file is unchanged, apart from
+        the writes through this handle which are patched into it. Each call returns a (shallow) copy so
+        changes to the returned data frame don't change the kept catalog
+
+        Args:
+            pattern (str or DSSPath, optional): pathname /A/B/C/D/E/F/ to filter the catalog with, as for match_catalog.
+                If the catalog is out of date the parts that are plain names are passed to heclib's selective
+                catalog so only those records are cataloged (without updating the catalog files).
+                Defaults to None, i.e. all records
+            sort (bool, optional): sort the pathnames if the catalog is generated. Defaults to True.
         """
+        if pattern is not None:
+            return self._read_matching_catalog(pattern, sort)
+        if self._is_catalog_current():
+            return self._catalog.copy(deep=False)
         fdname, generated = self._check_condensed_catalog_file_and_recatalog(
-            condensed=_USE_CONDENSED
+            condensed=_USE_CONDENSED, sort=sort
         )
         if _USE_CONDENSED:
             df = DSSFile._read_catalog_dsd(fdname)
         else:
             df = DSSFile._read_catalog_dsc(fdname)
-        return df
+        self._catalog = df
+        self._catalog_stat = self._stat()
+        self._catalog_dirty = False
+        return df.copy(deep=False)
+
+    def _read_matching_catalog(self, pattern, sort=True):
+        """
+        catalog of the records matching pattern. If the catalog is out of date and the pattern has parts
+        heclib can select on, only the selected records are cataloged into temporary catalog files.
+        The selected records are kept for later patterns with the same selection until the file changes
+        """
+        cinstr = _catalog_instructions(pattern)
+        fcname = self.fname[: self.fname.rfind(".")] + ".dsc"
+        if (
+            len(cinstr) == 0
+            or self._is_catalog_current()
+            or not self._is_catalog_file_stale(fcname)
+        ):
+            return match_catalog(self.read_catalog(sort=sort), pattern)
+        stat = self._stat()
+        if self._selected_stat != stat:
+            self._selected = {}
+            self._selected_stat = stat
+        dfcat = self._selected.get(cinstr)
+        if dfcat is None:
+            base = "%s.%d.sel" % (self.fname[: self.fname.rfind(".")], os.getpid())
+            try:
+                # the records are sorted by _read_catalog_dsc so heclib doesn't need to
+                self._write_catalog(sort=False, cinstr=cinstr, base=base)
+                dfcat = DSSFile._read_catalog_dsc(base + ".dsc")
+            finally:
+                for ext in (".dsc", ".dsd", ".dsk"):
+                    if os.path.exists(base + ext):
+                        os.remove(base + ext)
+            self._selected[cinstr] = dfcat
+        return match_catalog(dfcat, pattern)
+
+    @staticmethod
+    def _block_start(date, epart):
+        """
+        start date of the block (the D part in the catalog) in which heclib stores the value at date
+        for records with E part epart. The block lengths are those of version 6 files, i.e.
+        a day up to 12MIN, a month up to 12HOUR, a year for 1DAY, a decade for 1WEEK and 1MON
+        and a century for 1YEAR. For irregular time series the E part is the block length.
+
+        A value at midnight is at 2400 of the previous day and so in the previous block
+        """
+        date = pd.Timestamp(date) - pd.Timedelta(minutes=1)
+        block = DSSFile._block_unit(epart)
+        if block == "DAY":
+            return datetime(date.year, date.month, date.day)
+        elif block == "MONTH":
+            return datetime(date.year, date.month, 1)
+        elif block == "YEAR":
+            return datetime(date.year, 1, 1)
+        elif block == "DECADE":
+            return datetime(date.year // 10 * 10, 1, 1)
+        else:
+            return datetime(date.year // 100 * 100, 1, 1)
+
+    @staticmethod
+    def _block_unit(epart):
+        """
+        block length (DAY, MONTH, YEAR, DECADE or CENTURY) of records with E part epart
+        """
+        if epart.startswith("IR-"):
+            return epart[3:]
+        n, interval = DSSFile.get_number_and_frequency_from_epart(epart)
+        if interval == "MIN":
+            return "DAY" if n < 15 else "MONTH"
+        elif interval == "HOUR":
+            return "MONTH"
+        elif interval == "DAY":
+            return "YEAR"
+        elif interval in ("WEEK", "MON"):
+            return "DECADE"
+        else:
+            return "CENTURY"
+
+    @staticmethod
+    def _next_block_start(date, epart):
+        """
+        start date of the block after the one storing the value at date. The value at that
+        date (2400 of the previous day) is the last one in the block
+        """
+        start = DSSFile._block_start(date, epart)
+        block = DSSFile._block_unit(epart)
+        if block == "DAY":
+            return start + timedelta(days=1)
+        elif block == "MONTH":
+            return (pd.Timestamp(start) + pd.offsets.MonthBegin(1)).to_pydatetime()
+        years = {"YEAR": 1, "DECADE": 10}.get(block, 100)
+        return datetime(start.year + years, 1, 1)
+
+    def _patch_catalog(self, pathname, first, last, istat, current):
+        """
+        patches the live catalog for a write to pathname of values from first to last time.
+        The live catalog is dropped if it was not current before the write or the write failed
+
+        A new record is appended to the end of the catalog and an existing one has its
+        time window extended
+        """
+        if not current or istat != 0:
+            self._catalog = None
+            return
+        parts = DSSPath.of(pathname).parts
+        epart = parts[5]
+        sdate = DSSFile._block_start(first, epart)
+        edate = DSSFile._block_start(last, epart)
+        df = self._catalog
+        cond = np.ones(len(df), dtype=bool)
+        for c, p in zip("ABCFE", [parts[1], parts[2], parts[3], parts[6], epart]):
+            cond &= _part_equals(df[c], p)
+        rows = np.flatnonzero(cond)
+        if len(rows) > 0:
+            i = rows[0]
+            sdate = min(sdate, df["D_START"].iloc[i])
+            edate = max(edate, df["D_END"].iloc[i])
+        dpart = "%s - %s" % (_format_date(sdate), _format_date(edate))
+        if len(rows) > 0:
+            df = df.copy()
+            if isinstance(df["D"].dtype, pd.CategoricalDtype):
+                if dpart not in df["D"].cat.categories:
+                    df["D"] = df["D"].cat.add_categories([dpart])
+            df.loc[df.index[i], ["D", "D_START", "D_END"]] = [
+                dpart,
+                pd.Timestamp(sdate),
+                pd.Timestamp(edate),
+            ]
+        else:
+            tag = df["T"].iloc[0] if len(df) > 0 else "T"
+            row = pd.DataFrame(
+                {
+                    "T": _categorical([tag], shared=False),
+                    "A": _categorical([parts[1]]),
+                    "B": _categorical([parts[2]]),
+                    "C": _categorical([parts[3]]),
+                    "F": _categorical([parts[6]]),
+                    "E": _categorical([epart]),
+                    "D": _categorical([dpart], shared=False),
+                    "D_START": pd.DatetimeIndex([sdate], dtype="datetime64[ns]"),
+                    "D_END": pd.DatetimeIndex([edate], dtype="datetime64[ns]"),
+                }
+            )
+            df = _concat_catalogs([df, row[df.columns]])
+        self._catalog = df
+        self._catalog_stat = self._stat()
+        self._catalog_dirty = True
 
     def get_pathnames(self, catalog_dataframe=None):
         """
@@ -436,10 +1588,8 @@ class DSSFile:
         """
         if catalog_dataframe is None:
             catalog_dataframe = self.read_catalog()
-        pdf = catalog_dataframe.iloc[:, [1, 2, 3, 6, 5, 4]]
-        return pdf.apply(
-            func=lambda x: "/" + ("/".join(list(x.values))) + "/", axis=1
-        ).values.tolist()
+        parts = [_part_values(catalog_dataframe.iloc[:, i]) for i in [1, 2, 3, 6, 5, 4]]
+        return ["/" + "/".join(p) + "/" for p in zip(*parts)]
 
     def num_values_in_interval(sdstr, edstr, istr):
         """
@@ -447,7 +1597,7 @@ class DSSFile:
         string
         """
         td = DSSFile._get_timedelta_for_interval(istr)
-        return int((parse(edstr) - parse(sdstr)) / td) + 1
+        return int((_parse_date(edstr) - _parse_date(sdstr)) / td) + 1
 
     def julian_day(self, date):
         """
@@ -465,13 +1615,13 @@ class DSSFile:
         return itime
 
     def parse_pathname_epart(self, pathname):
-        return pathname.split("/")[1:7][4]
+        return DSSPath.of(pathname).epart
 
     def _number_between(startDateStr, endDateStr, delta=timedelta(days=1)):
         """
         This is just a guess at number of values to be read so going over is ok.
         """
-        return round((parse(endDateStr) - parse(startDateStr)) / delta + 1)
+        return round((_parse_date(endDateStr) - _parse_date(startDateStr)) / delta + 1)
 
     def _get_timedelta_for_interval(interval):
         """
@@ -497,7 +1647,7 @@ class DSSFile:
         return td
 
     def _pad_to_end_of_block(self, endDateStr, interval):
-        edate = parse(endDateStr)
+        edate = _parse_date(endDateStr)
         if interval.find("MON") >= 0 or interval.find("YEAR") >= 0:
             edate = datetime((edate.year // 10 + 1) * 10, 1, 1)
         elif interval.find("DAY") >= 0:
@@ -509,7 +1659,7 @@ class DSSFile:
                 edate = datetime(edate.year, edate.month + 1, 1)
         else:
             edate = edate + timedelta(days=1)
-        return edate.strftime(DATE_FMT_STR).upper()
+        return _format_date(edate)
 
     def _get_istat_for_zrrtsxd(self, istat):
         """
@@ -561,9 +1711,10 @@ class DSSFile:
         parse times based on pathname or startDateStr and endDateStr
         start date and end dates may be padded to include a larger interval
         """
-        interval = self.parse_pathname_epart(pathname)
+        path = DSSPath.of(pathname)
+        interval = path.epart
         if startDateStr is None or endDateStr is None:
-            twstr = pathname.split("/")[4]
+            twstr = path.dpart
             if twstr.find("-") < 0:
                 if len(twstr.strip()) == 0:
                     raise Exception("No start date or end date and twstr is " + twstr)
@@ -577,28 +1728,33 @@ class DSSFile:
                 endDateStr = self._pad_to_end_of_block(endDateStr, interval)
         return startDateStr, endDateStr
 
-    def read_rts(self, pathname, startDateStr=None, endDateStr=None):
+    def read_rts(self, pathname, startDateStr=None, endDateStr=None, keep_sentinels=False):
         """
         read regular time series for pathname.
         if pathname D part contains a time window (START DATE "-" END DATE) and
         either start or end date is None it uses that to define start and end date
+        and the data is trimmed to the first (last) value that is not missing
+
+        Missing values (MISSING_VALUE and MISSING_RECORD) are NaN unless keep_sentinels is True,
+        in which case the values are returned as read from the file
         """
+        self._reopen_if_inherited()
         opened_already = self.isopen
         try:
             if not opened_already:
                 self.open()
-            if pathname:
-                pathname = pathname.upper()
-            interval = self.parse_pathname_epart(pathname)
+            path = DSSPath.of(pathname)
+            pathname = path.pathname
+            interval = path.epart
             trim_first = startDateStr is None
             trim_last = endDateStr is None
             startDateStr, endDateStr = self._parse_times(
-                pathname, startDateStr, endDateStr
+                path, startDateStr, endDateStr
             )
             nvals = DSSFile.num_values_in_interval(startDateStr, endDateStr, interval)
-            sdate = parse(startDateStr)
-            cdate = sdate.date().strftime("%d%b%Y").upper()
-            ctime = "".join(sdate.time().isoformat().split(":")[:2])
+            sdate = _parse_date(startDateStr)
+            cdate = _format_date(sdate)
+            ctime = _format_time(sdate)
             # PERF: could be np.empty if all initialized
             dvalues = np.zeros(nvals, "d")
             nvals, cunits, ctype, iofset, istat = pyheclib.hec_zrrtsxd(
@@ -610,53 +1766,482 @@ class DSSFile:
             self._respond_to_istat_state(istat)
 
             # FIXME: deal with non-zero iofset for period data,i.e. else part of if stmt below
-            nfreq, freqstr = DSSFile.get_number_and_frequency_from_epart(interval)
-            freqstr = "%d%s" % (nfreq, DSSFile.NAME_FREQ_MAP[freqstr])
-            freqoffset = DSSFile.get_freq_from_epart(interval)
-            if ctype.startswith("PER"):  # for period values, shift back 1
-                # - pd.tseries.frequencies.to_offset(freqoffset)
-                sp = pd.Period(startDateStr, freq=freqstr)
-                dindex = pd.period_range(sp, periods=nvals, freq=freqstr).shift(-1)
-            else:
-                startDateWithOffset = parse(startDateStr)
-                if (
-                    iofset != 0
-                ):  # offsets are always from the end of the period, e.g. for day, rewind by a day and then add offset
-                    startDateWithOffset = (
-                        parse(startDateStr) - freqoffset + timedelta(minutes=iofset)
-                    )
-                dindex = pd.date_range(
-                    startDateWithOffset, periods=nvals, freq=freqoffset
+            # a view so each result has its own index object over the shared values
+            dindex = _time_index(
+                sdate, interval, iofset, nvals, ctype.startswith("PER")
+            ).view()
+            values = dvalues[:nvals]
+            missing = None
+            if not keep_sentinels:
+                # cleanup missing values --> NAN in place in the buffer
+                missing = (values == DSSFile.MISSING_VALUE) | (
+                    values == DSSFile.MISSING_RECORD
                 )
-            df1 = pd.DataFrame(data=dvalues, index=dindex, columns=[pathname])
-            # cleanup missing values --> NAN, trim dataset and units and period type strings
-            df1.replace(
-                [DSSFile.MISSING_VALUE, DSSFile.MISSING_RECORD],
-                [np.nan, np.nan],
-                inplace=True,
-            )
+                values[missing] = np.nan
+            # trim dataset to the first and last values that are not missing, if any
+            lo, hi = 0, nvals
             if trim_first or trim_last:
+                if missing is None:
+                    missing = (values == DSSFile.MISSING_VALUE) | (
+                        values == DSSFile.MISSING_RECORD
+                    )
+                # values written as nan are missing too
+                missing |= np.isnan(values)
+                valid = np.flatnonzero(~missing)
+                if len(valid) > 0:
+                    if trim_first:
+                        lo = valid[0]
+                    if trim_last:
+                        hi = valid[-1] + 1
+            if lo > 0 or hi < nvals:
+                dindex = dindex[lo:hi]
+            # a view of the buffer, not a copy
+            df1 = pd.DataFrame(
+                data=values[lo:hi].reshape(-1, 1),
+                index=dindex,
+                columns=[pathname],
+                copy=False,
+            )
+            return DSSData(data=df1, units=cunits.strip(), period_type=ctype.strip())
+        finally:
+            if not opened_already:
+                self.close()
+
+    def _rts_time_index(self, pathname, startDateStr, nvals):
+        """
+        time index of nvals values of the regular time series pathname from startDateStr, as read_rts
+        returns it. Only the first values are read, for the period type and offset of the record
+        """
+        self._reopen_if_inherited()
+        opened_already = self.isopen
+        try:
+            if not opened_already:
+                self.open()
+            path = DSSPath.of(pathname)
+            sdate = _parse_date(startDateStr)
+            # two values as the first can be the last of the block before the record, e.g. at the
+            # start of the D part, which reads as no data without a period type
+            dvalues = np.zeros(min(nvals, 2), "d")
+            _, _, ctype, iofset, istat = pyheclib.hec_zrrtsxd(
+                self.ifltab, path.pathname, _format_date(sdate), _format_time(sdate), dvalues
+            )
+            self._respond_to_istat_state(istat)
+            return _time_index(sdate, path.epart, iofset, nvals, ctype.startswith("PER")).view()
+        finally:
+            if not opened_already:
+                self.close()
+
+    def read_rts_aggregated(
+        self, pathname, to="1DAY", how="mean", startDateStr=None, endDateStr=None
+    ):
+        """
+        read regular time series for pathname aggregated to a longer interval, e.g. daily means
+        of 15MIN values.
+
+        The record is read a block at a time and each block is reduced as it is read, so only the
+        aggregated values are kept. The result is the same as resampling the data from read_rts,
+        i.e. read_rts(...).data.resample(freq).agg(how), skipping missing values
+
+        Args:
+            pathname (str or DSSPath): pathname, the time window is taken from the D part as for read_rts
+            to (str, optional): E part of the aggregated values, 1DAY, 1MON, 1YEAR or a number of minutes
+                or hours that divides a day. Defaults to "1DAY".
+            how (str, optional): "mean", "min", "max" or "sum". Defaults to "mean".
+            startDateStr (str, optional): start of time window as for read_rts
+            endDateStr (str, optional): end of time window as for read_rts
+
+        Returns:
+            DSSData: data indexed by period (period values) or start of interval (instantaneous values), units
+            and period type of the aggregate (PER-AVER, PER-CUM, PER-MIN or PER-MAX)
+        """
+        if how not in _AGGREGATE_PERIOD_TYPES:
+            raise ValueError(
+                "how should be one of %s, not %s" % (list(_AGGREGATE_PERIOD_TYPES), how)
+            )
+        self._reopen_if_inherited()
+        opened_already = self.isopen
+        try:
+            if not opened_already:
+                self.open()
+            path = DSSPath.of(pathname)
+            interval = path.epart
+            freqoffset = path.freq
+            trim_first = startDateStr is None
+            trim_last = endDateStr is None
+            startDateStr, endDateStr = self._parse_times(
+                path, startDateStr, endDateStr
+            )
+            sdate = pd.Timestamp(_parse_date(startDateStr))
+            edate = pd.Timestamp(_parse_date(endDateStr))
+            if sdate > edate:
+                raise ValueError("Empty time window %s - %s" % (startDateStr, endDateStr))
+            cunits = ctype = ""
+            iofset = 0
+            partials = []
+            for grid, values, bunits, btype, boffset in self._iter_rts_blocks(
+                path, sdate, edate
+            ):
+                last = grid[-1]
+                # blocks without data have no type, they only add empty intervals
+                if len(btype.strip()) == 0:
+                    continue
+                cunits, ctype, iofset = bunits, btype, boffset
+                times = _series_times(grid, freqoffset, ctype.startswith("PER"), iofset)
+                partials.append(_reduce_bins(_time_bins(times, to)[0], values))
+            # every interval from the first to the last value in the time window
+            ends = _series_times(
+                np.array([sdate, last], dtype="datetime64[ns]"),
+                freqoffset,
+                ctype.startswith("PER"),
+                iofset,
+            )
+            ends, to_times = _time_bins(ends, to)
+            codes = np.arange(ends[0], ends[1] + 1)
+            counts = np.zeros(len(codes), np.int64)
+            totals = np.zeros(len(codes))
+            mins = np.full(len(codes), np.nan)
+            maxs = np.full(len(codes), np.nan)
+            for bcodes, bcounts, btotals, bmins, bmaxs in partials:
+                i = bcodes - ends[0]
+                counts[i] += bcounts
+                totals[i] += btotals
+                mins[i] = np.fmin(mins[i], bmins)
+                maxs[i] = np.fmax(maxs[i], bmaxs)
+            # trim to intervals with values as read_rts does
+            lo, hi = 0, len(codes)
+            nonempty = np.flatnonzero(counts > 0)
+            if len(nonempty) > 0:
                 if trim_first:
-                    first_index = df1.first_valid_index()
-                else:
-                    first_index = df1.index[0]
+                    lo = nonempty[0]
                 if trim_last:
-                    last_index = df1.last_valid_index()
-                else:
-                    last_index = df1.index[-1]
-                df1 = df1[first_index:last_index]
+                    hi = nonempty[-1] + 1
+            if how == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    aggregated = np.where(counts > 0, totals / counts, np.nan)
             else:
-                df1 = df1
-            return DSSData(data=df1, units=cunits.strip(), period_type=ctype.strip())
+                aggregated = {"sum": totals, "min": mins, "max": maxs}[how]
+            tooffset, tofreqstr = _epart_freq(to)
+            index = pd.DatetimeIndex(to_times(codes[lo:hi]))
+            if ctype.startswith("PER"):
+                index = index.to_period(tofreqstr)
+            elif len(index) > 2:
+                index.freq = tooffset
+            df = pd.DataFrame(
+                data=aggregated[lo:hi].reshape(-1, 1),
+                index=index,
+                columns=[path.with_parts(epart=to).pathname],
+                copy=False,
+            )
+            return DSSData(
+                data=df, units=cunits.strip(), period_type=_AGGREGATE_PERIOD_TYPES[how]
+            )
+        finally:
+            if not opened_already:
+                self.close()
+
+    def exists(self, pathnames):
+        """
+        whether each of the records pathnames exists. Records are checked with heclib's hashed pathname
+        lookup in a single call, so each check is a hash table lookup rather than a catalog read.
+
+        A pathname with a time window as D part, e.g. from the condensed catalog, exists if its first
+        block does. A pathname with a blank D part is looked up in the catalog by its other parts
+
+        Args:
+            pathnames (list): pathnames (str or DSSPath) to check
+
+        Returns:
+            np.ndarray: bool array, True for the pathnames that exist
+        """
+        self._reopen_if_inherited()
+        opened_already = self.isopen
+        try:
+            if not opened_already:
+                self.open()
+            paths = [DSSPath.of(p) for p in pathnames]
+            found = np.zeros(len(paths), dtype=bool)
+            dated, blocks, undated = [], [], []
+            for i, path in enumerate(paths):
+                dpart = path.dpart.split("-")[0].strip()
+                if len(dpart) > 0:
+                    dated.append(i)
+                    blocks.append(path.with_parts(dpart=dpart).pathname)
+                else:
+                    undated.append(i)
+            if len(blocks) > 0:
+                lfound = np.zeros(len(blocks), "i")
+                pyheclib.hec_zcheckn(self.ifltab, "\n".join(blocks), lfound)
+                found[dated] = lfound != 0
+            if len(undated) > 0:
+                dfcat = self.read_catalog()
+                records = set(zip(*[_part_values(dfcat[c]) for c in "ABCEF"]))
+                for i in undated:
+                    p = paths[i].parts
+                    found[i] = (p[1], p[2], p[3], p[5], p[6]) in records
+            return found
+        finally:
+            if not opened_already:
+                self.close()
+
+    def _data_addresses(self, pathnames):
+        """
+        file addresses (words) of the data of the records pathnames, -1 for records not found.
+        For a pathname with a time window as D part, e.g. from the condensed catalog, it is the
+        address of the first block
+        """
+        self._reopen_if_inherited()
+        addresses = np.full(len(pathnames), -1, dtype=np.int64)
+        for i, pathname in enumerate(pathnames):
+            path = DSSPath.of(pathname)
+            dpart = path.dpart.split("-")[0].strip()
+            if len(dpart) > 0:
+                addresses[i] = pyheclib.hec_zdataddress(
+                    self.ifltab, path.with_parts(dpart=dpart).pathname
+                )
+        return addresses
+
+    def _iter_rts_blocks(self, path, sdate, edate):
+        """
+        reads the regular time series path from sdate to edate one block at a time. Yields
+        (times, values, units, type, offset) for each block, with the times of the values
+        (datetime64[ns], not adjusted for period values or offset) and missing values as nan.
+        The file should be open
+        """
+        freqoffset = path.freq
+        t = pd.Timestamp(sdate)
+        while t <= edate:
+            grid = _time_grid(
+                t, min(pd.Timestamp(DSSFile._next_block_start(t, path.epart)), edate), freqoffset
+            )
+            dvalues = np.zeros(len(grid), "d")
+            nvals, cunits, ctype, iofset, istat = pyheclib.hec_zrrtsxd(
+                self.ifltab, path.pathname, _format_date(t), _format_time(t), dvalues
+            )
+            self._respond_to_istat_state(istat)
+            values = dvalues[:nvals]
+            values[
+                (values == DSSFile.MISSING_VALUE) | (values == DSSFile.MISSING_RECORD)
+            ] = np.nan
+            yield grid[:nvals], values, cunits, ctype, iofset
+            t = pd.Timestamp(grid[-1]) + freqoffset
+
+    def read_preview(
+        self, pathname, max_points=2000, method="minmax", startDateStr=None, endDateStr=None
+    ):
+        """
+        read the time series pathname decimated to at most about max_points values for plotting.
+
+        Regular time series are read a block at a time and decimated as they are read, so only a block
+        and the selected values are kept. Irregular time series are read whole and then decimated
+
+        Args:
+            pathname (str or DSSPath): pathname, the time window is taken from the D part as for read_rts
+            max_points (int, optional): number of values to decimate to. Defaults to 2000.
+            method (str, optional): "minmax" for the minimum and maximum value in each of max_points/2
+                intervals of the time window (keeps the peaks) or "lttb" for the value of each of max_points
+                intervals that best keeps the shape (largest triangle three buckets). Defaults to "minmax".
+            startDateStr (str, optional): start of time window as for read_rts
+            endDateStr (str, optional): end of time window as for read_rts
+
+        Returns:
+            DSSData: selected values indexed as read_rts (read_its) indexes them, units and period type
+        """
+        if method not in _PREVIEW_METHODS:
+            raise ValueError(
+                "method should be one of %s, not %s" % (list(_PREVIEW_METHODS), method)
+            )
+        nbuckets = max(max_points // 2 if method == "minmax" else max_points - 2, 1)
+        self._reopen_if_inherited()
+        opened_already = self.isopen
+        try:
+            if not opened_already:
+                self.open()
+            path = DSSPath.of(pathname)
+            if path.is_irregular:
+                result = self.read_its(path, startDateStr, endDateStr)
+                df = result.data
+                times = df.index.values.astype("datetime64[ns]")
+                values = df.iloc[:, 0].values.astype("d")
+                if len(times) > 0:
+                    blocks = [(times, times, values)]
+                    times, values = _PREVIEW_METHODS[method](
+                        _preview_buckets(blocks, times[0], times[-1], nbuckets)
+                    )
+                return result._replace(
+                    data=pd.DataFrame(values, index=pd.DatetimeIndex(times), columns=df.columns)
+                )
+            startDateStr, endDateStr = self._parse_times(path, startDateStr, endDateStr)
+            sdate = _parse_date(startDateStr)
+            edate = _parse_date(endDateStr)
+            info = {}
+
+            def blocks():
+                for grid, values, cunits, ctype, iofset in self._iter_rts_blocks(
+                    path, sdate, edate
+                ):
+                    if len(ctype.strip()) == 0:
+                        continue
+                    info.update(units=cunits, type=ctype)
+                    yield grid, _series_times(
+                        grid, path.freq, ctype.startswith("PER"), iofset
+                    ), values
+
+            times, values = _PREVIEW_METHODS[method](
+                _preview_buckets(blocks(), sdate, edate, nbuckets)
+            )
+            ctype = info.get("type", "")
+            index = pd.DatetimeIndex(times)
+            if ctype.startswith("PER"):
+                index = index.to_period(path.freqstr)
+            df = pd.DataFrame(values, index=index, columns=[path.pathname])
+            return DSSData(
+                data=df, units=info.get("units", "").strip(), period_type=ctype.strip()
+            )
+        finally:
+            if not opened_already:
+                self.close()
+
+    def read_previews(
+        self, pathnames, max_points=2000, method="minmax", startDateStr=None, endDateStr=None
+    ):
+        """
+        read_preview for each of pathnames, keeping the file open in between
+
+        Returns:
+            a generator of DSSData for pathnames in order
+        """
+        self._reopen_if_inherited()
+        opened_already = self.isopen
+        try:
+            if not opened_already:
+                self.open()
+            for pathname in pathnames:
+                yield self.read_preview(pathname, max_points, method, startDateStr, endDateStr)
         finally:
             if not opened_already:
                 self.close()
 
+    def head(self, pathname, n=10):
+        """
+        first values of the time series pathname, starting at its first value that is not missing.
+        The D part of pathname is ignored, the record's time window comes from the catalog.
+
+        Only the first blocks are read, starting with one block and doubling the time window until it
+        has enough values
+
+        Args:
+            pathname (str or DSSPath): pathname of the regular or irregular time series
+            n (int or timedelta, optional): number of values or time span (e.g. "7D") from the first
+                value. Defaults to 10.
+
+        Returns:
+            DSSData: data, units and period type as read_rts (read_its) returns them
+        """
+        return self._read_ends(pathname, n, last=False)
+
+    def tail(self, pathname, n=10):
+        """
+        last values of the time series pathname, ending at its last value that is not missing.
+        The D part of pathname is ignored, the record's time window comes from the catalog.
+
+        Only the last blocks are read, starting with one block and doubling the time window until it
+        has enough values, e.g. the last 7 days of a 15MIN record decades long read one or two
+        monthly blocks
+
+        Args:
+            pathname (str or DSSPath): pathname of the regular or irregular time series
+            n (int or timedelta, optional): number of values or time span (e.g. "7D") to the last
+                value. Defaults to 10.
+
+        Returns:
+            DSSData: data, units and period type as read_rts (read_its) returns them
+        """
+        return self._read_ends(pathname, n, last=True)
+
+    def _record_blocks(self, path):
+        """
+        start dates of the first and last block of the record path from the catalog, ignoring the D part
+        """
+        df = self.read_catalog()
+        cond = np.ones(len(df), dtype=bool)
+        for c, p in zip("ABCFE", [path.apart, path.bpart, path.cpart, path.fpart, path.epart]):
+            cond &= _part_equals(df[c], p)
+        rows = np.flatnonzero(cond)
+        if len(rows) == 0:
+            raise Exception("No record found for " + path.pathname)
+        return df["D_START"].iloc[rows].min(), df["D_END"].iloc[rows].max()
+
+    def _read_ends(self, pathname, n, last):
+        """
+        reads the first (last) n values or values within timedelta n of the record pathname, see head and tail
+        """
+        if not isinstance(n, (int, np.integer)):
+            n = pd.Timedelta(n)
+        path = DSSPath.of(pathname)
+        first_block, last_block = self._record_blocks(path)
+        # blocks start after 2400 of the day before their start date
+        after = pd.Timedelta(minutes=1)
+        record_start = pd.Timestamp(first_block)
+        record_end = pd.Timestamp(DSSFile._next_block_start(last_block + after, path.epart))
+        span = (
+            pd.Timestamp(DSSFile._next_block_start(first_block + after, path.epart))
+            - record_start
+        )
+        if last:
+            span = record_end - pd.Timestamp(last_block)
+        path = path.with_parts(
+            dpart="%s - %s" % (_format_date(first_block), _format_date(last_block))
+        )
+        nblocks = 1
+        while True:
+            start, end = record_start, record_end
+            if last:
+                start = max(record_start, record_end - span * nblocks)
+            else:
+                end = min(record_end, record_start + span * nblocks)
+            whole = start == record_start and end == record_end
+            result = _read_ts(
+                self,
+                path,
+                "%s %s" % (_format_date(start), _format_time(start)),
+                "%s %s" % (_format_date(end), _format_time(end)),
+            )
+            df = result.data
+            # trim missing values at the ends of the record as for a read of the whole record
+            valid = np.flatnonzero(df.iloc[:, 0].notna().values)
+            if len(valid) > 0:
+                if last or whole:
+                    df = df.iloc[: valid[-1] + 1]
+                if not last or whole:
+                    df = df.iloc[valid[0] :]
+            times = df.index
+            if isinstance(times, pd.PeriodIndex):
+                times = times.to_timestamp()
+            if isinstance(n, pd.Timedelta):
+                if last:
+                    enough = len(valid) > 0 and times[0] <= times[-1] - n
+                    selected = df[times > times[-1] - n] if len(df) > 0 else df
+                else:
+                    enough = len(valid) > 0 and times[-1] >= times[0] + n
+                    selected = df[times < times[0] + n] if len(df) > 0 else df
+            else:
+                enough = len(valid) > 0 and len(df) >= n
+                selected = df.iloc[max(len(df) - n, 0) :] if last else df.iloc[:n]
+            if enough or whole:
+                return DSSData(
+                    data=selected, units=result.units, period_type=result.period_type
+                )
+            nblocks *= 2
+
     def get_epart_from_freq(freq):
-        if freq.name == "ME":
+        if freq.name in ("ME", "MS"):
             freq_name = "M"
         elif freq.name == "T":
             freq_name = "min"
+        elif freq.name in ("YS-JAN", "YE-DEC", "Y-DEC", "AS-JAN"):
+            freq_name = "A-DEC"
+        elif freq.name.startswith("W"):
+            freq_name = "W"
         else:
             freq_name = freq.name
         return "%d%s" % (freq.n, DSSFile.FREQ_NAME_MAP[freq_name])
@@ -688,11 +2273,11 @@ class DSSFile:
         The time series is passed in as a pandas DataFrame
         and associated units and types of length no greater than 8.
         """
-        if pathname:
-            pathname = pathname.upper()
-        parts = pathname.split("/")
-        parts[5] = DSSFile.get_epart_from_freq(df.index.freq)
-        pathname = "/".join(parts)
+        self._reopen_if_inherited()
+        path = DSSPath.of(pathname).with_parts(
+            epart=DSSFile.get_epart_from_freq(df.index.freq)
+        )
+        pathname = path.pathname
         if isinstance(df.index, pd.PeriodIndex):
             if ctype.startswith("PER"):  # for period values...
                 sp = df.index.shift(1).to_timestamp()[
@@ -707,65 +2292,162 @@ class DSSFile:
             df.iloc[:, 0].values if isinstance(df, pd.DataFrame) else df.iloc[:].values
         )
         values = np.ascontiguousarray(values, dtype="d")
+        current = self._is_catalog_current()
         istat = pyheclib.hec_zsrtsxd(
             self.ifltab,
             pathname,
-            sp.strftime("%d%b%Y").upper(),
-            sp.round(freq="min").strftime("%H%M"),
+            _format_date(sp),
+            _format_time(sp.round(freq="min")),
             values,
             cunits[:8],
             ctype[:8],
         )
         self._respond_to_istat_state(istat)
+        if isinstance(df.index, pd.PeriodIndex):
+            times = df.index.shift(1).to_timestamp()
+        else:
+            times = df.index
+        self._patch_catalog(pathname, times[0], times[-1], istat, current)
 
     def read_its(
-        self, pathname, startDateStr=None, endDateStr=None, guess_vals_per_block=10000
+        self, pathname, startDateStr=None, endDateStr=None, guess_vals_per_block=None
     ):
         """
         reads the entire irregular time series record. The timewindow is derived
         from the D-PART of the pathname so make sure to read that from the catalog
         before calling this function
+
+        The values are read into a buffer sized from the number of values in the blocks of the
+        record, or guess_vals_per_block values a block if given. A buffer that fills up is grown
+        and the read resumed from the last value read
         """
-        if pathname:
-            pathname = pathname.upper()
-        epart = self.parse_pathname_epart(pathname)
-        startDateStr, endDateStr = self._parse_times(pathname, startDateStr, endDateStr)
-        startDateStr = (
-            pd.to_datetime(startDateStr).floor("1D").strftime("%d%b%Y").upper()
-        )  # round down
-        endDateStr = (
-            pd.to_datetime(endDateStr).ceil("1D").strftime("%d%b%Y").upper()
-        )  # round up
-        juls, istat = pyheclib.hec_datjul(startDateStr)
-        jule, istat = pyheclib.hec_datjul(endDateStr)
-        ietime = istime = 0
-        # guess how many values to be read based on e part approximation
-        ktvals = DSSFile._number_between(
-            startDateStr, endDateStr, DSSFile._get_timedelta_for_interval(epart)
+        self._reopen_if_inherited()
+        path = DSSPath.of(pathname)
+        times, values, cunits, ctype = self._read_its_values(
+            path, startDateStr, endDateStr, guess_vals_per_block
         )
-        ktvals = guess_vals_per_block * int(ktvals)
-        kdvals = ktvals
-        itimes = np.zeros(ktvals, "i")
-        dvalues = np.zeros(kdvals, "d")
-        inflag = 0  # Retrieve both values preceding and following time window in addtion to time window
-        nvals, ibdate, cunits, ctype, istat = pyheclib.hec_zritsxd(
-            self.ifltab, pathname, juls, istime, jule, ietime, itimes, dvalues, inflag
+        df = pd.DataFrame(
+            values, index=pd.DatetimeIndex(times), columns=[path.pathname], copy=False
         )
+        return DSSData(data=df, units=cunits.strip(), period_type=ctype.strip())
 
-        self._respond_to_istat_state(istat)
-        if nvals == ktvals:
-            raise Exception(
-                "More values than guessed! %d. Call with guess_vals_per_block > 10000 "
-                % ktvals
+    def _its_buffers(self, n):
+        """
+        (itimes, dvalues) scratch arrays of length n for irregular reads, reused between reads and
+        grown (at least doubled) when too small, up to _ITS_BUFFER_LENGTH. Longer arrays are not kept
+        """
+        if n > _ITS_BUFFER_LENGTH:
+            return np.zeros(n, "i"), np.zeros(n, "d")
+        if self._its_itimes is None or len(self._its_itimes) < n:
+            size = max(n, 0 if self._its_itimes is None else 2 * len(self._its_itimes))
+            size = min(size, _ITS_BUFFER_LENGTH)
+            self._its_itimes = np.zeros(size, "i")
+            self._its_dvalues = np.zeros(size, "d")
+        return self._its_itimes[:n], self._its_dvalues[:n]
+
+    def _read_its_values(self, path, startDateStr, endDateStr, guess_vals_per_block=None):
+        """
+        reads the irregular time series path into (times as datetime64[ns], values, units, type)
+        through the scratch buffers. The file should be open
+        """
+        startDateStr, endDateStr = self._parse_times(path, startDateStr, endDateStr)
+        juls, jule, blocks = _its_window(startDateStr, endDateStr, path.epart)
+        if guess_vals_per_block is None:
+            ktvals = sum(
+                max(pyheclib.hec_znvals(self.ifltab, path.with_parts(dpart=b).pathname), 0)
+                for b in blocks
             )
-        base_date = parse("31DEC1899") + timedelta(days=ibdate)
-        df = pd.DataFrame(
-            dvalues[:nvals],
-            index=base_date + DSSFile.timedelta_minutes(itimes[:nvals]),
-            columns=[pathname],
+        else:
+            ktvals = guess_vals_per_block * len(blocks)
+        # room for the values preceding and following the window and one more to tell a full buffer
+        ktvals = ktvals + 3
+        ietime = istime = 0
+        inflag = 0  # Retrieve both values preceding and following time window in addtion to time window
+        chunks = []
+        last = None  # minutes since the julian base of the last value read
+        while True:
+            itimes, dvalues = self._its_buffers(ktvals)
+            nvals, ibdate, cunits, ctype, istat = pyheclib.hec_zritsxd(
+                self.ifltab, path.pathname, juls, istime, jule, ietime, itimes, dvalues, inflag
+            )
+            self._respond_to_istat_state(istat)
+            minutes = ibdate * 1440 + itimes[:nvals].astype(np.int64)
+            keep = slice(None) if last is None else minutes > last
+            chunks.append(
+                (
+                    _julian_minutes_to_datetime64(ibdate, itimes[:nvals][keep]),
+                    dvalues[:nvals][keep].copy(),
+                )
+            )
+            if nvals < ktvals:
+                break
+            # buffer is full, grow it and read on from the last value
+            last = int(minutes[-1])
+            juls, istime = divmod(last, 1440)
+            ktvals = 2 * ktvals
+        if len(chunks) == 1:
+            times, values = chunks[0]
+        else:
+            times = np.concatenate([c[0] for c in chunks])
+            values = np.concatenate([c[1] for c in chunks])
+        return times, values, cunits, ctype
+
+    def read_its_many(
+        self,
+        pathnames,
+        startDateStr=None,
+        endDateStr=None,
+        as_dict=False,
+        guess_vals_per_block=None,
+    ):
+        """
+        reads many irregular time series. Time windows are converted once for all records with the same
+        window and the values are read through buffers kept between reads.
+
+        Args:
+            pathnames (list): pathnames (str or DSSPath), the time window is taken from the D part of each
+                unless startDateStr and endDateStr are given, as for read_its
+            startDateStr (str, optional): start of time window for all pathnames
+            endDateStr (str, optional): end of time window for all pathnames
+            as_dict (bool, optional): return a dict instead of a data frame. Defaults to False.
+            guess_vals_per_block (int, optional): as for read_its. Defaults to None, the number of values
+                in the records
+
+        Returns:
+            pd.DataFrame: long format with columns pathname, time, value, units and period_type, or if as_dict
+            dict: pathname to (times, values) arrays
+        """
+        self._reopen_if_inherited()
+        opened_already = self.isopen
+        try:
+            if not opened_already:
+                self.open()
+            paths = [DSSPath.of(p) for p in pathnames]
+            results = [
+                self._read_its_values(p, startDateStr, endDateStr, guess_vals_per_block)
+                for p in paths
+            ]
+        finally:
+            if not opened_already:
+                self.close()
+        if as_dict:
+            return {p.pathname: (r[0], r[1]) for p, r in zip(paths, results)}
+        lengths = [len(r[0]) for r in results]
+
+        def repeated(values):
+            return _categorical(np.repeat(np.array(values, dtype=object), lengths), shared=False)
+
+        return pd.DataFrame(
+            {
+                "pathname": repeated([p.pathname for p in paths]),
+                "time": np.concatenate(
+                    [r[0] for r in results] + [np.array([], dtype="datetime64[ns]")]
+                ),
+                "value": np.concatenate([r[1] for r in results] + [np.array([], "d")]),
+                "units": repeated([r[2].strip() for r in results]),
+                "period_type": repeated([r[3].strip() for r in results]),
+            }
         )
-        return DSSData(data=df, units=cunits.strip(), period_type=ctype.strip())
-        # return nvals, dvalues, itimes, base_date, cunits, ctype
 
     def write_its(self, pathname, df, cunits, ctype, interval=None):
         """
@@ -780,9 +2462,74 @@ class DSSFile:
         Uses the provided pandas.DataFrame df index (time) and values
         and also stores the units (cunits) and type (ctype)
         """
-        if pathname:
-            pathname = pathname.upper()
-        parts = pathname.split("/")
+        # values are either the first column in the pandas DataFrame or should be a pandas Series
+        values = (
+            df.iloc[:, 0].values if isinstance(df, pd.DataFrame) else df.iloc[:].values
+        )
+        self.write_its_arrays(pathname, df.index.values, values, cunits, ctype, interval)
+
+    def write_its_many(self, data, cunits, ctype, interval=None):
+        """
+        writes many irregular time series, as write_its for each one
+
+        Args:
+            data (dict or pd.DataFrame): pathname to data frame (or series) as for write_its or a long format
+                data frame with columns pathname, time and value as read_its_many returns
+            cunits (str): units of all the time series
+            ctype (str): type of all the time series, e.g. INST-VAL
+            interval (str, optional): E part (block size) as for write_its
+        """
+        self._reopen_if_inherited()
+        if isinstance(data, pd.DataFrame):
+            codes, pathnames = pd.factorize(data["pathname"])
+            times = data["time"].values
+            values = data["value"].values
+            order = np.lexsort((times, codes))
+            starts = np.flatnonzero(np.diff(codes[order])) + 1
+            items = zip(
+                pathnames[codes[order[np.concatenate(([0], starts))]]]
+                if len(order) > 0
+                else [],
+                np.split(times[order], starts),
+                np.split(values[order], starts),
+            )
+        else:
+            items = (
+                (
+                    p,
+                    df.index.values,
+                    df.iloc[:, 0].values if isinstance(df, pd.DataFrame) else df.values,
+                )
+                for p, df in data.items()
+            )
+        for pathname, times, values in items:
+            self.write_its_arrays(pathname, times, values, cunits, ctype, interval)
+
+    def write_its_arrays(self, pathname, times, values, cunits, ctype, interval=None):
+        """
+        writes the irregular time series of values at times, as write_its but from arrays without pandas.
+        The times are converted to minutes since the base date with integer arithmetic
+
+        Args:
+            pathname (str): pathname, the D part is the time window as for write_its
+            times (array): datetime64 times in increasing order
+            values (array): values at times
+            cunits (str): units
+            ctype (str): type, e.g. INST-VAL
+            interval (str, optional): E part (block size) as for write_its
+
+        Raises:
+            ValueError: if the arrays differ in length, a time is missing (NaT) or too far from the
+                base date to store
+        """
+        self._reopen_if_inherited()
+        times = np.asarray(times)
+        values = np.ascontiguousarray(values, "d")
+        if len(times) != len(values):
+            raise ValueError(
+                "%d times for %d values for %s" % (len(times), len(values), pathname)
+            )
+        parts = list(DSSPath.of(pathname).parts)
         # parts[5]=DSSFile.FREQ_EPART_MAP[df.index.freq]
         if interval:
             parts[5] = interval
@@ -793,31 +2540,28 @@ class DSSFile:
                 )
         epart = parts[5]
         if len(parts[4]) == 0:
-            startDateStr = (
-                (df.index[0] - pd.offsets.YearBegin(1)).strftime("%d%b%Y").upper()
-            )
-            endDateStr = (
-                (df.index[-1] + pd.offsets.YearBegin(0)).strftime("%d%b%Y").upper()
-            )
+            startDateStr, endDateStr = _its_base_window(times[0], times[-1])
             parts[4] = startDateStr + " - " + endDateStr
         else:
             tw = list(map(lambda x: x.strip(), parts[4].split("-")))
             startDateStr = tw[0]
             endDateStr = tw[1]  # self._pad_to_end_of_block(tw[1],epart)
-        juls, istat = pyheclib.hec_datjul(startDateStr)
-        jule, istat = pyheclib.hec_datjul(endDateStr)
-        ietime = istime = 0
+        juls = _julian_day(_parse_date(startDateStr))
         pathname = "/".join(parts)
-        itimes = df.index - parse(startDateStr)
-        itimes = itimes.total_seconds() / 60  # time in minutes since base date juls
-        itimes = itimes.values.astype("i")  # conver to integer numpy
+        # time in minutes since base date juls
+        itimes = _datetime64_to_julian_minutes(times, juls)
         inflag = 1  # replace data (merging should be done in memory)
-        # values are either the first column in the pandas DataFrame or should be a pandas Series
-        values = (
-            df.iloc[:, 0].values if isinstance(df, pd.DataFrame) else df.iloc[:].values
-        )
+        current = self._is_catalog_current()
         istat = pyheclib.hec_zsitsxd(
             self.ifltab, pathname, itimes, values, juls, cunits, ctype, inflag
         )
         self._respond_to_istat_state(istat)
+        first, last = _julian_minutes_to_datetime64(juls, [itimes.min(), itimes.max()])
+        self._patch_catalog(
+            pathname,
+            first.astype("datetime64[us]").astype(datetime),
+            last.astype("datetime64[us]").astype(datetime),
+            istat,
+            current,
+        )
         # return istat
@@ -137,4 +137,12 @@ void hec_zritsxd(int *ifltab,
    char *ctype,
    int *inflag,
    int *istat);
+// file address (words) of the data of a record, -1 if the record does not exist
+int hec_zdataddress(int *ifltab, char *cpath, slen_t _cpath_len);
+// number of values in a record (block), -1 if the record does not exist
+int hec_znvals(int *ifltab, char *cpath, slen_t _cpath_len);
+// check which records exist, cpaths is the pathnames separated by newlines
+%apply (char *STRING, int LENGTH) { (char *cpaths, slen_t _cpaths_len) };
+%apply (int* INPLACE_ARRAY1, int DIM1) {(int *lfound, int nfound)};
+void hec_zcheckn(int *ifltab, char *cpaths, slen_t _cpaths_len, int *lfound, int nfound);
 //%clear (double* numpyvalues, int nvals);
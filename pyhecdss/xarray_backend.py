@@ -0,0 +1,154 @@
+"""
+xarray backend for DSS files
+
+Registered as the "pyhecdss" engine so that
+
+    >>> ds = xr.open_dataset('test1.dss', engine='pyhecdss')
+
+opens a DSS file as a dataset with one variable per regular time series record. Coordinates
+are built from the catalog alone and the values are only read (with read_rts) for the slices
+that are actually indexed.
+
+Irregular time series records are not included as their times are not known without reading them.
+"""
+import threading
+import numpy as np
+import pandas as pd
+import xarray as xr
+from xarray.backends import BackendArray, BackendEntrypoint
+from xarray.core import indexing
+from .pyhecdss import DSSFile, _format_date, _format_time, _parse_date
+
+# heclib is not thread safe, so reads of all datasets are serialized
+_LOCK = threading.Lock()
+
+
+class DSSBackendArray(BackendArray):
+    """
+    lazily indexed array of values for a regular time series record
+    """
+
+    def __init__(self, dssh, pathname, times):
+        self.dssh = dssh
+        self.pathname = pathname
+        self.times = times  # times read_rts reads each value at, not the labels of the values
+        self.shape = (len(times),)
+        self.dtype = np.dtype("d")
+
+    def __getitem__(self, key):
+        return indexing.explicit_indexing_adapter(
+            key, self.shape, indexing.IndexingSupport.BASIC, self._raw_indexing_method
+        )
+
+    def _read(self, lo, hi):
+        """
+        read values from index lo to hi (inclusive)
+        """
+        values = np.full(hi - lo + 1, np.nan)
+        sdate = _format_date(self.times[lo]) + " " + _format_time(self.times[lo])
+        edate = _format_date(self.times[hi]) + " " + _format_time(self.times[hi])
+        with _LOCK:
+            df = self.dssh.read_rts(self.pathname, sdate, edate).data
+        nread = min(len(df), len(values))
+        values[:nread] = df.iloc[:nread, 0].values
+        return values
+
+    def _raw_indexing_method(self, key):
+        (k,) = key
+        if isinstance(k, slice):
+            r = range(*k.indices(self.shape[0]))
+        else:
+            k = k + self.shape[0] if k < 0 else k
+            r = range(k, k + 1)
+        if len(r) == 0:
+            return np.empty(0, dtype=self.dtype)
+        lo, hi = min(r), max(r)
+        values = self._read(lo, hi)[np.asarray(r) - lo]
+        return values if isinstance(k, slice) else values[0]
+
+
+def _time_dimension_names(keys):
+    """
+    returns dimension names for unique keys starting with the E part, i.e. time_15MIN or time_15MIN_1
+    if the same E part has more than one time index
+    """
+    names = {}
+    counts = {}
+    for epart, *rest in keys:
+        counts[epart] = counts.get(epart, 0) + 1
+    seen = {}
+    for key in keys:
+        epart = key[0]
+        if counts[epart] == 1:
+            names[key] = "time_" + epart
+        else:
+            names[key] = "time_%s_%d" % (epart, seen.get(epart, 0))
+            seen[epart] = seen.get(epart, 0) + 1
+    return names
+
+
+def open_dss_dataset(filename, drop_variables=None):
+    """
+    open DSS file as an xarray.Dataset with lazily loaded variables for each regular time series
+
+    The variable names are the pathnames with blank D part and the dimensions are time_<E part>. The
+    coordinates are the times read_rts labels the values with, e.g. periods for period values, so the
+    first value of each record is read for its period type and offset
+    """
+    dssh = DSSFile(filename)
+    dfcat = dssh.read_catalog()
+    dfcat = dfcat[~dfcat["E"].str.startswith("IR-")].sort_values(["E", "D"], kind="stable")
+    drop_variables = set(drop_variables or [])
+    times = {}  # times the values are read at by (E part, D part)
+    indexes = {}  # time index by (E part, D part, first time)
+    records = []
+    for pathname, a, b, c, e, f, d in zip(
+        dssh.get_pathnames(dfcat),
+        *[dfcat[p] for p in "ABCEFD"],
+    ):
+        name = "/%s/%s/%s//%s/%s/" % (a, b, c, e, f)
+        if name in drop_variables:
+            continue
+        if (e, d) not in times:
+            sdate, edate = [x.strip() for x in d.split("-")]
+            edate = dssh._pad_to_end_of_block(edate, e)
+            freq = DSSFile.get_freq_from_epart(e)
+            times[(e, d)] = pd.date_range(_parse_date(sdate), _parse_date(edate), freq=freq)
+        rtimes = times[(e, d)]
+        index = dssh._rts_time_index(
+            pathname, _format_date(rtimes[0]) + " " + _format_time(rtimes[0]), len(rtimes)
+        )
+        # records with the same time window share the index unless their period type or offset differ
+        key = (e, d, index[0])
+        indexes.setdefault(key, index)
+        records.append((key, pathname, name, {"A": a, "B": b, "C": c, "E": e, "F": f}))
+    dim_names = _time_dimension_names(list(indexes))
+    coords = {dim_names[key]: index for key, index in indexes.items()}
+    data_vars = {}
+    for key, pathname, name, attrs in records:
+        array = DSSBackendArray(dssh, pathname, times[key[:2]])
+        data_vars[name] = xr.Variable(
+            (dim_names[key],), indexing.LazilyIndexedArray(array), attrs=attrs
+        )
+    ds = xr.Dataset(data_vars, coords=coords)
+    ds.set_close(dssh.close)
+    return ds
+
+
+class PyHECDSSBackendEntrypoint(BackendEntrypoint):
+    """
+    xarray backend entrypoint for DSS files, i.e. xr.open_dataset(filename, engine='pyhecdss')
+    """
+
+    description = "Open HEC-DSS files with pyhecdss"
+    url = "https://github.com/CADWRDeltaModeling/pyhecdss"
+    open_dataset_parameters = ("filename_or_obj", "drop_variables")
+
+    def open_dataset(self, filename_or_obj, *, drop_variables=None):
+        return open_dss_dataset(str(filename_or_obj), drop_variables=drop_variables)
+
+    def guess_can_open(self, filename_or_obj):
+        try:
+            return str(filename_or_obj).lower().endswith(".dss")
+        except Exception:
+            return False
@@ -43,6 +43,14 @@ requirements = ["numpy", "pandas"]
 
 setup_requirements = []
 
+# optional dependencies of the xarray backend, dask reads and parquet imports
+extras_requirements = {
+    'xarray': ['xarray'],
+    'dask': ['dask'],
+    'parquet': ['pyarrow'],
+}
+extras_requirements['all'] = sorted(set(sum(extras_requirements.values(), [])))
+
 test_requirements = ['pytest']
 
 
@@ -95,6 +103,7 @@ setup(name='pyhecdss',
       ],
       description="For reading/writing HEC-DSS files",
       install_requires=requirements,
+      extras_require=extras_requirements,
       license="MIT license",
       long_description=readme + '\n\n' + history,
       include_package_data=True,
@@ -107,4 +116,7 @@ setup(name='pyhecdss',
       url='https://github.com/dwr-psandhu/pyhecdss',
       zip_safe=False,
       ext_modules=[pyheclib_module],
+      entry_points={
+          'xarray.backends': ['pyhecdss=pyhecdss.xarray_backend:PyHECDSSBackendEntrypoint'],
+      },
       )
@@ -0,0 +1,19 @@
+'''
+Fixtures shared by the tests
+'''
+import shutil
+import pytest
+
+
+@pytest.fixture
+def tmp_dss(tmp_path):
+    '''
+    function returning the path of the DSS file name in a temporary directory, a copy of copy_of if given.
+    The directory, with the catalog and any other files written next to the DSS files, is removed by pytest
+    '''
+    def path(name, copy_of=None):
+        fname = str(tmp_path / name)
+        if copy_of is not None:
+            shutil.copyfile(copy_of, fname)
+        return fname
+    return path
@@ -0,0 +1,98 @@
+'''
+Tests batch reads ordered by the file addresses of the records
+'''
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss import pyhecdss as module
+
+NAMES = ['/SAMPLE/LOC%02d/FLOW//1DAY/TEST/' % i for i in np.random.default_rng(3).permutation(20)]
+
+
+def _written(pathname):
+    # position of the record in the order written
+    return [n.split('/')[2] for n in NAMES].index(pathname.split('/')[2])
+
+
+@pytest.fixture
+def fname(tmp_dss):
+    fname = tmp_dss('test_address_order.dss')
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        for i, name in enumerate(NAMES):
+            df = pd.DataFrame(np.arange(500.0) + i, index=pd.date_range('01JAN2000', periods=500, freq='D'))
+            d.write_rts(name, df, 'CFS', 'INST-VAL')
+    return fname
+
+
+def test_data_addresses(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        pathnames = d.get_pathnames()
+        addresses = d._data_addresses(pathnames)
+        assert (addresses > 0).all()
+        # records were written in the order of NAMES
+        written = sorted(pathnames, key=_written)
+        assert list(np.array(pathnames)[np.argsort(addresses)]) == written
+        assert list(d._data_addresses(['/SAMPLE/NONE/FLOW/01JAN2000/1DAY/TEST/', '/SAMPLE/LOC01/FLOW//1DAY/TEST/'])) == [-1, -1]
+
+
+@pytest.mark.parametrize('batch', [1, 7, 256])
+def test_reads_in_address_order(fname, monkeypatch, batch):
+    monkeypatch.setattr(module, '_ADDRESS_ORDER_BATCH', batch)
+    with pyhecdss.DSSFile(fname) as d:
+        pathnames = d.get_pathnames()
+        expected = [d.read_rts(p) for p in pathnames]
+        reads = []
+        read_ts = module._read_ts
+
+        def recording_read_ts(dssh, pathname, *args):
+            reads.append(pathname)
+            return read_ts(dssh, pathname, *args)
+
+        monkeypatch.setattr(module, '_read_ts', recording_read_ts)
+        results = list(module._read_in_address_order(d, [(p, None, None) for p in pathnames], batch))
+    # returned in the order requested
+    for r, e in zip(results, expected):
+        pd.testing.assert_frame_equal(r.data, e.data)
+    # read in the order written within each batch
+    for i in range(0, len(pathnames), batch):
+        chunk = reads[i:i + batch]
+        assert sorted(chunk, key=_written) == chunk
+    assert sorted(reads) == sorted(pathnames)
+
+
+def test_get_matching_ts_order(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        pathnames = d.get_pathnames()
+    results = list(pyhecdss.get_matching_ts(fname, '/SAMPLE/////'))
+    assert [r.data.columns[0] for r in results] == pathnames
+
+
+def _recording(monkeypatch):
+    reads = []
+    read_ts = module._read_ts
+
+    def recording_read_ts(dssh, pathname, *args):
+        reads.append(pathname)
+        return read_ts(dssh, pathname, *args)
+
+    monkeypatch.setattr(module, '_read_ts', recording_read_ts)
+    return reads
+
+
+def test_get_matching_ts_lazy_by_default(fname, monkeypatch):
+    reads = _recording(monkeypatch)
+    results = pyhecdss.get_matching_ts(fname, '/SAMPLE/////')
+    next(results)
+    # only the first is read before it is returned
+    assert len(reads) == 1
+    results.close()
+
+
+def test_get_matching_ts_address_order(fname, monkeypatch):
+    expected = list(pyhecdss.get_matching_ts(fname, '/SAMPLE/////'))
+    reads = _recording(monkeypatch)
+    results = list(pyhecdss.get_matching_ts(fname, '/SAMPLE/////', address_order=True))
+    for r, e in zip(results, expected):
+        pd.testing.assert_frame_equal(r.data, e.data)
+    assert reads == sorted(reads, key=_written)
@@ -0,0 +1,56 @@
+'''
+Tests aggregation of regular time series while reading
+'''
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+
+
+@pytest.fixture
+def fname(tmp_dss):
+    return tmp_dss('test_aggregated.dss')
+
+
+@pytest.mark.parametrize('how', ['mean', 'min', 'max', 'sum'])
+@pytest.mark.parametrize('to,freq', [('1DAY', 'D'), ('1HOUR', 'h'), ('3HOUR', '3h'), ('1MON', 'MS')])
+def test_aggregated_matches_resample(how, to, freq):
+    pathname = '/SAMPLE/SIN/WAVE/01JAN1990 - 01JAN1990/15MIN/SAMPLE1/'
+    with pyhecdss.DSSFile('test1.dss') as d:
+        expected = d.read_rts(pathname).data.resample(freq).agg(how)
+        df, units, ptype = d.read_rts_aggregated(pathname, to, how)
+    assert ptype == {'mean': 'PER-AVER', 'sum': 'PER-CUM', 'min': 'PER-MIN', 'max': 'PER-MAX'}[how]
+    assert df.columns[0] == pathname.replace('15MIN', to)
+    np.testing.assert_allclose(df.values, expected.values, atol=1e-9)
+    pd.testing.assert_index_equal(df.index, expected.index, exact=False)
+
+
+@pytest.mark.parametrize('ptype', ['INST-VAL', 'PER-AVER'])
+def test_aggregated_across_blocks_with_missing(fname, ptype):
+    # 1HOUR values are stored in monthly blocks
+    index = pd.date_range('15JAN1990 0100', periods=24 * 90, freq='h')
+    values = np.sin(np.arange(len(index)) / 10.0)
+    values[100:130] = np.nan
+    values[24 * 40:24 * 41] = np.nan
+    df = pd.DataFrame(values, index=index)
+    if ptype == 'PER-AVER':
+        df.index = df.index.to_period()
+    pathname = '/SAMPLE/AGG/FLOW//1HOUR/TEST/'
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_rts(pathname, df, 'CFS', ptype)
+        full = d.read_rts(pathname, '01JAN1990', '01JUN1990').data
+        for how in ['mean', 'min', 'max', 'sum']:
+            aggregated = d.read_rts_aggregated(pathname, '1DAY', how, '01JAN1990', '01JUN1990').data
+            expected = full.resample('D').agg(how)
+            np.testing.assert_allclose(aggregated.values, expected.values, atol=1e-9)
+            assert list(aggregated.index.astype(str)) == list(expected.index.astype(str))
+        assert isinstance(aggregated.index, pd.PeriodIndex) == (ptype == 'PER-AVER')
+
+
+def test_aggregated_errors():
+    pathname = '/SAMPLE/SIN/WAVE/01JAN1990 - 01JAN1990/15MIN/SAMPLE1/'
+    with pyhecdss.DSSFile('test1.dss') as d:
+        with pytest.raises(ValueError):
+            d.read_rts_aggregated(pathname, '1DAY', 'median')
+        with pytest.raises(ValueError):
+            d.read_rts_aggregated(pathname, '7HOUR')
@@ -1,4 +1,5 @@
 import pyhecdss
+from pyhecdss.pyhecdss import _CATALOG_STRINGS
 import pandas as pd
 import numpy as np
 import os
@@ -17,3 +18,47 @@ def test_catalog_dsc_read_failing():
     dfc = pyhecdss.DSSFile._read_catalog_dsc('test_failing_catalog.dsc')
     assert len(dfc) == 4
     assert dfc.loc[0, 'D'] == '01JAN1915 - 01JAN2015'
+
+
+def test_catalog_dsd_read():
+    '''
+    Condensed catalog with ditto marks ("- - -") referring to the previous row
+    '''
+    dfc = pyhecdss.DSSFile._read_catalog_dsd('test_condensed_catalog.dsd')
+    assert len(dfc) == 4
+    assert list(dfc.columns) == list('TABCFED') + ['D_START', 'D_END']
+    assert list(dfc['A']) == ['SAMPLE', 'SAMPLE', 'SAMPLE', 'TEST']
+    assert list(dfc['C']) == ['RANDOM', 'WAVE', 'WAVE', 'VANILLA']
+    assert dfc.loc[2, 'D'] == '01JAN1990 - 01JAN2000'
+    assert dfc['B'].dtype == 'category'
+    assert dfc.loc[3, 'D_END'] == pd.Timestamp('1997-01-01')
+    assert dfc.loc[1, 'D_START'] == dfc.loc[1, 'D_END']
+
+
+def test_catalog_shared_strings():
+    '''
+    catalogs of different files share the same part strings
+    '''
+    dfc1 = pyhecdss.DSSFile._read_catalog_dsd('test_condensed_catalog.dsd')
+    dfc2 = pyhecdss.DSSFile._read_catalog_dsc('test_catalog.dsc')
+    dfc3 = pyhecdss.DSSFile._read_catalog_dsc('test_catalog.dsc')
+    assert dfc2['A'].cat.categories[0] is dfc3['A'].cat.categories[0]
+    assert 'WAVE' in dfc1['C'].cat.categories
+    # the time windows and tags are not kept in the process wide table
+    assert dfc1.loc[2, 'D'] not in _CATALOG_STRINGS
+    assert all(t not in _CATALOG_STRINGS for t in dfc2['T'].cat.categories)
+
+
+def test_match_catalog_categorical():
+    dfc = pyhecdss.DSSFile._read_catalog_dsd('test_condensed_catalog.dsd')
+    assert len(pyhecdss.match_catalog(dfc, '//SIN/W.*////')) == 2
+    assert len(pyhecdss.match_catalog(dfc, '/T.*//////')) == 1
+    assert len(pyhecdss.match_catalog(dfc, '///////')) == 4
+
+
+def test_catalog_dsc_read_dates():
+    dfc = pyhecdss.DSSFile._read_catalog_dsc('test_catalog.dsc')
+    assert dfc.loc[0, 'T'] == 'T15132'
+    assert dfc.loc[0, 'D_START'] == pd.Timestamp('2002-11-01')
+    assert dfc.loc[0, 'D_END'] == pd.Timestamp('2019-12-01')
+    assert dfc['C'].dtype == 'category'
@@ -0,0 +1,119 @@
+'''
+Tests catalog regeneration shared between processes with a lock file
+'''
+import glob
+import multiprocessing
+import os
+import threading
+import time
+import pytest
+import pyhecdss
+from pyhecdss.pyhecdss import _lock_file
+
+def _open_and_catalog(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        fdname, generated = d._check_condensed_catalog_file_and_recatalog(condensed=False)
+        return generated, len(d.read_catalog())
+
+
+@pytest.fixture
+def fname(tmp_dss, monkeypatch):
+    # in the temporary directory so the catalog, lock and temporary files can be checked by name
+    monkeypatch.chdir(os.path.dirname(tmp_dss('locked.dss', copy_of='test1.dss')))
+    return 'locked.dss'
+
+
+def _leftovers():
+    return glob.glob('locked.*.tmp.*') + glob.glob('locked.lock')
+
+
+def test_catalog_leaves_no_temporary_files(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        assert d.catalog() > 0
+        assert len(d.read_catalog()) > 0
+    assert os.path.exists('locked.dsc')
+    assert os.path.exists('locked.dsd')
+    assert _leftovers() == []
+
+
+def test_catalog_waits_for_lock(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        result = []
+        with _lock_file('locked.lock'):
+            t = threading.Thread(target=lambda: result.append(d.read_catalog()))
+            t.start()
+            time.sleep(0.5)
+            assert t.is_alive()
+            assert not os.path.exists('locked.dsc')
+        t.join()
+        assert len(result[0]) > 0
+
+
+def test_stale_lock_is_removed(fname):
+    with open('locked.lock', 'w') as fh:
+        fh.write('0')
+    old = time.time() - 3600
+    os.utime('locked.lock', (old, old))
+    with pyhecdss.DSSFile(fname) as d:
+        assert len(d.read_catalog()) > 0
+    assert _leftovers() == []
+
+
+def test_catalog_generated_once_across_processes(fname):
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(4) as pool:
+        results = pool.map(_open_and_catalog, [fname] * 8)
+    assert sum(generated for generated, n in results) == 1
+    assert len(set(n for generated, n in results)) == 1
+    assert _leftovers() == []
+
+
+def _catalog_failure(fname, guarded=True):
+    if not guarded:  # let heclib itself fail
+        pyhecdss.pyhecdss._CATALOGED_PID = None
+    with pyhecdss.DSSFile(fname) as d:
+        try:
+            d.catalog()
+        except Exception as e:
+            return str(e)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_failed_catalog_keeps_previous(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        assert d.catalog() > 0
+    size = os.path.getsize('locked.dsc')
+    # heclib can't catalog in a forked child of a process that has cataloged
+    with multiprocessing.get_context('fork').Pool(1) as pool:
+        message = pool.apply(_catalog_failure, (fname, False))
+    assert 'Cataloging locked.dss failed' in message
+    assert os.path.getsize('locked.dsc') == size
+    assert _leftovers() == []
+
+
+def _read_catalog_failure(d):
+    try:
+        d.read_catalog()
+    except Exception as e:
+        return str(e)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+@pytest.mark.parametrize('catalog', ['missing', 'stale'])
+def test_forked_handle_regenerating_catalog_raises(fname, catalog):
+    d = pyhecdss.DSSFile(fname)
+    try:
+        assert len(d.read_catalog()) > 0
+        if catalog == 'missing':
+            os.remove('locked.dsc')
+        else:
+            later = time.time() + 10
+            os.utime(fname, (later, later))
+        with multiprocessing.get_context('fork').Pool(1) as pool:
+            message = pool.apply(_read_catalog_failure, (d,))
+        assert 'forked' in message
+        assert os.path.exists('locked.dsc') == (catalog == 'stale')
+        assert _leftovers() == []
+        assert len(d.read_catalog()) > 0  # the parent still can
+    finally:
+        d.close()
@@ -0,0 +1,36 @@
+'''
+Tests catalogs and reads across a collection of DSS files
+'''
+import os
+import pytest
+import pyhecdss
+
+
+@pytest.fixture
+def scenario_files(tmp_dss):
+    return [tmp_dss('test_collection%d.dss' % i, copy_of='test1.dss') for i in range(3)]
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_collection_catalog(scenario_files, max_workers):
+    pattern = os.path.join(os.path.dirname(scenario_files[0]), 'test_collection*.dss')
+    with pyhecdss.DSSCollection(pattern, max_workers=max_workers) as c:
+        assert c.files == scenario_files
+        dfcat = c.read_catalog()
+        with pyhecdss.DSSFile('test1.dss') as d:
+            n = len(d.read_catalog())
+        assert len(dfcat) == 3 * n
+        assert sorted(dfcat['FILE'].unique()) == scenario_files
+        found = c.find('//SIN/////')
+        assert list(found['FILE']) == scenario_files
+
+
+def test_collection_get_matching_ts(scenario_files):
+    with pyhecdss.DSSCollection(scenario_files, max_workers=1) as c:
+        results = list(c.get_matching_ts('//SIN/WAVE////'))
+        assert [f for f, _ in results] == scenario_files
+        df, units, ptype = results[0][1]
+        assert units == 'UNIT-X'
+        assert len(df) > 10
+        with pytest.raises(Exception):
+            list(c.get_matching_ts('//NO-SUCH-B/////'))
@@ -0,0 +1,21 @@
+'''
+Tests reading catalogs of DSS files as dask data frames
+'''
+import pytest
+pytest.importorskip('dask.dataframe')
+import pyhecdss.dask
+
+
+@pytest.mark.parametrize('scheduler', ['synchronous', 'processes'])
+def test_read_catalog_as_dask(scheduler):
+    ddf = pyhecdss.dask.read_catalog_as_dask(['test1.dss'], '///WAVE////')
+    assert ddf.npartitions == 1
+    df = ddf.compute(scheduler=scheduler)
+    assert list(df.columns) == ['pathname', 'time', 'value', 'units', 'period_type']
+    assert len(df) > 10
+    assert (df['units'] == 'UNIT-X').all()
+
+
+def test_read_catalog_as_dask_partitions():
+    ddf = pyhecdss.dask.read_catalog_as_dask(['test1.dss'], '//////', records_per_partition=1)
+    assert ddf.npartitions == 3
@@ -0,0 +1,46 @@
+'''
+Tests the DSS date string, datetime64 and julian day conversions
+'''
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.parser import parse
+from pyhecdss import pyheclib
+from pyhecdss.pyhecdss import (_parse_date, _format_date, _format_time, _parse_dates, _format_dates,
+                               _julian_day, _julian_minutes_to_datetime64,
+                               _datetime64_to_julian_minutes)
+
+
+@pytest.mark.parametrize('datestr', ['01JAN1990', '1JAN1990', '29feb2000', '31DEC1899 2359',
+                                     '15MAR1700 0130', '01JUL2021 12:45', '2021-07-01 12:45'])
+def test_parse_date(datestr):
+    assert _parse_date(datestr) == parse(datestr)
+
+
+def test_parse_date_2400():
+    assert _parse_date('31DEC1990 2400') == datetime(1991, 1, 1)
+
+
+def test_format_date():
+    d = pd.Timestamp('1990-03-05 07:08')
+    assert _format_date(d) == d.strftime('%d%b%Y').upper()
+    assert _format_time(d) == '0708'
+
+
+def test_bulk_round_trip():
+    dates = pd.date_range('1650-01-01', '2150-12-31', freq='37D').values
+    strings = _format_dates(dates)
+    assert list(strings) == [d.strftime('%d%b%Y').upper() for d in pd.DatetimeIndex(dates)]
+    assert np.array_equal(_parse_dates(strings), dates)
+    assert np.array_equal(_parse_dates([' ' + s.lower() + ' ' for s in strings[:10]]), dates[:10])
+    assert len(_parse_dates([])) == 0
+
+
+def test_julian():
+    for datestr in ['31DEC1899', '01JAN1900', '01JAN1990', '29FEB2000', '01JAN1800']:
+        assert _julian_day(_parse_date(datestr)) == pyheclib.hec_datjul(datestr)[0]
+    times = np.array(['1990-01-01T00:00', '1990-01-01T01:30', '1990-03-01T23:59'], dtype='datetime64[ns]')
+    minutes = _datetime64_to_julian_minutes(times, 32873)
+    assert list(minutes) == [0, 90, (31 + 28) * 1440 + 1439]
+    assert np.array_equal(_julian_minutes_to_datetime64(32873, minutes), times)
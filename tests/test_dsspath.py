@@ -0,0 +1,81 @@
+'''
+Tests the parsed and interned pathname type
+'''
+import pickle
+import shutil
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss import DSSPath
+from pyhecdss.pyhecdss import _catalog_instructions
+
+RTS = '/SAMPLE/SIN/WAVE/01JAN1990 - 01JAN1990/15MIN/SAMPLE1/'
+ITS = '/SAMPLE/ITS1/RANDOM/01JAN1990 - 01JAN1992/IR-YEAR/SAMPLE2/'
+
+
+def test_parts():
+    p = DSSPath.of(RTS.lower())
+    assert str(p) == RTS
+    assert (p.apart, p.bpart, p.cpart, p.dpart, p.epart, p.fpart) == \
+        ('SAMPLE', 'SIN', 'WAVE', '01JAN1990 - 01JAN1990', '15MIN', 'SAMPLE1')
+    assert p.freq == pd.offsets.Minute(15)
+    assert p.freqstr == '15min'
+    assert not p.is_irregular
+    assert DSSPath.of(ITS).is_irregular
+
+
+def test_interned_and_immutable():
+    p = DSSPath.of(RTS)
+    assert DSSPath.of(RTS) is p
+    assert DSSPath.of(p) is p
+    assert DSSPath(RTS) == p and hash(DSSPath(RTS)) == hash(p)
+    with pytest.raises(AttributeError):
+        p.pathname = ITS
+    with pytest.raises(AttributeError):
+        p.other = 1
+    assert pickle.loads(pickle.dumps(p)) is p
+
+
+def test_with_parts():
+    p = DSSPath.of(RTS).with_parts(dpart='', epart='1DAY')
+    assert str(p) == '/SAMPLE/SIN/WAVE//1DAY/SAMPLE1/'
+    assert p.freqstr == '1D'
+
+
+def test_bad_pathname():
+    with pytest.raises(ValueError):
+        DSSPath('/A/B/C/')
+
+
+def test_read_with_dsspath():
+    with pyhecdss.DSSFile('test1.dss') as d:
+        rts = d.read_rts(DSSPath.of(RTS)).data
+        assert rts.equals(d.read_rts(RTS).data)
+        its = d.read_its(DSSPath.of(ITS)).data
+        assert its.equals(d.read_its(ITS).data)
+
+
+def test_write_with_dsspath(tmp_path):
+    fname = str(tmp_path / 'test_dsspath.dss')
+    df = pd.DataFrame(np.arange(10.0), index=pd.date_range('01JAN2000', periods=10, freq='D'))
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_rts(DSSPath.of('/A/B/C//1DAY/F/'), df, 'CFS', 'INST-VAL')
+        d.write_its(DSSPath.of('/A/B/ITS//IR-YEAR/F/'), df, 'CFS', 'INST-VAL')
+        dfr = d.read_rts(DSSPath.of('/A/B/C/01JAN2000/1DAY/F/')).data
+        dfi = d.read_its(DSSPath.of('/A/B/ITS/01JAN1999 - 01JAN2001/IR-YEAR/F/')).data
+    assert np.array_equal(dfr.iloc[:, 0].values, df.iloc[:, 0].values)
+    assert np.array_equal(dfi.iloc[:, 0].values, df.iloc[:, 0].values)
+
+
+def test_catalog_with_dsspath(tmp_path):
+    fname = str(tmp_path / 'test_dsspath.dss')
+    shutil.copy('test1.dss', fname)
+    p = DSSPath.of('//SIN/WAVE//15MIN//')
+    assert _catalog_instructions(p) == _catalog_instructions(str(p))
+    with pyhecdss.DSSFile(fname) as d:
+        selected = d.read_catalog(p)  # the catalog is out of date so this is a selective catalog
+        assert list(selected['B']) == ['SIN']
+        assert pyhecdss.match_catalog(d.read_catalog(), p).equals(d.read_catalog(str(p)))
+    assert len(list(pyhecdss.get_ts(fname, p))) == 1
+    assert len(list(pyhecdss.get_matching_ts(fname, p))) == 1
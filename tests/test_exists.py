@@ -0,0 +1,31 @@
+'''
+Tests batch checks for existing records
+'''
+import numpy as np
+import pyhecdss
+
+
+def test_exists():
+    pathnames = ['/SAMPLE/SIN/WAVE/01JAN1990/15MIN/SAMPLE1/',
+                 '/SAMPLE/SIN/WAVE/01FEB1990/15MIN/SAMPLE1/',
+                 '/SAMPLE/ITS1/RANDOM/01JAN1990 - 01JAN1992/IR-YEAR/SAMPLE2/',
+                 '/sample/its1/random/01jan1991/ir-year/sample2/',
+                 '/SAMPLE/ITS1/RANDOM//IR-YEAR/SAMPLE2/',
+                 '/SAMPLE/NONE/RANDOM//IR-YEAR/SAMPLE2/',
+                 '/SAMPLE/NONE/WAVE/01JAN1990/15MIN/SAMPLE1/',
+                 pyhecdss.DSSPath.of('/TEST/ITS1/VANILLA/01JAN1997/IR-YEAR/RANDOM/')]
+    with pyhecdss.DSSFile('test1.dss') as d:
+        found = d.exists(pathnames)
+        assert found.dtype == bool
+        assert list(found) == [True, False, True, True, True, False, False, True]
+        assert len(d.exists([])) == 0
+
+
+def test_exists_matches_catalog():
+    with pyhecdss.DSSFile('test1.dss') as d:
+        pathnames = d.get_pathnames()
+        assert d.exists(pathnames).all()
+        missing = [pyhecdss.DSSPath.of(p).with_parts(bpart='NONE').pathname for p in pathnames]
+        assert not d.exists(missing).any()
+        found = d.exists(np.array(pathnames + missing, dtype=object)[::-1])
+        assert list(found) == [False] * len(missing) + [True] * len(pathnames)
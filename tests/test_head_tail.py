@@ -0,0 +1,98 @@
+'''
+Tests head and tail reads of the ends of long records
+'''
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss import pyhecdss as module
+
+PATHNAME = '/SAMPLE/LONG/FLOW//1HOUR/TEST/'
+ITS_PATHNAME = '/SAMPLE/LONG/STAGE//IR-MONTH/TEST/'
+
+
+@pytest.fixture(params=['INST-VAL', 'PER-AVER'])
+def fname(request, tmp_dss):
+    fname = tmp_dss('test_head_tail.dss')
+    index = pd.date_range('15JAN1990 0100', '20MAR1993 0500', freq='h')
+    values = np.cos(np.arange(len(index)) / 24.0)
+    values[:30] = np.nan
+    values[5000:5500] = np.nan
+    values[-50:] = np.nan
+    df = pd.DataFrame(values, index=index)
+    if request.param == 'PER-AVER':
+        df.index = df.index.to_period()
+    times = pd.date_range('03JAN1990 0517', periods=300, freq='5D')
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_rts(PATHNAME, df, 'CFS', request.param)
+        d.write_its(ITS_PATHNAME, pd.DataFrame(np.arange(300.0), index=times), 'FEET', 'INST-VAL')
+    return fname
+
+
+def _read_full(d, pathname):
+    pathname = d.get_pathnames(pyhecdss.match_catalog(d.read_catalog(), pathname))[0]
+    return d.read_rts(pathname)
+
+
+def test_read_rts_trims_nan(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        df = _read_full(d, PATHNAME).data
+    # the values written as nan at the ends are trimmed, those within are kept
+    assert not np.isnan(df.iloc[0, 0]) and not np.isnan(df.iloc[-1, 0])
+    assert len(df) == len(pd.date_range('15JAN1990 0100', '20MAR1993 0500', freq='h')) - 80
+    assert df.iloc[:, 0].isna().sum() == 500
+
+
+@pytest.mark.parametrize('n', [1, 10, 2000, 50000])
+def test_head_tail_count(fname, n):
+    with pyhecdss.DSSFile(fname) as d:
+        full = _read_full(d, PATHNAME)
+        tail = d.tail(PATHNAME, n)
+        head = d.head(PATHNAME, n)
+    pd.testing.assert_frame_equal(tail.data, full.data.tail(n), check_freq=False)
+    pd.testing.assert_frame_equal(head.data, full.data.head(n), check_freq=False)
+    assert (tail.units, tail.period_type) == (full.units, full.period_type)
+
+
+@pytest.mark.parametrize('td', ['1h', '7D', '45D', '100000D'])
+def test_head_tail_timedelta(fname, td):
+    with pyhecdss.DSSFile(fname) as d:
+        full = _read_full(d, PATHNAME).data
+        pathname = full.columns[0]
+        times = full.index.to_timestamp() if isinstance(full.index, pd.PeriodIndex) else full.index
+        delta = pd.Timedelta(td)
+        pd.testing.assert_frame_equal(d.tail(pathname, td).data, full[times > times[-1] - delta],
+                                      check_freq=False)
+        pd.testing.assert_frame_equal(d.head(pathname, delta).data, full[times < times[0] + delta],
+                                      check_freq=False)
+
+
+def test_tail_reads_last_blocks(fname, monkeypatch):
+    lengths = []
+    zrrtsxd = module.pyheclib.hec_zrrtsxd
+
+    def counting_zrrtsxd(ifltab, cpath, cdate, ctime, values):
+        lengths.append(len(values))
+        return zrrtsxd(ifltab, cpath, cdate, ctime, values)
+
+    monkeypatch.setattr(module.pyheclib, 'hec_zrrtsxd', counting_zrrtsxd)
+    with pyhecdss.DSSFile(fname) as d:
+        assert len(d.tail(PATHNAME, '7D').data) == 7 * 24
+    # one read of the last monthly block
+    assert lengths == [24 * 31 + 1]
+
+
+def test_head_tail_its(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        pathname = d.get_pathnames(pyhecdss.match_catalog(d.read_catalog(), ITS_PATHNAME))[0]
+        full = d.read_its(pathname).data
+        pd.testing.assert_frame_equal(d.tail(ITS_PATHNAME, 12).data, full.tail(12))
+        pd.testing.assert_frame_equal(d.head(ITS_PATHNAME, 12).data, full.head(12))
+        pd.testing.assert_frame_equal(d.tail(ITS_PATHNAME, '30D').data,
+                                      full[full.index > full.index[-1] - pd.Timedelta('30D')])
+
+
+def test_head_tail_missing_record(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        with pytest.raises(Exception):
+            d.tail('/SAMPLE/NONE/FLOW//1HOUR/TEST/')
@@ -0,0 +1,110 @@
+'''
+Tests bulk import of columnar files
+'''
+import os
+import pytest
+import numpy as np
+import pandas as pd
+import pyhecdss
+
+
+def cleanup(*files):
+    for f in files:
+        if f.endswith('.dss'):
+            files = files + (f[:-4] + '.dsc', f[:-4] + '.dsd')
+    for f in files:
+        try:
+            os.remove(f)
+        except OSError:
+            pass
+
+
+def test_import_wide_csv():
+    dssfile, csvfile = 'test_import_wide.dss', 'test_import_wide.csv'
+    cleanup(dssfile, csvfile)
+    index = pd.date_range('01JAN1990', periods=500, freq='1h')
+    df = pd.DataFrame({'/SAMPLE/B1/FLOW///IMPORT/': np.arange(500.0),
+                       '/SAMPLE/B2/FLOW///IMPORT/': np.arange(500.0) * 2}, index=index)
+    df.index.name = 'time'
+    df.to_csv(csvfile)
+    plist = pyhecdss.import_columnar(dssfile, csvfile, cunits='CFS', chunksize=111)
+    assert plist == ['/SAMPLE/B1/FLOW//1HOUR/IMPORT/', '/SAMPLE/B2/FLOW//1HOUR/IMPORT/']
+    with pyhecdss.DSSFile(dssfile) as d:
+        df2, units, ptype = d.read_rts('/SAMPLE/B2/FLOW/01JAN1990/1HOUR/IMPORT/')
+    assert units == 'CFS'
+    np.testing.assert_array_equal(df2.iloc[:, 0].values, df.iloc[:, 1].values)
+    cleanup(dssfile, csvfile)
+
+
+def test_import_long_npz_irregular():
+    dssfile, npzfile = 'test_import_long.dss', 'test_import_long.npz'
+    cleanup(dssfile, npzfile)
+    times = pd.to_datetime(['01apr1990', '05nov1991', '07apr1997', '01jan1990', '02jan1990'],
+                           format='%d%b%Y')
+    np.savez(npzfile,
+             pathname=np.array(['/S/ITS/C///F/'] * 3 + ['/S/ITS2/C//IR-YEAR/F/'] * 2),
+             time=times.values,
+             value=np.array([0.5, 0.6, 0.7, 1.0, 2.0]))
+    plist = pyhecdss.import_columnar(dssfile, npzfile, layout='long', chunksize=2)
+    assert plist == ['/S/ITS/C//IR-YEAR/F/', '/S/ITS2/C//IR-YEAR/F/']
+    with pyhecdss.DSSFile(dssfile) as d:
+        df, units, ptype = d.read_its('/S/ITS/C//IR-YEAR/F/', '01JAN1990', '01JAN1998')
+    np.testing.assert_array_equal(df.iloc[:, 0].values, [0.5, 0.6, 0.7])
+    cleanup(dssfile, npzfile)
+
+
+def test_import_parquet():
+    pytest.importorskip('pyarrow')
+    dssfile, pqfile = 'test_import_pq.dss', 'test_import_pq.parquet'
+    cleanup(dssfile, pqfile)
+    index = pd.date_range('01JAN2000', periods=24, freq='MS')
+    df = pd.DataFrame({'time': index, '/SAMPLE/PQ/STAGE///IMPORT/': np.arange(24.0)})
+    df.to_parquet(pqfile)
+    plist = pyhecdss.import_columnar(dssfile, pqfile, chunksize=5)
+    assert plist == ['/SAMPLE/PQ/STAGE//1MON/IMPORT/']
+    with pyhecdss.DSSFile(dssfile) as d:
+        df2, units, ptype = d.read_rts(d.get_pathnames()[0])
+    np.testing.assert_array_equal(df2.iloc[:, 0].values, np.arange(24.0))
+    assert len(df2.index) == 24
+    assert df2.index[0] == pd.Timestamp('01JAN2000')
+    cleanup(dssfile, pqfile)
+
+
+@pytest.mark.parametrize('freq,epart', [('1h', '1HOUR'), ('15min', '15MIN'), ('1D', '1DAY'),
+                                        ('MS', '1MON')])
+def test_import_regular_with_gap(freq, epart):
+    dssfile, csvfile = 'test_import_gap.dss', 'test_import_gap.csv'
+    cleanup(dssfile, csvfile)
+    index = pd.date_range('01JAN1990', periods=50, freq=freq)
+    df = pd.DataFrame({'/SAMPLE/GAP/FLOW///IMPORT/': np.arange(50.0)}, index=index)
+    df.index.name = 'time'
+    # a missing timestamp in the first chunk
+    df.drop(index[2]).to_csv(csvfile)
+    try:
+        plist = pyhecdss.import_columnar(dssfile, csvfile, chunksize=10)
+        assert plist == ['/SAMPLE/GAP/FLOW//%s/IMPORT/' % epart]
+        with pyhecdss.DSSFile(dssfile) as d:
+            df2, units, ptype = d.read_rts(d.get_pathnames()[0])
+        expected = np.arange(50.0)
+        expected[2] = np.nan
+        np.testing.assert_array_equal(df2.iloc[:, 0].values, expected)
+    finally:
+        cleanup(dssfile, csvfile)
+
+
+@pytest.mark.parametrize('save', [np.savez, np.savez_compressed])
+def test_npz_read_in_chunks(tmp_path, save):
+    from pyhecdss.importer import _read_npz_chunks
+    npzfile = str(tmp_path / 'chunks.npz')
+    arrays = {'time': pd.date_range('01JAN1990', periods=1000, freq='1h').values,
+              'pathname': np.array(['/S/B%d/C///F/' % (i % 3) for i in range(1000)]),
+              'value': np.arange(1000.0)}
+    save(npzfile, **arrays)
+    chunks = list(_read_npz_chunks(npzfile, 300))
+    assert [len(c) for c in chunks] == [300, 300, 300, 100]
+    df = pd.concat(chunks, ignore_index=True)
+    for k, v in arrays.items():
+        np.testing.assert_array_equal(df[k].values, v)
+    np.savez(npzfile, value=np.array([{}], dtype=object))
+    with pytest.raises(ValueError):
+        list(_read_npz_chunks(npzfile, 300))
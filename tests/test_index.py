@@ -0,0 +1,53 @@
+'''
+Tests the persistent pathname index
+'''
+import os
+import pytest
+import pandas as pd
+import numpy as np
+import pyhecdss
+
+
+@pytest.fixture
+def index_files(tmp_dss):
+    return [tmp_dss('test_index%d.dss' % i, copy_of='test1.dss') for i in range(2)]
+
+
+@pytest.fixture
+def index_name(tmp_path):
+    return str(tmp_path / 'test_index.sqlite')
+
+
+def test_index_update_and_find(index_files, index_name):
+    with pyhecdss.DSSIndex(index_name) as index:
+        assert len(index.update(index_files)) == 2
+        assert index.update(index_files) == []
+        assert index.files() == sorted(os.path.abspath(f) for f in index_files)
+        dfm = index.find('/*/SIN/WAVE/*/')
+        assert len(dfm) == 2
+        assert list(dfm.columns) == ['T', 'A', 'B', 'C', 'F', 'E', 'D', 'FILE', 'D_START', 'D_END', 'TYPE']
+        with pyhecdss.DSSFile(index_files[0]) as d:
+            dfcat = pyhecdss.match_catalog(d.read_catalog(), '//SIN/WAVE////')
+        assert list(dfm['D_START']) == [dfcat['D_START'].iloc[0]] * 2
+        assert list(dfm['D_END']) == [dfcat['D_END'].iloc[0]] * 2
+        assert list(dfm['TYPE']) == ['RTS'] * 2
+        assert set(index.find('/////IR-YEAR//')['TYPE']) == {'ITS'}
+        assert len(index.find('//S.N/////')) == 2
+        assert len(index.find('//NOSUCH/////')) == 0
+        assert index.find_files('/////IR-YEAR//') == sorted(os.path.abspath(f) for f in index_files)
+    # persists and refreshes only the changed file
+    with pyhecdss.DSSFile(index_files[1]) as d:
+        dtr = pd.date_range('01JAN1990', periods=10, freq='1D')
+        d.write_rts('/NEW/REC/FLOW//1DAY/X/', pd.DataFrame(np.ones(10), index=dtr), 'CFS', 'INST-VAL')
+    with pyhecdss.DSSIndex(index_name) as index:
+        assert index.update(index_files) == [os.path.abspath(index_files[1])]
+        assert index.find_files('/NEW/REC////') == [os.path.abspath(index_files[1])]
+
+
+def test_get_matching_ts_with_index(index_files, index_name):
+    with pyhecdss.DSSIndex(index_name) as index:
+        matching = list(pyhecdss.get_matching_ts(index_files[0], '//SIN/////', index=index))
+        assert len(matching) == 1
+        assert len(matching[0].data) > 10
+        with pytest.raises(Exception):
+            list(pyhecdss.get_matching_ts(index_files[0], '//NOSUCH/////', index=index))
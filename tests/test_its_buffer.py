@@ -0,0 +1,67 @@
+'''
+Tests irregular time series reads sized from the record and resumed when the buffer fills up
+'''
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss import pyheclib
+
+PATHNAME = '/BUFFER/ITS/STAGE//IR-MONTH/TEST/'
+
+
+@pytest.fixture
+def fname(tmp_dss):
+    fname = tmp_dss('test_its_buffer.dss')
+    times = pd.to_datetime('1990-01-01') + pd.to_timedelta(
+        np.cumsum(np.random.default_rng(1).integers(1, 600, 5000)), unit='min')
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_its(PATHNAME, pd.DataFrame(np.arange(5000.0), index=times), 'FEET', 'INST-VAL')
+    return fname
+
+
+def test_number_of_values(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        pathnames = d.get_pathnames()
+        first_block = pathnames[0].replace('01JAN1990 - ', '').split('/')
+        first_block[4] = '01JAN1990'
+        assert pyheclib.hec_znvals(d.ifltab, '/'.join(first_block)) > 0
+        assert pyheclib.hec_znvals(d.ifltab, PATHNAME.replace('//', '/01JAN1900/')) == -1
+        df = d.read_its(pathnames[0]).data
+    assert len(df) == 5000
+    np.testing.assert_array_equal(df.iloc[:, 0].values, np.arange(5000.0))
+
+
+@pytest.mark.parametrize('guess', [1, 7, 100])
+def test_full_buffer_resumes(fname, guess):
+    with pyhecdss.DSSFile(fname) as d:
+        pathname = d.get_pathnames()[0]
+        df = d.read_its(pathname, guess_vals_per_block=guess).data
+        # grown from the guess, not sized for all values up front
+        assert len(d._its_itimes) < 5000 or guess == 100
+        expected = d.read_its(pathname).data
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_window_resumes(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        expected = d.read_its(PATHNAME, '15FEB1990', '10MAY1990').data
+        df = d.read_its(PATHNAME, '15FEB1990', '10MAY1990', guess_vals_per_block=2).data
+    pd.testing.assert_frame_equal(df, expected)
+    assert len(expected) > 100
+    assert expected.index[0] >= pd.Timestamp('15FEB1990') and expected.index[-1] <= pd.Timestamp('10MAY1990')
+
+
+def test_buffer_size_capped(fname, monkeypatch):
+    monkeypatch.setattr(pyhecdss.pyhecdss, '_ITS_BUFFER_LENGTH', 1000)
+    with pyhecdss.DSSFile(fname) as d:
+        pathname = d.get_pathnames()[0]
+        df = d.read_its(pathname).data
+        # sized for all 5000 values, so not kept
+        assert d._its_itimes is None
+        # grown while resuming, but not past the cap
+        resumed = d.read_its(pathname, guess_vals_per_block=7).data
+        assert 0 < len(d._its_itimes) <= 1000
+    pd.testing.assert_frame_equal(resumed, df)
+    assert len(df) == 5000
+    np.testing.assert_array_equal(df.iloc[:, 0].values, np.arange(5000.0))
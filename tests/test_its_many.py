@@ -0,0 +1,80 @@
+'''
+Tests reading and writing many irregular time series at once
+'''
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+
+TIMES = pd.to_datetime(['1989-12-31 23:00', '1990-01-01 00:00', '1990-01-01 00:01',
+                        '1990-02-15 12:00', '1990-07-04 06:30'])
+PATHNAMES = ['/MANY/ITS%d/STAGE//IR-YEAR/TEST/' % i for i in range(4)]
+
+
+@pytest.fixture
+def fname(tmp_dss):
+    return tmp_dss('test_its_many.dss')
+
+
+def _data():
+    return {p: pd.DataFrame(np.arange(5.0) + 10 * i, index=TIMES) for i, p in enumerate(PATHNAMES)}
+
+
+def test_write_many_matches_write_its(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_its_many(_data(), 'FEET', 'INST-VAL')
+        for p, df in _data().items():
+            read = d.read_its(p.replace('//', '/01JAN1989 - 01JAN1991/', 1)).data
+            np.testing.assert_array_equal(read.index.values, df.index.values)
+            np.testing.assert_array_equal(read.iloc[:, 0].values, df.iloc[:, 0].values)
+
+
+def test_read_many_long_format_round_trip(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_its_many(_data(), 'FEET', 'INST-VAL')
+        long = d.read_its_many(PATHNAMES, '01JAN1989', '01JAN1991')
+        assert list(long.columns) == ['pathname', 'time', 'value', 'units', 'period_type']
+        assert len(long) == len(PATHNAMES) * len(TIMES)
+        assert set(long['units']) == {'FEET'}
+        for i, p in enumerate(PATHNAMES):
+            rows = long[long['pathname'] == p]
+            np.testing.assert_array_equal(rows['time'].values, TIMES.values)
+            np.testing.assert_array_equal(rows['value'].values, np.arange(5.0) + 10 * i)
+        # the long format can be written back as is
+        d.write_its_many(long.assign(value=long['value'] * 2), 'FEET', 'INST-VAL')
+        doubled = d.read_its_many(PATHNAMES, '01JAN1989', '01JAN1991', as_dict=True)
+    for i, p in enumerate(PATHNAMES):
+        times, values = doubled[p]
+        np.testing.assert_array_equal(times, TIMES.values)
+        np.testing.assert_array_equal(values, 2 * (np.arange(5.0) + 10 * i))
+
+
+def test_read_many_matches_read_its(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_its_many(_data(), 'FEET', 'INST-VAL')
+        pathnames = d.get_pathnames()
+        many = d.read_its_many(pathnames, as_dict=True)
+        for p in pathnames:
+            df = d.read_its(p).data
+            times, values = many[p]
+            np.testing.assert_array_equal(times, df.index.values)
+            np.testing.assert_array_equal(values, df.iloc[:, 0].values)
+
+
+def test_scratch_buffers_are_reused(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_its_many(_data(), 'FEET', 'INST-VAL')
+        first = d.read_its_many(PATHNAMES[:1], '01JAN1989', '01JAN1991', as_dict=True)
+        buffer = d._its_itimes
+        second = d.read_its_many(PATHNAMES, '01JAN1989', '01JAN1991', as_dict=True)
+        assert d._its_itimes is buffer
+        # values returned earlier are not overwritten by later reads
+        np.testing.assert_array_equal(first[PATHNAMES[0]][1], second[PATHNAMES[0]][1])
+        np.testing.assert_array_equal(first[PATHNAMES[0]][1], np.arange(5.0))
+
+
+def test_read_many_empty(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        long = d.read_its_many([], '01JAN1989', '01JAN1991')
+        assert len(long) == 0
+        assert list(long.columns) == ['pathname', 'time', 'value', 'units', 'period_type']
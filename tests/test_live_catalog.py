@@ -0,0 +1,108 @@
+'''
+Tests the in memory catalog patched by writes
+'''
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+
+RTS = [('5MIN', '5min', '31JAN1990 2300'), ('10MIN', '10min', '31JAN1990 2300'),
+       ('15MIN', '15min', '31JAN1990 2300'), ('1HOUR', '1h', '31JAN1990 2000'),
+       ('1DAY', '1D', '30DEC1990'), ('1WEEK', 'W', '20DEC1989'), ('1MON', 'MS', '01NOV1989'),
+       ('1YEAR', 'YS', '01JAN1998')]
+ITS = ['IR-DAY', 'IR-MONTH', 'IR-YEAR', 'IR-DECADE', 'IR-CENTURY']
+
+
+def _key_and_range(dfcat):
+    df = dfcat[list('ABCFED')].astype(str)
+    return df.sort_values(list('ABCFE')).reset_index(drop=True)
+
+
+def _write_all(d):
+    for epart, freq, start in RTS:
+        df = pd.DataFrame(np.arange(8.0), index=pd.date_range(start, periods=8, freq=freq))
+        d.write_rts('/LIVE/%s/FLOW//%s/TEST/' % (epart, epart), df, 'CFS', 'INST-VAL')
+    times = pd.to_datetime(['1989-12-31 23:00', '1990-01-01 00:00', '1990-01-01 00:01',
+                            '1990-02-15 12:00', '2000-01-01 00:00'])
+    for epart in ITS:
+        df = pd.DataFrame(np.arange(5.0), index=times)
+        d.write_its('/LIVE/%s/STAGE//%s/TEST/' % (epart, epart), df, 'FEET', 'INST-VAL', interval=epart)
+
+
+@pytest.fixture
+def fname(tmp_dss):
+    return tmp_dss('test_live_catalog.dss')
+
+
+def test_patched_catalog_matches_catalog(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        dfcat = d.read_catalog()
+        assert len(dfcat) == 0
+        _write_all(d)
+        live = d.read_catalog()
+        assert d._catalog_dirty
+        d.catalog()
+        d._catalog = None
+        fresh = d.read_catalog()
+    pd.testing.assert_frame_equal(_key_and_range(live), _key_and_range(fresh))
+    assert len(live) == len(RTS) + len(ITS)
+
+
+def test_write_extends_time_window(fname):
+    pathname = '/LIVE/EXTEND/FLOW//1DAY/TEST/'
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        df = pd.DataFrame(np.arange(10.0), index=pd.date_range('02JAN1990', periods=10, freq='D'))
+        d.write_rts(pathname, df, 'CFS', 'INST-VAL')
+        dfcat = d.read_catalog()
+        assert list(dfcat['D']) == ['01JAN1990 - 01JAN1990']
+        d.write_rts(pathname, df.shift(800, freq='D'), 'CFS', 'INST-VAL')
+        dfcat2 = d.read_catalog()
+        assert list(dfcat2['D']) == ['01JAN1990 - 01JAN1992']
+        assert dfcat2['D_END'].iloc[0] == pd.Timestamp('01JAN1992')
+        # previously returned catalog is unchanged
+        assert list(dfcat['D']) == ['01JAN1990 - 01JAN1990']
+        assert len(d.read_rts(d.get_pathnames(dfcat2)[0]).data) == 810
+
+
+def test_catalog_files_written_on_close(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.read_catalog()
+        _write_all(d)
+    # catalog files are current so they are read as is
+    d = pyhecdss.DSSFile(fname)
+    try:
+        mtime = os.stat(fname[:-4] + '.dsc').st_mtime_ns
+        dfcat = d.read_catalog()
+        assert os.stat(fname[:-4] + '.dsc').st_mtime_ns == mtime
+        assert len(dfcat) == len(RTS) + len(ITS)
+    finally:
+        d.close()
+
+
+def test_external_change_drops_live_catalog(fname):
+    d = pyhecdss.DSSFile(fname, create_new=True)
+    d.read_catalog()
+    d.close()
+    with pyhecdss.DSSFile(fname) as d2:
+        df = pd.DataFrame(np.arange(10.0), index=pd.date_range('01JAN1990', periods=10, freq='D'))
+        d2.write_rts('/LIVE/OTHER/FLOW//1DAY/TEST/', df, 'CFS', 'INST-VAL')
+    d.open()
+    try:
+        assert list(d.read_catalog()['B']) == ['OTHER']
+    finally:
+        d.close()
+
+
+def test_changes_to_returned_catalog_are_not_kept(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        _write_all(d)
+        dfcat = d.read_catalog()
+        n = len(dfcat)
+        dfcat.drop(dfcat.index[0], inplace=True)
+        dfcat['A'] = 'CHANGED'
+        again = d.read_catalog()
+        assert again is not dfcat
+        assert len(again) == n
+        assert set(again['A']) == {'LIVE'}
+        assert d.exists(d.get_pathnames(again)).all()
@@ -0,0 +1,90 @@
+'''
+Tests pickling of DSSFile handles and use across processes
+'''
+import multiprocessing
+import os
+import pickle
+import pandas as pd
+import pytest
+import pyhecdss
+
+PATHNAME = '/SAMPLE/SIN/WAVE/01JAN1990/15MIN/SAMPLE1/'
+
+
+def _read_length(dssh):
+    return len(dssh.read_rts(PATHNAME).data)
+
+
+_inherited = None
+
+
+def _read_inherited_length():
+    return _read_length(_inherited)
+
+
+def test_pickle_open_handle():
+    with pyhecdss.DSSFile('test1.dss') as d:
+        n = _read_length(d)
+        d2 = pickle.loads(pickle.dumps(d))
+        assert d2.fname == 'test1.dss'
+        assert d2.isopen
+        assert _read_length(d2) == n
+        d2.close()
+        assert not d2.isopen
+
+
+def test_pickle_closed_handle():
+    d = pyhecdss.DSSFile('test1.dss')
+    d.close()
+    d2 = pickle.loads(pickle.dumps(d))
+    assert not d2.isopen
+    assert _read_length(d2) > 10
+    assert not d2.isopen
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_handle_in_forked_pool():
+    global _inherited
+    ctx = multiprocessing.get_context('fork')
+    with pyhecdss.DSSFile('test1.dss') as d:
+        n = _read_length(d)
+        _inherited = d
+        with ctx.Pool(2) as pool:
+            # passed by pickling
+            assert pool.map(_read_length, [d] * 4) == [n] * 4
+            # inherited through fork
+            assert pool.apply(_read_inherited_length) == n
+        _inherited = None
+        # parent handle is unaffected by use in the children
+        assert _read_length(d) == n
+
+
+def _read_and_close_inherited():
+    n = len(_inherited.read_its('/SAMPLE/ITS/STAGE//IR-YEAR/DIRTY/', '01JAN1990', '01JAN1991').data)
+    _inherited.close()
+    return n
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_forked_child_does_not_write_parent_catalog(tmp_path):
+    global _inherited
+    fname = str(tmp_path / 'dirty.dss')
+    ctx = multiprocessing.get_context('fork')
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.read_catalog()
+        d.write_its('/SAMPLE/ITS/STAGE//IR-YEAR/DIRTY/',
+                    pd.DataFrame([1.0, 2.0], index=pd.to_datetime(['1990-02-01', '1990-03-01'])),
+                    'FEET', 'INST-VAL')
+        assert d._catalog_dirty
+        with open(str(tmp_path / 'dirty.dsc')) as fh:
+            before = fh.read()
+        _inherited = d
+        with ctx.Pool(1) as pool:
+            assert pool.apply(_read_and_close_inherited) == 2
+        _inherited = None
+        # the catalog files are only written by the parent on close
+        with open(str(tmp_path / 'dirty.dsc')) as fh:
+            assert fh.read() == before
+        assert d._catalog_dirty
+    with open(str(tmp_path / 'dirty.dsc')) as fh:
+        assert 'DIRTY' in fh.read()
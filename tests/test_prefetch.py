@@ -0,0 +1,58 @@
+'''
+Tests reading ahead in a child process
+'''
+import multiprocessing
+import os
+import subprocess
+import sys
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss.pyhecdss import _prefetched
+
+
+def _assert_same(results, expected):
+    assert len(results) == len(expected)
+    for r, e in zip(results, expected):
+        pd.testing.assert_frame_equal(r.data, e.data)
+        assert (r.units, r.period_type) == (e.units, e.period_type)
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_get_matching_ts_prefetch(prefetch):
+    expected = list(pyhecdss.get_matching_ts('test1.dss', '/SAMPLE/////'))
+    results = list(pyhecdss.get_matching_ts('test1.dss', '/SAMPLE/////', prefetch=prefetch))
+    _assert_same(results, expected)
+    assert multiprocessing.active_children() == []
+
+
+def test_get_ts_prefetch():
+    paths = ['//SIN/////', '/SAMPLE/ITS1//////', '//COS/////']
+    expected = list(pyhecdss.get_ts('test1.dss', *paths))
+    _assert_same(list(pyhecdss.get_ts('test1.dss', *paths, prefetch=2)), expected)
+
+
+def test_prefetch_closed_early():
+    results = pyhecdss.get_matching_ts('test1.dss', '/SAMPLE/////', prefetch=1)
+    assert len(next(results).data) > 0
+    results.close()
+    assert multiprocessing.active_children() == []
+
+
+def test_prefetch_error():
+    with pytest.raises(Exception, match='No start date'):
+        list(_prefetched('test1.dss', [('/A/B/C//1DAY/F/', None, None)], 1))
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_prefetch_in_unguarded_script(tmp_path):
+    # no if __name__ == '__main__': guard, which a spawned child would trip over
+    script = tmp_path / 'unguarded.py'
+    script.write_text("import pyhecdss\n"
+                      "results = list(pyhecdss.get_matching_ts(%r, '/SAMPLE/////', prefetch=2))\n"
+                      "print(len(results))\n" % os.path.abspath('test1.dss'))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, env=env,
+                         cwd=str(tmp_path), timeout=120)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.split()[-1] == str(len(list(pyhecdss.get_matching_ts('test1.dss', '/SAMPLE/////'))))
@@ -0,0 +1,109 @@
+'''
+Tests decimated preview reads
+'''
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss import pyhecdss as module
+
+PATHNAME = '/SAMPLE/PREVIEW/FLOW//15MIN/TEST/'
+WINDOW = ('01JAN1990 0000', '01JAN1991 0000')
+
+
+@pytest.fixture(params=['INST-VAL', 'PER-AVER'])
+def fname(request, tmp_dss):
+    fname = tmp_dss('test_preview.dss')
+    index = pd.date_range('01JAN1990 0015', '01JAN1991 0000', freq='15min')
+    values = np.sin(np.arange(len(index)) / 500.0) + np.random.default_rng(1).normal(0, 0.1, len(index))
+    values[1000:3000] = np.nan
+    df = pd.DataFrame(values, index=index)
+    if request.param == 'PER-AVER':
+        df.index = df.index.to_period()
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_rts(PATHNAME, df, 'CFS', request.param)
+    return fname
+
+
+@pytest.mark.parametrize('method', ['minmax', 'lttb'])
+def test_preview_selects_values(fname, method):
+    with pyhecdss.DSSFile(fname) as d:
+        full = d.read_rts(PATHNAME, *WINDOW)
+        preview = d.read_preview(PATHNAME, 500, method, *WINDOW)
+    df = preview.data
+    assert 400 < len(df) <= 500
+    assert (preview.units, preview.period_type) == (full.units, full.period_type)
+    assert type(df.index) is type(full.data.index)
+    assert df.index.is_monotonic_increasing
+    np.testing.assert_array_equal(full.data.loc[df.index].values, df.values)
+    valid = full.data.dropna()
+    if method == 'minmax':
+        assert df.values.max() == valid.values.max()
+        assert df.values.min() == valid.values.min()
+    else:
+        assert df.index[0] == valid.index[0]
+        assert df.index[-1] == valid.index[-1]
+
+
+def test_minmax_matches_bucket_extremes(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        full = d.read_rts(PATHNAME, *WINDOW).data.iloc[:, 0]
+        preview = d.read_preview(PATHNAME, 200, 'minmax', *WINDOW).data.iloc[:, 0]
+    # buckets of the same length over the time window
+    start, end = pd.Timestamp(WINDOW[0]), pd.Timestamp(WINDOW[1])
+    grid = full.index.to_timestamp() + full.index.freq if isinstance(full.index, pd.PeriodIndex) else full.index
+    buckets = np.clip(((grid - start) / (end - start) * 100).astype(int), 0, 99)
+    grouped = full.groupby(buckets)
+    np.testing.assert_array_equal(np.sort(preview.values),
+                                  np.sort(np.unique(np.concatenate([grouped.min().dropna().values,
+                                                                    grouped.max().dropna().values]))))
+
+
+def test_preview_reads_one_block_at_a_time(fname, monkeypatch):
+    lengths = []
+    zrrtsxd = module.pyheclib.hec_zrrtsxd
+
+    def counting_zrrtsxd(ifltab, cpath, cdate, ctime, values):
+        lengths.append(len(values))
+        return zrrtsxd(ifltab, cpath, cdate, ctime, values)
+
+    monkeypatch.setattr(module.pyheclib, 'hec_zrrtsxd', counting_zrrtsxd)
+    with pyhecdss.DSSFile(fname) as d:
+        d.read_preview(PATHNAME, 100, 'lttb', *WINDOW)
+    assert len(lengths) == 13
+    assert max(lengths) <= 31 * 96 + 1
+
+
+def test_read_previews(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        previews = list(d.read_previews([PATHNAME, PATHNAME], 100, 'minmax', *WINDOW))
+        assert len(previews) == 2
+        pd.testing.assert_frame_equal(previews[0].data, d.read_preview(PATHNAME, 100, 'minmax', *WINDOW).data)
+
+
+def test_preview_its():
+    with pyhecdss.DSSFile('test1.dss') as d:
+        pathname = d.get_pathnames(pyhecdss.match_catalog(d.read_catalog(), '//ITS1/RANDOM////'))[0]
+        full = d.read_its(pathname).data
+        preview = d.read_preview(pathname, 1000).data
+    pd.testing.assert_frame_equal(preview, full, check_index_type=False, check_freq=False)
+
+
+def test_preview_method():
+    with pyhecdss.DSSFile('test1.dss') as d:
+        with pytest.raises(ValueError):
+            d.read_preview('/SAMPLE/SIN/WAVE/01JAN1990/15MIN/SAMPLE1/', method='mean')
+
+
+@pytest.mark.parametrize('method', ['minmax', 'lttb'])
+def test_buckets_across_blocks(method):
+    times = np.datetime64('2000-01-01', 'ns') + np.arange(5000) * np.timedelta64(15, 'm')
+    values = np.random.default_rng(2).normal(size=len(times)).round(1)
+    values[::7] = np.nan
+    points = module._PREVIEW_METHODS[method]
+    whole = points(module._preview_buckets([(times, times, values)], times[0], times[-1], 5))
+    # each bucket spans many blocks
+    blocks = [(t, t, v) for t, v in zip(np.array_split(times, 400), np.array_split(values, 400))]
+    split = points(module._preview_buckets(blocks, times[0], times[-1], 5))
+    np.testing.assert_array_equal(split[0], whole[0])
+    np.testing.assert_array_equal(split[1], whole[1])
@@ -72,6 +72,31 @@ class TestPyDsUtilsBasic(unittest.TestCase):
         vseries = values.iloc[:, 0]
         self.assertTrue(abs(vseries.at['01JAN1990 0430']-(-0.42578)) < 1e-03)
 
+    def test_read_rts_missing_and_trim(self):
+        fname = "test_rts1.dss"
+        pathname = '/TEST1/GAPS/VANILLA//1DAY/MISSING/'
+        dtr = pd.date_range('01JAN1990', periods=10, freq='1D')
+        values = np.arange(10.0)
+        values[[0, 4, 9]] = DSSFile.MISSING_VALUE
+        values[5] = DSSFile.MISSING_RECORD
+        with pyhecdss.DSSFile(fname, create_new=True) as dssfile:
+            dssfile.write_rts(pathname, pd.DataFrame(values, index=dtr), 'CCC', 'INST-VAL')
+            twpath = '/TEST1/GAPS/VANILLA/01JAN1990/1DAY/MISSING/'
+            # trimmed to first and last value that is not missing
+            df = dssfile.read_rts(twpath).data
+            self.assertEqual(list(df.index), list(dtr[1:9]))
+            self.assertTrue(np.isnan(df.iloc[3, 0]) and np.isnan(df.iloc[4, 0]))
+            self.assertEqual(df.iloc[0, 0], 1.0)
+            # raw values with sentinels
+            df = dssfile.read_rts(twpath, keep_sentinels=True).data
+            self.assertEqual(list(df.index), list(dtr[1:9]))
+            self.assertEqual(df.iloc[3, 0], DSSFile.MISSING_VALUE)
+            self.assertEqual(df.iloc[4, 0], DSSFile.MISSING_RECORD)
+            # not trimmed with explicit time window
+            df = dssfile.read_rts(twpath, '01JAN1990', '10JAN1990').data
+            self.assertTrue(np.isnan(df.iloc[0, 0]))
+            self.assertEqual(len(df), 10)
+
     def test_write_ts(self):
         fname = "test_rts1.dss"
         pathname = '/TEST1/ONLY1/VANILLA//1DAY/JUST-ONES/'
@@ -10,3 +10,53 @@ def test_number_between():
     assert pyhecdss.DSSFile._number_between('01JAN2000', '01FEB2000', delta=timedelta(days=1)) > 31
     assert pyhecdss.DSSFile._number_between('01JAN2000', '01FEB2000', delta=timedelta(days=28)) > 1
     assert pyhecdss.DSSFile._number_between('01JAN2000', '01FEB2000', delta=timedelta(days=365)) > 0
+
+
+def test_time_index_shared():
+    from pyhecdss.pyhecdss import _time_index
+    from datetime import datetime
+    i1 = _time_index(datetime(2000, 1, 1), '1DAY', 0, 10, False)
+    assert _time_index(datetime(2000, 1, 1), '1DAY', 0, 10, False) is i1
+    assert i1.equals(pd.date_range('01JAN2000', periods=10, freq='D'))
+    p1 = _time_index(datetime(2000, 1, 2), '1DAY', 0, 10, True)
+    assert p1.equals(pd.period_range('01JAN2000', periods=10, freq='D'))
+    # offset of 12 hours from the end of each day
+    assert _time_index(datetime(2000, 1, 2), '1DAY', 720, 2, False)[0] == pd.Timestamp('01JAN2000 1200')
+
+
+
+def test_time_index_cache_bounded_by_length(monkeypatch):
+    import collections
+    from datetime import datetime
+    from pyhecdss import pyhecdss as p
+    monkeypatch.setattr(p, '_TIME_INDEXES', collections.OrderedDict())
+    monkeypatch.setattr(p, '_TIME_INDEXES_LENGTH', 0)
+    monkeypatch.setattr(p, '_TIME_INDEX_CACHE_LENGTH', 100)
+    for day in range(1, 11):
+        p._time_index(datetime(2000, 1, day), '1HOUR', 0, 40, False)
+        assert p._TIME_INDEXES_LENGTH == sum(len(i) for i in p._TIME_INDEXES.values()) <= 100
+    assert [k[0].day for k in p._TIME_INDEXES] == [9, 10]
+    # the least recently used is dropped first
+    day9 = p._time_index(datetime(2000, 1, 9), '1HOUR', 0, 40, False)
+    p._time_index(datetime(2000, 1, 11), '1HOUR', 0, 40, False)
+    assert [k[0].day for k in p._TIME_INDEXES] == [9, 11]
+    assert p._time_index(datetime(2000, 1, 9), '1HOUR', 0, 40, False) is day9
+    # longer than the whole cache, so not kept
+    long = p._time_index(datetime(2000, 1, 1), '1HOUR', 0, 150, False)
+    assert len(long) == 150 and p._time_index(datetime(2000, 1, 1), '1HOUR', 0, 150, False) is not long
+    assert p._TIME_INDEXES_LENGTH <= 100
+
+
+def test_read_rts_shares_index():
+    pathname = '/SAMPLE/SIN/WAVE/01JAN1990 - 01JAN1990/15MIN/SAMPLE1/'
+    with pyhecdss.DSSFile('test1.dss') as d:
+        df1 = d.read_rts(pathname, '01JAN1990', '01FEB1990').data
+        df2 = d.read_rts(pathname, '01JAN1990', '01FEB1990').data
+    assert df1.index.equals(df2.index)
+    # the values are shared but not the index objects
+    assert np.shares_memory(df1.index.values, df2.index.values)
+    assert df1.index is not df2.index
+    df1.index.name = 'mytime'
+    assert df2.index.name is None
+    with pyhecdss.DSSFile('test1.dss') as d:
+        assert d.read_rts(pathname, '01JAN1990', '01FEB1990').data.index.name is None
@@ -0,0 +1,82 @@
+'''
+Tests unsorted catalogs and selective catalogs with heclib catalog instructions
+'''
+import glob
+import os
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss.pyhecdss import _catalog_instructions
+
+
+@pytest.fixture
+def fname(tmp_dss, monkeypatch):
+    # in the temporary directory so the catalog files can be checked by name
+    monkeypatch.chdir(os.path.dirname(tmp_dss('selective.dss', copy_of='test1.dss')))
+    return 'selective.dss'
+
+
+def _parts(dfcat):
+    return dfcat[list('ABCFED')].astype(str).reset_index(drop=True)
+
+
+def test_catalog_instructions():
+    assert _catalog_instructions('/*/RSAC.*/EC////') == 'B=RSAC@, C=EC@'
+    assert _catalog_instructions('///////') == ''
+    assert _catalog_instructions('/SAMPLE/SIN|COS/WAVE//15MIN//') == 'A=SAMPLE@, C=WAVE@, E=15MIN@'
+    assert _catalog_instructions('/////IR-YEAR/SAMPLE[0-9]/') == 'E=IR-YEAR@'
+
+
+@pytest.mark.parametrize('pattern', ['//SIN/////', '/SAMPLE//RANDOM////', '/////IR-YEAR//',
+                                     '//S.*/////', '//ITS1|SIN/////', '//NONE/////'])
+def test_selective_catalog_matches_full_catalog(fname, pattern):
+    with pyhecdss.DSSFile(fname) as d:
+        selected = d.read_catalog(pattern)
+        # selective catalogs are not kept
+        assert not os.path.exists('selective.dsc') or _catalog_instructions(pattern) == ''
+        assert sorted(glob.glob('selective.*')) in (['selective.dss'],
+                                                    ['selective.dsc', 'selective.dsd', 'selective.dss'])
+        full = pyhecdss.match_catalog(d.read_catalog(), pattern)
+        pd.testing.assert_frame_equal(_parts(selected), _parts(full))
+        # now from the current catalog
+        pd.testing.assert_frame_equal(_parts(d.read_catalog(pattern)), _parts(full))
+
+
+def test_unsorted_catalog(fname):
+    with pyhecdss.DSSFile(fname) as d:
+        unsorted = d.read_catalog(sort=False)
+        assert not os.path.exists('selective.dsd')
+        d.catalog()
+        d._catalog = None
+        sorted_catalog = d.read_catalog()
+    pd.testing.assert_frame_equal(_parts(unsorted), _parts(sorted_catalog))
+    assert len(unsorted) > 0
+
+
+def test_get_matching_ts_with_selection(fname):
+    results = list(pyhecdss.get_matching_ts(fname, '/SAMPLE/SIN/WAVE////'))
+    assert len(results) == 1
+    assert len(results[0].data) > 0
+
+
+def test_selective_catalog_kept_until_file_changes(fname, monkeypatch):
+    calls = []
+    write_catalog = pyhecdss.DSSFile._write_catalog
+
+    def counting(self, *args, **kwargs):
+        calls.append(kwargs.get('cinstr'))
+        return write_catalog(self, *args, **kwargs)
+
+    monkeypatch.setattr(pyhecdss.DSSFile, '_write_catalog', counting)
+    with pyhecdss.DSSFile(fname) as d:
+        first = d.read_catalog('//SIN/////')
+        assert _parts(d.read_catalog('//SIN/////')).equals(_parts(first))
+        # the C part is a regular expression so heclib selects the same records
+        assert len(d.read_catalog('//SIN/WAV[E]////')) == len(first)
+        assert calls == ['B=SIN@']
+        d.read_catalog('//COS/////')
+        assert calls == ['B=SIN@', 'B=COS@']
+        df = pd.DataFrame([1.0, 2.0], index=pd.date_range('01JAN1990', periods=2, freq='D'))
+        d.write_rts('/SAMPLE/SIN/WAVE2//1DAY/NEW/', df, 'CFS', 'INST-VAL')
+        assert len(d.read_catalog('//SIN/////')) == len(first) + 1
+        assert calls == ['B=SIN@', 'B=COS@', 'B=SIN@']
@@ -0,0 +1,67 @@
+'''
+Tests writing irregular time series from numpy arrays
+'''
+import numpy as np
+import pandas as pd
+import pytest
+import pyhecdss
+from pyhecdss.pyhecdss import _datetime64_to_julian_minutes, _julian_day
+
+PATHNAME = '/ARRAYS/ITS/STAGE//IR-MONTH/TEST/'
+
+
+@pytest.fixture
+def fname(tmp_dss):
+    return tmp_dss('test_write_its_arrays.dss')
+
+
+def _times(n=1000):
+    steps = np.random.default_rng(2).integers(1, 300, n)
+    return np.datetime64('1990-01-01T00:00') + np.cumsum(steps).astype('timedelta64[m]')
+
+
+def test_arrays_match_write_its(fname):
+    times = _times()
+    values = np.sin(np.arange(len(times)))
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_its_arrays(PATHNAME, times, values, 'FEET', 'INST-VAL')
+        d.write_its(PATHNAME.replace('ITS', 'DF'), pd.Series(values, index=pd.DatetimeIndex(times)),
+                    'FEET', 'INST-VAL')
+        catalog = d.read_catalog()
+        assert list(catalog['D'].astype(str)) == ['01JAN1990 - 01APR1990'] * 2
+        fromarrays, fromdf = [d.read_its(p) for p in d.get_pathnames()]
+    np.testing.assert_array_equal(fromarrays.data.index.values, times.astype('datetime64[ns]'))
+    np.testing.assert_array_equal(fromarrays.data.iloc[:, 0].values, values)
+    np.testing.assert_array_equal(fromdf.data.values, fromarrays.data.values)
+    assert fromarrays.units == 'FEET'
+
+
+@pytest.mark.parametrize('unit', ['m', 's', 'ns'])
+def test_minutes_for_any_resolution(unit):
+    times = _times(10).astype('datetime64[%s]' % unit)
+    juls = _julian_day(pd.Timestamp('1990-01-01'))
+    minutes = _datetime64_to_julian_minutes(times, juls)
+    assert minutes.dtype == np.int32
+    expected = (times - np.datetime64('1990-01-01')) // np.timedelta64(1, 'm')
+    np.testing.assert_array_equal(minutes, expected)
+
+
+def test_minutes_overflow():
+    juls = _julian_day(pd.Timestamp('1990-01-01'))
+    # 7000 years of minutes do not fit in an int32
+    with pytest.raises(ValueError, match='too far'):
+        _datetime64_to_julian_minutes(np.array(['1990-01-01', '9000-01-01'], 'datetime64[m]'), juls)
+    with pytest.raises(ValueError, match='NaT'):
+        _datetime64_to_julian_minutes(np.array(['1990-01-01', 'NaT'], 'datetime64[m]'), juls)
+    assert len(_datetime64_to_julian_minutes(np.array([], 'datetime64[m]'), juls)) == 0
+
+
+def test_arrays_validated(fname):
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        with pytest.raises(ValueError):
+            d.write_its_arrays(PATHNAME, _times(10), np.zeros(9), 'FEET', 'INST-VAL')
+        with pytest.raises(ValueError):
+            d.write_its_arrays(PATHNAME.replace('//', '/01JAN1990 - 01JAN1991/'),
+                               np.array(['1990-01-01', '9000-01-01'], 'datetime64[m]'), np.zeros(2),
+                               'FEET', 'INST-VAL')
+        assert len(d.read_catalog()) == 0
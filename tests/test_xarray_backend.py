@@ -0,0 +1,39 @@
+'''
+Tests xarray backend with lazily loaded records
+'''
+import pytest
+import numpy as np
+import pyhecdss
+xr = pytest.importorskip('xarray')
+from pyhecdss.xarray_backend import PyHECDSSBackendEntrypoint
+
+
+def test_open_dataset():
+    with xr.open_dataset('test1.dss', engine=PyHECDSSBackendEntrypoint) as ds:
+        assert '/SAMPLE/SIN/WAVE//15MIN/SAMPLE1/' in ds.data_vars
+        assert '/SAMPLE/ITS1/RANDOM//IR-YEAR/SAMPLE2/' not in ds.data_vars
+        v = ds['/SAMPLE/SIN/WAVE//15MIN/SAMPLE1/']
+        assert v.attrs['C'] == 'WAVE'
+        vs = v.sel(time_15MIN=slice('01JAN1990 0230', '01JAN1990 0330'))
+        assert len(vs) == 5
+    with pyhecdss.DSSFile('test1.dss') as d:
+        df, units, ptype = d.read_rts('/SAMPLE/SIN/WAVE/01JAN1990/15MIN/SAMPLE1/')
+    np.testing.assert_allclose(vs.values, df.loc['01JAN1990 0230':'01JAN1990 0330'].iloc[:, 0].values)
+
+
+def test_period_record_matches_read_rts(tmp_path):
+    import pandas as pd
+    fname = str(tmp_path / 'per.dss')
+    df = pd.DataFrame({'v': np.arange(40.)}, index=pd.period_range('2000-01-01', periods=40, freq='D'))
+    with pyhecdss.DSSFile(fname, create_new=True) as d:
+        d.write_rts('/A/B/C//1DAY/F/', df, 'U', 'PER-AVER')
+    with pyhecdss.DSSFile(fname) as d:
+        expected = d.read_rts('/A/B/C/01JAN2000/1DAY/F/').data.iloc[:, 0]
+    with xr.open_dataset(fname, engine=PyHECDSSBackendEntrypoint) as ds:
+        v = ds['/A/B/C//1DAY/F/']
+        actual = v.to_series().dropna()
+        window = v.sel(time_1DAY=slice('2000-01-05', '2000-01-07')).to_series()
+    assert actual.index.equals(expected.index)
+    np.testing.assert_array_equal(actual.values, expected.values)
+    assert window.index.equals(expected.index[4:7])
+    np.testing.assert_array_equal(window.values, [4., 5., 6.])